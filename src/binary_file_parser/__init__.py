@@ -4,4 +4,7 @@ __version_info__ = (0, 2, 2)
 
 from .errors import *
 from .retrievers import *
-from .types import BaseStruct, ByteStream, DebugByteStream, Manager, Parseable, Version
+from .types import (
+    BaseStruct, ByteStream, ChunkedByteStream, Codec, CowHandle, DebugByteStream, FileCache, FileResult, Layout,
+    LayoutEntry, Manager, MemoryByteStream, Parseable, Projection, StructCache, Version, get_codec, register_codec
+)
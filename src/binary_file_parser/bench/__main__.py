@@ -0,0 +1,71 @@
+"""
+Benchmark suite of synthetic file formats. Measures the parse and write throughput (in MB/s and struct objects/s) and
+the peak memory used while parsing. Usage::
+
+    python -m binary_file_parser.bench --json results.json
+    python -m binary_file_parser.bench --baseline results.json --tolerance 0.4
+
+See ``python -m binary_file_parser.bench.threads`` for the multi-threaded stress test
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from binary_file_parser.bench.schemas import SUITE
+from binary_file_parser.bench.suite import compare, run_suite
+
+
+def _print_row(name: str, results: dict) -> None:
+    print(
+        f"{name:<12} {results['bytes'] / 1e6:>8.2f} {results['objects']:>9} "
+        f"{results['parse_mb_s']:>9.2f} {results['parse_obj_s']:>11.0f} "
+        f"{results['write_mb_s']:>9.2f} {results['write_obj_s']:>11.0f} {results['parse_peak_mb']:>9.2f}",
+        flush = True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description = __doc__.split("Usage")[0].strip(), formatter_class = argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "names", nargs = "*", metavar = "name", help = f"the benchmarks to run, defaults to all of: {', '.join(SUITE)}",
+    )
+    parser.add_argument("--scale", type = int, default = 1, help = "multiplies the size of every synthetic file")
+    parser.add_argument("--repeat", type = int, default = 3, help = "the fastest of this many runs is kept")
+    parser.add_argument("--json", metavar = "PATH", help = "write the results to this file")
+    parser.add_argument("--baseline", metavar = "PATH", help = "fail if the results are worse than the ones in this file")
+    parser.add_argument(
+        "--tolerance", type = float, default = 0.25,
+        help = "the fraction by which a result may be worse than the baseline (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+    if unknown := [name for name in args.names if name not in SUITE]:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    print(
+        f"{'benchmark':<12} {'MB':>8} {'objects':>9} {'parse MB/s':>9} {'parse obj/s':>11} "
+        f"{'write MB/s':>9} {'write obj/s':>11} {'peak MB':>9}"
+    )
+    report = run_suite(args.names, args.scale, args.repeat, progress = _print_row)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent = 4)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if regressions := compare(report, baseline, args.tolerance):
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"    {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
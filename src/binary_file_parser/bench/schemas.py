@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import random
+from typing import Callable
+
+from binary_file_parser.retrievers import Retriever
+from binary_file_parser.types import (
+    Array8, Array16, Array32, BaseStruct, bool8, FixedLenArray, float32, float64, get_codec, int8, int32, Option8,
+    StackedArray16s, StackedAttrArray32, str8, str16, StrArray16, StrArray32, uint8, uint16, uint32, uint64,
+)
+
+
+class Point(BaseStruct):
+    x: float = Retriever(float32, default = 0.0)
+    y: float = Retriever(float32, default = 0.0)
+    z: float = Retriever(float32, default = 0.0)
+
+
+class Unit(BaseStruct):
+    id: int = Retriever(uint32, default = 0)
+    owner: int = Retriever(uint8, default = 0)
+    hp: int = Retriever(int32, default = 0)
+    pos: Point = Retriever(Point, default_factory = lambda _: Point())
+    name: str = Retriever(str16, default = "")
+    alive: bool = Retriever(bool8, default = True)
+
+
+class Player(BaseStruct):
+    name: str = Retriever(str16, default = "")
+    colour: list[int] = Retriever(FixedLenArray[uint8, 4], default_factory = lambda _: [0, 0, 0, 255])
+    resources: list[int] = Retriever(Array16[int32], default_factory = lambda _: [])
+    units: list[Unit] = Retriever(Array32[Unit], default_factory = lambda _: [])
+
+
+class Scenario(BaseStruct):
+    """A synthetic save file made of nested structs, arrays of every length encoding and strings"""
+    version: int = Retriever(uint16, default = 1)
+    title: str = Retriever(str16, default = "")
+    tags: list[str] = Retriever(StrArray16, default_factory = lambda _: [])
+    terrain: list[list[int]] = Retriever(StackedArray16s[uint8], default_factory = lambda _: [])
+    heights: list[list[int]] = Retriever(Array8[uint8], repeat = 64, default_factory = lambda _: [])
+    players: list[Player] = Retriever(Array16[Player], default_factory = lambda _: [])
+
+
+def make_scenario(seed: int, num_units: int = 100) -> Scenario:
+    """
+    :param seed: The seed of the random values, scenarios made from different seeds have differently sized arrays
+    :param num_units: The approximate number of units in the scenario
+
+    :return: A scenario filled with random values
+    """
+    rng = random.Random(seed)
+    num_players = rng.randint(1, 8)
+    return Scenario(
+        version = rng.randint(1, 10),
+        title = f"scenario {seed}" * rng.randint(1, 4),
+        tags = [f"tag{i}" * rng.randint(0, 3) for i in range(rng.randint(0, 10))],
+        terrain = [[rng.randrange(256) for _ in range(rng.randint(0, 64))] for _ in range(rng.randint(1, 32))],
+        heights = [[rng.randrange(256) for _ in range(rng.randint(0, 16))] for _ in range(64)],
+        players = [
+            Player(
+                name = f"player {i}",
+                colour = [rng.randrange(256) for _ in range(4)],
+                resources = [rng.randint(-1000, 1000) for _ in range(rng.randint(0, 8))],
+                units = [
+                    Unit(
+                        id = j, owner = i, hp = rng.randint(-5, 500),
+                        pos = Point(x = rng.random(), y = rng.random(), z = 0.0),
+                        name = f"unit {j}" * rng.randint(0, 2), alive = rng.random() < 0.9,
+                    )
+                    for j in range(rng.randint(num_units // (2 * num_players), num_units // num_players + 1))
+                ],
+            )
+            for i in range(num_players)
+        ],
+    )
+
+
+class Primitives(BaseStruct):
+    i8: int = Retriever(int8, default = 0)
+    u16: int = Retriever(uint16, default = 0)
+    i32: int = Retriever(int32, default = 0)
+    u64: int = Retriever(uint64, default = 0)
+    f32: float = Retriever(float32, default = 0.0)
+    f64: float = Retriever(float64, default = 0.0)
+    flag: bool = Retriever(bool8, default = False)
+
+
+class FlatFile(BaseStruct):
+    """Many records of fixed size primitives only"""
+    records: list[Primitives] = Retriever(Array32[Primitives], default_factory = lambda _: [])
+
+
+class Leaf(BaseStruct):
+    value: int = Retriever(uint32, default = 0)
+    name: str = Retriever(str8, default = "")
+
+
+class Node1(BaseStruct):
+    leaf: Leaf = Retriever(Leaf, default_factory = lambda _: Leaf())
+    weights: list[int] = Retriever(FixedLenArray[uint16, 4], default_factory = lambda _: [0, 0, 0, 0])
+
+
+class Node2(BaseStruct):
+    left: Node1 = Retriever(Node1, default_factory = lambda _: Node1())
+    right: Node1 = Retriever(Node1, default_factory = lambda _: Node1())
+
+
+class Node3(BaseStruct):
+    left: Node2 = Retriever(Node2, default_factory = lambda _: Node2())
+    right: Node2 = Retriever(Node2, default_factory = lambda _: Node2())
+
+
+class DeepFile(BaseStruct):
+    """Trees of nested structs"""
+    trees: list[Node3] = Retriever(Array32[Node3], default_factory = lambda _: [])
+
+
+class NumbersFile(BaseStruct):
+    """Large arrays of primitives and of small fixed size structs"""
+    ints: list[int] = Retriever(Array32[int32], default_factory = lambda _: [])
+    floats: list[float] = Retriever(Array32[float64], default_factory = lambda _: [])
+    points: list[Point] = Retriever(Array32[Point], default_factory = lambda _: [])
+
+
+class StringsFile(BaseStruct):
+    """Arrays of strings"""
+    names: list[str] = Retriever(StrArray32, default_factory = lambda _: [])
+    titles: list[str] = Retriever(Array32[str16], default_factory = lambda _: [])
+
+
+class Sample(BaseStruct):
+    id: int = Retriever(uint32, default = 0)
+    value: float = Retriever(float32, default = 0.0)
+    valid: bool = Retriever(bool8, default = True)
+
+
+class AttrFile(BaseStruct):
+    """Struct objects stored attribute by attribute"""
+    samples: list[Sample] = Retriever(StackedAttrArray32[Sample], default_factory = lambda _: [])
+
+
+class Optional(BaseStruct):
+    number: int | None = Retriever(Option8[int32], default_factory = lambda _: None)
+    label: str | None = Retriever(Option8[str16], default_factory = lambda _: None)
+
+
+class OptionFile(BaseStruct):
+    """Records of optional values"""
+    entries: list[Optional] = Retriever(Array32[Optional], default_factory = lambda _: [])
+
+
+class CompressedFile(BaseStruct):
+    """Records in a deflate compressed section"""
+    _codec = get_codec("deflate", level = 6)
+
+    version: int = Retriever(uint32, default = 1)
+    count: int = Retriever(uint32, default = 0, remaining_compressed = True)
+    records: list[Primitives] = Retriever(Array32[Primitives], default_factory = lambda _: [])
+
+
+def _primitives(rng: random.Random, i: int) -> Primitives:
+    return Primitives(
+        i8 = rng.randint(-128, 127), u16 = i % 65536, i32 = rng.randint(-2**31, 2**31 - 1), u64 = i,
+        f32 = rng.random(), f64 = rng.random(), flag = i % 3 == 0,
+    )
+
+
+def _node1(rng: random.Random) -> Node1:
+    return Node1(
+        leaf = Leaf(value = rng.randrange(2**32), name = "leaf" * rng.randint(0, 3)),
+        weights = [rng.randrange(65536) for _ in range(4)],
+    )
+
+
+def make_flat(scale: int) -> FlatFile:
+    rng = random.Random(0)
+    return FlatFile(records = [_primitives(rng, i) for i in range(10_000 * scale)])
+
+
+def make_deep(scale: int) -> DeepFile:
+    rng = random.Random(0)
+    return DeepFile(trees = [
+        Node3(
+            left = Node2(left = _node1(rng), right = _node1(rng)),
+            right = Node2(left = _node1(rng), right = _node1(rng)),
+        )
+        for _ in range(1_000 * scale)
+    ])
+
+
+def make_numbers(scale: int) -> NumbersFile:
+    rng = random.Random(0)
+    return NumbersFile(
+        ints = [rng.randint(-2**31, 2**31 - 1) for _ in range(100_000 * scale)],
+        floats = [rng.random() for _ in range(100_000 * scale)],
+        points = [Point(x = rng.random(), y = rng.random(), z = rng.random()) for _ in range(10_000 * scale)],
+    )
+
+
+def make_strings(scale: int) -> StringsFile:
+    rng = random.Random(0)
+    return StringsFile(
+        names = [f"name {i}" * rng.randint(0, 4) for i in range(20_000 * scale)],
+        titles = [f"título {i}" * rng.randint(1, 3) for i in range(20_000 * scale)],
+    )
+
+
+def make_attrs(scale: int) -> AttrFile:
+    rng = random.Random(0)
+    return AttrFile(samples = [
+        Sample(id = i, value = rng.random(), valid = rng.random() < 0.5) for i in range(10_000 * scale)
+    ])
+
+
+def make_options(scale: int) -> OptionFile:
+    rng = random.Random(0)
+    return OptionFile(entries = [
+        Optional(
+            number = rng.randint(-100, 100) if rng.random() < 0.5 else None,
+            label = f"label {i}" if rng.random() < 0.5 else None,
+        )
+        for i in range(10_000 * scale)
+    ])
+
+
+def make_compressed(scale: int) -> CompressedFile:
+    rng = random.Random(0)
+    records = [_primitives(rng, i) for i in range(10_000 * scale)]
+    return CompressedFile(count = len(records), records = records)
+
+
+SUITE: dict[str, Callable[[int], BaseStruct]] = {
+    "flat": make_flat,
+    "deep": make_deep,
+    "numbers": make_numbers,
+    "strings": make_strings,
+    "attr_array": make_attrs,
+    "options": make_options,
+    "compressed": make_compressed,
+    "scenario": lambda scale: make_scenario(0, 1_000 * scale),
+}
+"""The synthetic files of the benchmark suite, by name. Each is made from a scale factor which multiplies its size"""
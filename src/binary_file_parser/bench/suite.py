@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import gc
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from binary_file_parser.bench.schemas import SUITE
+from binary_file_parser.types import BaseStruct
+
+HIGHER_IS_BETTER = ("parse_mb_s", "parse_obj_s", "write_mb_s", "write_obj_s")
+LOWER_IS_BETTER = ("parse_peak_mb",)
+
+
+def count_structs(value) -> int:
+    """
+    :param value: A struct object, or the value of a retriever property
+
+    :return: The number of struct objects in the value, including itself
+    """
+    if isinstance(value, BaseStruct):
+        return 1 + sum(
+            count_structs(getattr(value, retriever.p_name))
+            for retriever in value._retrievers
+            if retriever.supported(value.struct_ver)
+        )
+    if isinstance(value, list) and len(value) > 0 and isinstance(value[0], (BaseStruct, list)):
+        return sum(map(count_structs, value))
+    return 0
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(name: str, scale: int = 1, repeat: int = 3) -> dict[str, float | int]:
+    """
+    Measure how fast a synthetic file of the suite is parsed and written, and the peak memory used while parsing it
+
+    :param name: The name of the synthetic file in the suite
+    :param scale: The scale factor of the size of the synthetic file
+    :param repeat: The number of times to repeat each measurement, the fastest one is kept
+
+    :return: The size of the file, the number of struct objects in it and the measurements
+    """
+    value = SUITE[name](scale)
+    cls = value.__class__
+    bytes_ = value._to_bytes()
+    objects = count_structs(value)
+    del value
+
+    parse = _best_of(repeat, lambda: cls._from_bytes(bytes_, strict = True))
+    parsed = cls._from_bytes(bytes_, strict = True)
+    write = _best_of(repeat, parsed._to_bytes)
+    del parsed
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cls._from_bytes(bytes_, strict = True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    mb = len(bytes_) / 1e6
+    return {
+        "bytes": len(bytes_),
+        "objects": objects,
+        "parse_mb_s": mb / parse,
+        "parse_obj_s": objects / parse,
+        "write_mb_s": mb / write,
+        "write_obj_s": objects / write,
+        "parse_peak_mb": peak / 1e6,
+    }
+
+
+def run_suite(names: list[str] | None = None, scale: int = 1, repeat: int = 3, progress = None) -> dict:
+    """
+    Run the benchmarks of the suite
+
+    :param names: The names of the synthetic files to benchmark. Defaults to all of them
+    :param scale: The scale factor of the size of the synthetic files
+    :param repeat: The number of times to repeat each measurement, the fastest one is kept
+    :param progress: If given, called with the name and results of each benchmark as soon as it completes
+
+    :return: The results of the benchmarks, with the environment they were run in
+    """
+    results = {}
+    for name in names or SUITE:
+        results[name] = run_benchmark(name, scale, repeat)
+        if progress is not None:
+            progress(name, results[name])
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.25) -> list[str]:
+    """
+    Compare the results of a run of the suite with the results of an earlier run
+
+    :param report: The results of the new run
+    :param baseline: The results of the earlier run
+    :param tolerance: The fraction by which a measurement may be worse than the baseline before it is a regression
+
+    :return: A description of each regression, empty if there are none
+    """
+    regressions = []
+    if report["scale"] != baseline.get("scale"):
+        regressions.append(f"the baseline was run at scale {baseline.get('scale')}, not {report['scale']}")
+        return regressions
+
+    for name, results in report["results"].items():
+        if (base := baseline["results"].get(name)) is None:
+            continue
+        for metric in HIGHER_IS_BETTER:
+            if metric in base and results[metric] < base[metric] * (1 - tolerance):
+                regressions.append(f"{name}.{metric}: {results[metric]:.2f} < {base[metric]:.2f}")
+        for metric in LOWER_IS_BETTER:
+            if metric in base and results[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {results[metric]:.2f} > {base[metric]:.2f}")
+    return regressions
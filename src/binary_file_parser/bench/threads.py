@@ -0,0 +1,85 @@
+"""
+Stress test and throughput benchmark for parsing and writing struct objects in many threads at once. Every thread
+shares the same struct classes and dtype instances, so any state that a dtype keeps while reading or writing shows up as
+corrupted results. Usage::
+
+    python -m binary_file_parser.bench.threads --threads 8 --rounds 20
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from binary_file_parser.bench.schemas import make_scenario, Scenario
+from binary_file_parser.types import ByteStream, DebugByteStream, MemoryByteStream
+
+
+def _round_trip(payloads: list[bytes], idx: int) -> int:
+    """
+    Parse and write back one payload with each kind of stream
+
+    :return: The number of payloads which did not round trip to the same bytes
+    """
+    bytes_ = payloads[idx % len(payloads)]
+    errors = 0
+    for stream_cls in (ByteStream, MemoryByteStream, DebugByteStream):
+        try:
+            value = Scenario._from_stream(stream_cls.from_bytes(bytes_), strict = True)
+            if value._to_bytes() != bytes_:
+                errors += 1
+        except Exception:
+            errors += 1
+    return errors
+
+
+def run(threads: int, rounds: int, num_payloads: int = 16, num_units: int = 20) -> tuple[int, float, float]:
+    """
+    Round trip every payload ``rounds`` times, spread over a pool of threads
+
+    :param threads: The number of threads to use
+    :param rounds: The number of times to round trip every payload
+    :param num_payloads: The number of distinct payloads, each with differently sized arrays
+    :param num_units: The approximate number of units in each payload
+
+    :return: The number of failed round trips, the total number of bytes parsed and the seconds taken
+    """
+    payloads = [make_scenario(seed, num_units)._to_bytes() for seed in range(num_payloads)]
+    jobs = range(rounds * num_payloads)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers = threads) as executor:
+        errors = sum(executor.map(_round_trip, [payloads] * len(jobs), jobs))
+    elapsed = time.perf_counter() - start
+
+    parsed = 3 * rounds * sum(map(len, payloads))
+    return errors, parsed, elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description = __doc__.split("Usage")[0].strip())
+    parser.add_argument("--threads", type = int, default = 8, help = "the number of threads to compare with one thread")
+    parser.add_argument("--rounds", type = int, default = 30, help = "the number of times each payload is round tripped")
+    parser.add_argument("--units", type = int, default = 20, help = "the approximate number of units in each payload")
+    parser.add_argument(
+        "--switch-interval", type = float, default = 1e-6,
+        help = "the thread switch interval to use on builds with a GIL, smaller values make races more likely",
+    )
+    args = parser.parse_args(argv)
+
+    sys.setswitchinterval(args.switch_interval)
+    failed = False
+    for threads in dict.fromkeys((1, args.threads)):
+        errors, parsed, elapsed = run(threads, args.rounds, num_units = args.units)
+        print(
+            f"{threads:>3} thread(s): {parsed / elapsed / 1e6:8.2f} MB/s round tripped, {errors} failed round trip(s)"
+        )
+        failed = failed or errors > 0
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,3 +2,5 @@ from .compression_error import CompressionError
 from .parsing_error import ParsingError
 from .version_error import VersionError
 from .default_value_error import DefaultAttributeError
+from .patch_error import PatchError
+from .projection_error import ProjectionError
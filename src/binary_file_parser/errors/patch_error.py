@@ -0,0 +1,5 @@
+from binary_file_parser.errors.parsing_error import ParsingError
+
+
+class PatchError(ParsingError):
+    pass
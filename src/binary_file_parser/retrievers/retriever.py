@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import sys
-from io import BytesIO
-from typing import Any, Callable, Type, TypeVar
+from typing import Any, BinaryIO, Callable, Type, TypeVar
 
-from binary_file_parser.errors import DefaultAttributeError, VersionError
+from binary_file_parser.errors import DefaultAttributeError, ProjectionError, VersionError
 from binary_file_parser.types import BaseStruct, ByteStream, DebugByteStream, Parseable, Version
+from binary_file_parser.types.lazy_value import LazyValue
 from binary_file_parser.retrievers.map_validate import MapValidate
 
 T = TypeVar("T")
 RetrieverSub = TypeVar("RetrieverSub", bound = "Retriever")
 BaseStructSub = TypeVar("BaseStructSub", bound = BaseStruct)
 
+IMMUTABLE = (int, float, str, bytes, type(None))
+
 
 class Retriever(MapValidate):
     """
@@ -114,6 +116,8 @@ class Retriever(MapValidate):
             )
 
         super().__set__(instance, value)
+        if instance._dirty is not None:
+            instance._dirty.add(self.p_name)
 
     def __get__(self, instance: BaseStruct, owner: Type[BaseStruct]) -> Retriever | T:
         if instance is None:
@@ -124,14 +128,29 @@ class Retriever(MapValidate):
                 f"{self.p_name!r} is not supported in your struct version {instance.struct_ver}"
             )
         try:
-            return super().__get__(instance, owner)
+            value = super().__get__(instance, owner)
         except AttributeError:
-            return self.from_default(instance)
+            if (lazy := getattr(instance, self.l_name, None)) is None:
+                if instance._unavailable and self.p_name in instance._unavailable:
+                    raise ProjectionError(
+                        f"{self.p_name!r} was not read because it is not in the fields the struct was read with"
+                    ) from None
+                return self.from_default(instance)
+            value = self.from_lazy(instance, lazy)
+
+        if instance._dirty is not None and not isinstance(value, IMMUTABLE):
+            # lists and sub structs may be modified in place, so they cannot be assumed to be unmodified anymore
+            instance._dirty.add(self.p_name)
+        return value
 
     @property
     def r_name(self) -> str:
         return f"_repeat_{self.p_name}"
 
+    @property
+    def l_name(self) -> str:
+        return f"_lazy_{self.p_name}"
+
     def set_repeat(self, instance: BaseStruct, repeat: int) -> None:
         """
         Set the repeat value of a retriever property for a provided struct object.
@@ -140,6 +159,8 @@ class Retriever(MapValidate):
         :param repeat: The repeat value to set
         """
         setattr(instance, self.r_name, repeat)
+        if instance._dirty is not None:
+            instance._dirty.add(self.p_name)
 
     def repeat(self, instance: BaseStruct) -> int:
         """
@@ -152,6 +173,16 @@ class Retriever(MapValidate):
             return repeat
         return self._repeat
 
+    def reusable(self, instance: BaseStruct) -> bool:
+        """
+        :param instance: The struct object to check
+
+        :return:
+            true if this retriever property was not modified since the struct object was read, so the bytes it was read
+            from can be written as they are
+        """
+        return not (self.on_write or self.p_name in instance._dirty)
+
     def from_default(self, instance: BaseStruct):
         """
         Initialise this retriever property from its default value
@@ -177,16 +208,21 @@ class Retriever(MapValidate):
             f"Unable to auto-initialise '{self.p_name}' as a default value is not provided"
         )
 
-    def from_stream(self, instance: BaseStruct, stream: ByteStream) -> None:
+    def from_stream(
+        self, instance: BaseStruct, stream: ByteStream, dtype: Parseable | Type[Parseable] | None = None
+    ) -> None:
         """
         Initialise this retriever property from a stream
 
         :param instance: The struct object to initialise the retriever property for
         :param stream: The stream to initialise the retriever property from
+        :param dtype: The type to read the value with instead of the type of this retriever property, e.g. to read sub
+            structs using a projection
         """
         if not self.supported(instance.struct_ver):
             return
-        DebugByteStream.reader_ret = self.p_name
+        if isinstance(stream, DebugByteStream):
+            stream.reader_ret = self.p_name
 
         def call_on_reads():
             for func in self.on_read:
@@ -198,8 +234,11 @@ class Retriever(MapValidate):
             call_on_reads()
             return
 
+        if dtype is None:
+            dtype = self.dtype
+
         def getobj():
-            return self.dtype._from_stream(stream, struct_ver = instance.struct_ver)
+            return dtype._from_stream(stream, struct_ver = instance.struct_ver)
 
         is_not_dynamic_repeat = not hasattr(instance, self.r_name)
         if repeat == 1 and is_not_dynamic_repeat:
@@ -207,12 +246,95 @@ class Retriever(MapValidate):
             call_on_reads()
             return
 
-        ls: list = [None] * repeat
-        for i in range(repeat):
-            ls[i] = getobj()
-        setattr(instance, self.p_name, ls)
+        setattr(instance, self.p_name, dtype._from_stream_many(stream, repeat, struct_ver = instance.struct_ver))
         call_on_reads()
 
+    def skip(self, instance: BaseStruct, stream: ByteStream) -> None:
+        """
+        Advance a stream past the bytes of this retriever property without initialising it. Retriever properties with
+        on_read or on_set hooks are read instead, since their hooks may change how the rest of the struct is read (e.g.
+        by setting the repeat of another retriever property). The retriever properties before them that their hooks use
+        must have been read as well, see ``BaseStruct._hooked_indices``
+
+        :param instance: The struct object the retriever property belongs to
+        :param stream: The stream to skip the retriever property in
+        """
+        if not self.supported(instance.struct_ver):
+            return
+        if self.on_read or self.on_set:
+            self.from_stream(instance, stream)
+            return
+
+        repeat = self.repeat(instance)
+        if repeat > 1 and (size := self.dtype._static_size(instance.struct_ver)) is not None:
+            stream.skip(size * repeat)
+            return
+        for _ in range(repeat):
+            self.dtype._skip(stream, struct_ver = instance.struct_ver)
+
+    def scan(self, instance: BaseStruct, stream: ByteStream) -> None:
+        """
+        Lazily initialise this retriever property from a stream. Instead of being decoded, the value is skipped over and
+        its location in the stream is recorded. The value is then decoded when it is accessed for the first time.
+        Sub structs are read lazily as well. Retriever properties with on_read, on_set, mapper or validator hooks are
+        always read immediately, since their hooks must run as they are read
+
+        :param instance: The struct object to initialise the retriever property for
+        :param stream: The stream to initialise the retriever property from
+        """
+        if not self.supported(instance.struct_ver):
+            return
+
+        repeat = self.repeat(instance)
+        if repeat == -1 or self.on_read or self.on_set or self.mappers or self.validators:
+            self.from_stream(instance, stream)
+            return
+
+        struct_ver = instance.struct_ver
+        is_single = repeat == 1 and not hasattr(instance, self.r_name)
+        if isinstance(self.dtype, type) and issubclass(self.dtype, BaseStruct):
+            if is_single:
+                setattr(instance, self.s_name, self.dtype._from_stream(stream, struct_ver = struct_ver, lazy = True))
+                return
+            setattr(instance, self.s_name, [
+                self.dtype._from_stream(stream, struct_ver = struct_ver, lazy = True)
+                for _ in range(repeat)
+            ])
+            return
+
+        start = stream.progress
+        for _ in range(1 if is_single else repeat):
+            self.dtype._skip(stream, struct_ver = struct_ver)
+        setattr(instance, self.l_name, LazyValue(stream, start, None if is_single else repeat))
+
+    def from_lazy(self, instance: BaseStruct, lazy: LazyValue):
+        """
+        Decode a lazily read retriever property from the location recorded for it
+
+        :param instance: The struct object to decode the retriever property for
+        :param lazy: The location of the retriever property recorded when it was scanned
+
+        :return: The decoded value
+        """
+        value = self.decode_lazy(instance, lazy)
+        setattr(instance, self.s_name, value)
+        delattr(instance, self.l_name)
+        return value
+
+    def decode_lazy(self, instance: BaseStruct, lazy: LazyValue):
+        """
+        Decode a lazily read retriever property without storing it on the struct object
+
+        :param instance: The struct object the retriever property belongs to
+        :param lazy: The location of the retriever property recorded when it was scanned
+
+        :return: The decoded value
+        """
+        stream = lazy.stream()
+        if lazy.repeat is None:
+            return self.dtype._from_stream(stream, struct_ver = instance.struct_ver)
+        return self.dtype._from_stream_many(stream, lazy.repeat, struct_ver = instance.struct_ver)
+
     def to_bytes(self, instance: BaseStruct) -> bytes:
         """
         Convert this retriever property to bytes
@@ -230,6 +352,10 @@ class Retriever(MapValidate):
         for func in self.on_write:
             func(self, instance)
 
+        if not hasattr(instance, self.s_name) and (lazy := getattr(instance, self.l_name, None)) is not None:
+            # lazily read values which were never accessed or set are copied as they are
+            return lazy.bytes()
+
         is_not_dynamic_repeat = not hasattr(instance, self.r_name)
         if repeat == 1 and is_not_dynamic_repeat:
             return self.dtype._to_bytes(getattr(instance, self.p_name))
@@ -238,11 +364,39 @@ class Retriever(MapValidate):
         if len(ls) != repeat:
             raise ValueError(f"length of {self.p_name!r} is not the same as {repeat = }")
 
-        bytes_ = BytesIO()
-        for value in getattr(instance, self.p_name):
-            bytes_.write(self.dtype._to_bytes(value))
+        return self.dtype._to_bytes_many(ls)
+
+    def to_stream(self, instance: BaseStruct, writer: BinaryIO) -> None:
+        """
+        Write this retriever property to a binary writer, without converting all of it to bytes first
+
+        :param instance: The struct object to write the retriever property of
+        :param writer: The writer to write the bytes of the retriever property to
+        """
+        if not self.supported(instance.struct_ver):
+            return
+
+        repeat = self.repeat(instance)
+        if repeat == -1:
+            return
+
+        for func in self.on_write:
+            func(self, instance)
+
+        if not hasattr(instance, self.s_name) and (lazy := getattr(instance, self.l_name, None)) is not None:
+            writer.write(lazy.view())
+            return
+
+        is_not_dynamic_repeat = not hasattr(instance, self.r_name)
+        if repeat == 1 and is_not_dynamic_repeat:
+            self.dtype._to_stream(getattr(instance, self.p_name), writer)
+            return
+
+        ls: list = getattr(instance, self.p_name)
+        if len(ls) != repeat:
+            raise ValueError(f"length of {self.p_name!r} is not the same as {repeat = }")
 
-        return bytes_.getvalue()
+        self.dtype._to_stream_many(ls, writer)
 
     def __str__(self) -> str:
         return self.p_name
@@ -1,8 +1,17 @@
 from .le import *
 
 from .base_struct import BaseStruct
+from .batch import FileResult
 from .byte_stream import ByteStream
+from .chunked_byte_stream import ChunkedByteStream
+from .codec import Bz2Codec, Codec, DeflateCodec, get_codec, LzmaCodec, register_codec
 from .debug_byte_stream import DebugByteStream
+from .file_cache import FileCache
+from .fingerprint import schema_fingerprint
+from .layout import Layout, LayoutEntry
 from .manager import Manager
+from .memory_byte_stream import MemoryByteStream
 from .parseable import Parseable
+from .projection import Projection
+from .struct_cache import CowHandle, StructCache
 from .version import Version
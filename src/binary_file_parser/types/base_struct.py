@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import as_completed, Executor, Future, ProcessPoolExecutor
 from contextlib import suppress
-from typing import Type, TYPE_CHECKING
+from functools import partial
+from typing import BinaryIO, Iterable, Iterator, Type, TYPE_CHECKING
 
 from alive_progress import alive_it
 
-from binary_file_parser.errors import CompressionError, ParsingError, VersionError
+from binary_file_parser.errors import CompressionError, ParsingError, PatchError, VersionError
 from binary_file_parser.types.parseable import Parseable
+from binary_file_parser.types.batch import FileResult, read_file
 from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.chunked_byte_stream import ChunkedByteStream, Decompressor
+from binary_file_parser.types.codec import Codec
+from binary_file_parser.types.compressing_writer import BufferedCompressingWriter, CompressingWriter, Compressor
+from binary_file_parser.types.debug_byte_stream import DebugByteStream
+from binary_file_parser.types.layout import Layout
+from binary_file_parser.types.parallel import in_worker, read_parallel
+from binary_file_parser.types.projection import Projection
+from binary_file_parser.types.struct_plan import compile_plan, PrimitiveRun
 from binary_file_parser.types.version import Version
-from binary_file_parser.utils import TabbedStringIO
+from binary_file_parser.utils import equal, TabbedStringIO
 
 if TYPE_CHECKING:
     from binary_file_parser.retrievers import Retriever, RetrieverCombiner, RetrieverRef
+    from binary_file_parser.types.struct_plan import PlanStep
 
 
 class BaseStruct(Parseable):
@@ -25,6 +39,38 @@ class BaseStruct(Parseable):
     _retrievers: list[Retriever] = []
     _refs: list[RetrieverRef] = []
     _combiners: list[RetrieverCombiner] = []
+    _plans: dict[Version, list[PlanStep]] = {}
+    _sizes: dict[Version, int | None] = {}
+    _hooked: dict[Version, tuple[int, ...]] = {}
+
+    _source: tuple[bytes, list[int]] | None = None
+    """The content of the stream this struct was read from, and the position of each step of its plan in it"""
+    _dirty: set[str] | None = None
+    """The names of the retriever properties which were modified since this struct was read, if it keeps its source"""
+    _patched: dict[int, bytes] | None = None
+    """The bytes written by ``_patch_file`` over the source, by the position of the step of the plan they belong to"""
+    _layout_map: Layout | None = None
+    _unavailable: set[str] | None = None
+    """The names of the retriever properties which were skipped because they were outside the projection read with"""
+
+    _codec: Codec | None = None
+    """
+    The codec used to compress/decompress the compressed section of the struct, e.g. ``get_codec("zlib", level = 9)``.
+    Used by the default implementations of ``_compress``, ``_decompress``, ``_compressor`` and ``_decompressor``
+    """
+
+    _parallel_threshold: int | None = None
+    """
+    Set this on a fixed size struct class to read lists and arrays of at least this many of its struct objects in
+    parallel in worker processes. The struct class must be importable by the worker processes
+    """
+    _parallel_workers: int | None = None
+    """The number of worker processes used for parallel reads. Defaults to the number of CPUs"""
+    _parallel_executor: Executor | None = None
+    """
+    The process pool used for parallel reads. Defaults to a pool with ``_parallel_workers`` processes, which is shared by
+    all parallel reads
+    """
 
     @classmethod
     def _add_retriever(cls, retriever: Retriever):
@@ -62,8 +108,6 @@ class BaseStruct(Parseable):
             if init is None:
                 init = retriever.from_default(self)
             setattr(self, retriever.p_name, init)
-
-            # size += retriever.dtype._size
         super().__init__(size)
 
     def __init_subclass__(cls, **kwargs):
@@ -73,6 +117,9 @@ class BaseStruct(Parseable):
         cls._retrievers, BaseStruct._retrievers = cls._retrievers.copy(), []
         cls._refs, BaseStruct._refs = cls._refs.copy(), []
         cls._combiners, BaseStruct._combiners = cls._combiners.copy(), []
+        cls._plans = {}
+        cls._sizes = {}
+        cls._hooked = {}
 
     @property
     def _struct(self):
@@ -83,6 +130,20 @@ class BaseStruct(Parseable):
         """The struct_ver of this struct used when retrievers are versioned"""
         return self._struct_ver
 
+    @classmethod
+    def _get_plan(cls, struct_ver: Version) -> list[PlanStep]:
+        """
+        Get the read/write plan of this struct for the specified version. The plan is compiled once per version, and
+        merges adjacent fixed size retrievers without hooks into a single struct unpack/pack
+
+        :param struct_ver: The struct version to get the plan for
+
+        :return: A list of steps which can be read/written in order
+        """
+        if (plan := cls._plans.get(struct_ver)) is None:
+            plan = cls._plans[struct_ver] = compile_plan(cls._retrievers, struct_ver)
+        return plan
+
     @classmethod
     def _get_version(cls, stream: ByteStream, struct_ver: Version = Version((0,))) -> Version:
         """
@@ -108,8 +169,10 @@ class BaseStruct(Parseable):
 
         :return: decompressed bytes
 
-        :raises CompressionError: - When unimplemented
+        :raises CompressionError: - When unimplemented and no ``_codec`` is set
         """
+        if cls._codec is not None:
+            return cls._codec.decompress(bytes_)
         raise CompressionError(
             "Unable to read object from file. "
             "A Structure with a compressed section needs to implement 'decompress' classmethod."
@@ -125,17 +188,65 @@ class BaseStruct(Parseable):
 
         :return: compressed bytes
 
-        :raises CompressionError: - When unimplemented
+        :raises CompressionError: - When unimplemented and no ``_codec`` is set
         """
+        if cls._codec is not None:
+            return cls._codec.compress(bytes_)
         raise CompressionError(
             "Unable to write object to file. "
             "A Structure with a compressed section needs to implement 'compress' classmethod."
         )
 
+    @classmethod
+    def _compressor(cls) -> Compressor | None:
+        """
+        If remaining_compressed is set to True in a Retriever and this method is defined, the object it returns is used
+        to compress the remaining bytes incrementally while they are being written. Otherwise, all the remaining bytes
+        are collected and compressed at once using ``_compress``
+
+        :return: A new object with ``compress`` and ``flush`` methods, like the ones returned by ``zlib.compressobj``
+        """
+        if cls._codec is not None:
+            return cls._codec.compressor()
+        return None
+
+    @classmethod
+    def _decompressor(cls) -> Decompressor | None:
+        """
+        If remaining_compressed is set to True in a Retriever and this method is defined, the object it returns is used
+        to decompress the remaining bytes incrementally, only as they are needed while reading. Otherwise, all the
+        remaining bytes are decompressed at once using ``_decompress``
+
+        :return: A new object with a ``decompress`` method, like the ones returned by ``zlib.decompressobj``
+        """
+        if cls._codec is not None:
+            return cls._codec.decompressor()
+        return None
+
+    @classmethod
+    def _decompressed_stream(cls, stream: ByteStream) -> ByteStream:
+        """
+        :param stream: The stream positioned at the start of the compressed section
+
+        :return: A stream of the decompressed bytes remaining in the given stream
+        """
+        if (decompressor := cls._decompressor()) is not None:
+            if isinstance(stream, ChunkedByteStream):
+                # the compressed bytes are pulled in from the source only as they are decompressed
+                return ChunkedByteStream.from_compressed_stream(stream, decompressor)
+            return ChunkedByteStream.from_decompressor(stream.remaining(), decompressor)
+        return stream.__class__.from_bytes(cls._decompress(stream.remaining()))
+
+    def _compressing_writer(self, writer: BinaryIO) -> CompressingWriter | BufferedCompressingWriter:
+        if (compressor := self._compressor()) is not None:
+            return CompressingWriter(writer, compressor)
+        return BufferedCompressingWriter(writer, self._compress)
+
     @classmethod
     def _from_stream(
         cls, stream: ByteStream, *, struct_ver: Version = Version((0,)), strict: bool = False,
-        show_progress: bool = False
+        show_progress: bool = False, lazy: bool = False, reuse_bytes: bool = False, record_layout: bool = False,
+        fields: Iterable[str] | Projection | None = None
     ) -> BaseStruct:
         """
         Create a struct object from a ByteStream
@@ -144,14 +255,62 @@ class BaseStruct(Parseable):
         :param struct_ver: The version of the structure to create. Overwritten if `get_version` is defined
         :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
         :param show_progress: When true, display a progress bar
+        :param lazy:
+            When true, retriever properties are only located in the stream and decoded when they are first accessed.
+            The content of the stream is kept alive for as long as the struct object has values left to decode. Streams
+            which are not seekable are always read immediately
+        :param reuse_bytes:
+            When true, the struct object (and all the struct objects inside it) keep the content of the stream they
+            were read from. When written, only the retriever properties which were modified are converted to bytes
+            again, the bytes of the rest are copied from the content as they are. Streams which are not seekable never
+            keep their content
+        :param record_layout:
+            When true, the position and size of every retriever property and (nested) struct object is recorded while
+            reading. The recorded layout is available from ``_layout`` on the returned struct object
+        :param fields:
+            When set, only the retriever properties with these names are read, e.g. ``{"header", "players.name"}``.
+            Use ``.`` to only read some retriever properties of sub structs, or of the structs in a list or array. The
+            rest are skipped over without being decoded, and raise a ``ProjectionError`` if accessed. Retriever
+            properties which the on_read/on_set hooks of later ones may use are read lazily instead (or in full if the
+            stream is not seekable), and remain available. Struct objects read with a projection never keep the content
+            of the stream they were read from
 
         :return: An instance of a subtype of BaseStruct
+
+        :raises AttributeError: If a field names a retriever property the struct does not have
+        :raises TypeError: If a field names retriever properties of a retriever property which has no sub structs
         """
+        if fields is not None:
+            fields = Projection.of(fields)
+            fields.check(cls)
+        if reuse_bytes:
+            stream.track_spans = True
+
+        layout = stream.layout
+        is_layout_root = record_layout and layout is None
+        if is_layout_root:
+            layout = stream.layout = Layout()
+        start_stream = stream
+        if layout is not None:
+            layout.begin_struct(stream.progress)
+            section = layout.section
+
         with suppress(VersionError):
             struct_ver = cls._get_version(stream, struct_ver)
 
         instance = cls(struct_ver = struct_ver, initialise_defaults = False)
-        retriever_ls = cls._retrievers
+        if fields is not None:
+            instance._unavailable = set()
+            hooked = cls._hooked_indices(struct_ver)
+            read_until = hooked[-1] if hooked else 0
+        offsets = None
+        if isinstance(stream, DebugByteStream) or fields is not None:
+            # debug streams log the bytes consumed by every retriever separately
+            retriever_ls = cls._retrievers
+        else:
+            retriever_ls = cls._get_plan(struct_ver)
+            if stream.track_spans and stream.seekable and not any(step.remaining_compressed for step in retriever_ls):
+                offsets = [stream.progress]
         if show_progress:
             retriever_ls = alive_it(
                 retriever_ls,
@@ -161,26 +320,193 @@ class BaseStruct(Parseable):
                 finalize = lambda bar: bar.title("Finished Reading File")
             )
 
-        for retriever in retriever_ls:
+        for i, retriever in enumerate(retriever_ls):
             if show_progress:
                 retriever_ls.text = f"            -> {retriever.p_name.title().replace('_', ' ')}"
+            if fields is not None and retriever.remaining_compressed and not any(
+                ret.p_name in fields.fields for ret in cls._retrievers[i:]
+            ):
+                # nothing in the compressed section is read, so it does not need to be decompressed either
+                stream.skip(stream.remaining_len())
+                instance._unavailable.update(
+                    ret.p_name for ret in cls._retrievers[i:] if ret.supported(struct_ver)
+                )
+                break
             if retriever.remaining_compressed:
-                stream = stream.__class__.from_bytes(cls._decompress(stream.remaining()))
-            retriever.from_stream(instance, stream)
-
-        file_len = len(stream.content)
-
-        if stream.progress != file_len and strict:
+                track_spans = stream.track_spans
+                stream = cls._decompressed_stream(stream)
+                stream.track_spans = track_spans
+                if layout is not None:
+                    stream.layout = layout
+                    layout.new_section()
+            if layout is not None:
+                if isinstance(retriever, PrimitiveRun):
+                    offset = stream.progress
+                    for ret in retriever.retrievers:
+                        size = ret.dtype._size * max(ret.repeat(instance), 0)
+                        layout.add(ret.p_name, offset, size)
+                        offset += size
+                else:
+                    layout.begin(retriever.p_name, stream.progress, (
+                        isinstance(retriever.dtype, type) and issubclass(retriever.dtype, BaseStruct)
+                        and retriever.repeat(instance) == 1 and not hasattr(instance, retriever.r_name)
+                    ))
+            if fields is None:
+                if lazy and stream.seekable:
+                    retriever.scan(instance, stream)
+                else:
+                    retriever.from_stream(instance, stream)
+            elif retriever.p_name not in fields.fields and i < read_until:
+                # the hooks of a retriever property further on may use this value, so it must be available to them
+                if stream.seekable:
+                    retriever.scan(instance, stream)
+                else:
+                    retriever.from_stream(instance, stream)
+            elif retriever.p_name not in fields.fields:
+                retriever.skip(instance, stream)
+                if retriever.supported(struct_ver) and not hasattr(instance, retriever.s_name):
+                    instance._unavailable.add(retriever.p_name)
+            elif lazy and stream.seekable and fields.fields[retriever.p_name] is None:
+                retriever.scan(instance, stream)
+            else:
+                retriever.from_stream(instance, stream, fields.dtype(retriever))
+            if offsets is not None:
+                offsets.append(stream.progress)
+            if layout is not None and not isinstance(retriever, PrimitiveRun):
+                layout.end(stream.progress)
+
+        if offsets is not None:
+            instance._source = stream.content, offsets
+            stream.retained = True
+            instance._dirty = set()
+
+        if layout is not None:
+            # compressed sections end where the stream the struct started in ends
+            layout.end(start_stream.progress)
+            layout.section = section
+            if is_layout_root:
+                instance._layout_map = layout
+                start_stream.layout = None
+
+        if strict and (remaining := stream.remaining_len()) != 0:
             raise ParsingError(
-                f"{file_len - stream.progress} bytes are left after parsing all retrievers successfully"
+                f"{remaining} bytes are left after parsing all retrievers successfully"
             )
 
         return instance
 
+    @classmethod
+    def _from_stream_many(cls, stream: ByteStream, n: int, *, struct_ver: Version = Version((0,))) -> list[BaseStruct]:
+        if (
+            cls._parallel_threshold is not None
+            and n >= cls._parallel_threshold
+            and stream.seekable
+            # struct objects sent back from the workers do not keep the content or layout of the stream
+            and not (stream.track_spans or stream.layout is not None or isinstance(stream, DebugByteStream))
+            and (size := cls._static_size(struct_ver)) is not None
+            and not in_worker()
+        ):
+            return read_parallel(
+                cls, stream, n, size, struct_ver = struct_ver, workers = cls._parallel_workers,
+                executor = cls._parallel_executor,
+            )
+        return [cls._from_stream(stream, struct_ver = struct_ver) for _ in range(n)]
+
+    @classmethod
+    def _to_bytes_many(cls, values: list[BaseStruct]) -> bytes:
+        return b"".join(value._to_bytes() for value in values)
+
+    @classmethod
+    def _to_stream_many(cls, values: list[BaseStruct], writer: BinaryIO) -> None:
+        for value in values:
+            value._to_stream(writer)
+
+    @classmethod
+    def _version_size(cls, struct_ver: Version) -> int | None:
+        """
+        Compute the number of bytes that every struct object of the specified version takes up. The size is computed
+        once per version
+
+        :param struct_ver: The version of the struct
+
+        :return:
+            The size in bytes, or None if it depends on the values of the struct. This is the case if any of its
+            retriever properties is not of a fixed size type, is compressed, or has on_read/on_set hooks which may change
+            the repeats of other retriever properties
+        """
+        if struct_ver in cls._sizes:
+            return cls._sizes[struct_ver]
+
+        size = 0
+        for retriever in cls._retrievers:
+            if not retriever.supported(struct_ver):
+                continue
+            if retriever.remaining_compressed or retriever.on_read or retriever.on_set:
+                size = None
+                break
+            if retriever._repeat <= 0:
+                continue
+            if (dtype_size := retriever.dtype._static_size(struct_ver)) is None:
+                size = None
+                break
+            size += dtype_size * retriever._repeat
+
+        cls._sizes[struct_ver] = size
+        return size
+
+    @classmethod
+    def _hooked_indices(cls, struct_ver: Version) -> tuple[int, ...]:
+        """
+        Find the retriever properties with on_read/on_set hooks. Their hooks may use the values of any retriever
+        property before them (e.g. to set the repeat of another retriever property), so those cannot be skipped over
+        without being read. The indices are computed once per version
+
+        :param struct_ver: The version of the struct
+
+        :return: The indices in ``_retrievers`` of the supported retriever properties which have on_read/on_set hooks
+        """
+        if (indices := cls._hooked.get(struct_ver)) is None:
+            indices = cls._hooked[struct_ver] = tuple(
+                i for i, retriever in enumerate(cls._retrievers)
+                if retriever.supported(struct_ver) and (retriever.on_read or retriever.on_set)
+            )
+        return indices
+
+    @classmethod
+    def _static_size(cls, struct_ver: Version = Version((0,))) -> int | None:
+        if cls._get_version.__func__ is not BaseStruct._get_version.__func__:
+            # the version of a versioned struct is read from the stream and can be different for each struct object
+            return None
+        return cls._version_size(struct_ver)
+
+    @classmethod
+    def _skip(cls, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        with suppress(VersionError):
+            struct_ver = cls._get_version(stream, struct_ver)
+
+        if (size := cls._version_size(struct_ver)) is not None:
+            stream.skip(size)
+            return
+
+        instance = cls(struct_ver = struct_ver, initialise_defaults = False)
+        hooked = cls._hooked_indices(struct_ver)
+        read_until = hooked[-1] if hooked else 0
+        for i, retriever in enumerate(cls._retrievers):
+            if retriever.remaining_compressed:
+                # compressed sections always last until the end of the stream
+                stream.skip(stream.remaining_len())
+                return
+            if i < read_until:
+                # the hooks of a retriever property further on may use this value
+                retriever.from_stream(instance, stream)
+            else:
+                retriever.skip(instance, stream)
+
     @classmethod
     def _from_bytes(
         cls, bytes_: bytes, *, struct_ver: Version = Version((0,)), strict = False,
-        show_progress: bool = False, stream_cls: Type[ByteStream] = ByteStream
+        show_progress: bool = False, stream_cls: Type[ByteStream] = ByteStream, lazy: bool = False,
+        reuse_bytes: bool = False, record_layout: bool = False, fields: Iterable[str] | None = None
     ) -> BaseStruct:
         """
         Create a struct object from bytes
@@ -189,16 +515,32 @@ class BaseStruct(Parseable):
         :param struct_ver: The version of the structure to create. Overwritten if `get_version` is defined
         :param strict: Raise an error if struct parsing finishes successfully but there are unused bytes left over
         :param show_progress: When true, display a progress bar
+        :param stream_cls: The type of stream to read the bytes with
+        :param lazy: When true, retriever properties are only decoded when they are first accessed
+        :param reuse_bytes:
+            When true, the bytes of the retriever properties which were not modified are copied as they are when the
+            struct object is written
+        :param record_layout:
+            When true, the position and size of every retriever property and (nested) struct object is recorded while
+            reading. The recorded layout is available from ``_layout`` on the returned struct object
+        :param fields:
+            When set, only the retriever properties with these names are read, e.g. ``{"header", "players.name"}``.
+            The rest are skipped over without being decoded
 
         :return: An instance of a subtype of BaseStruct
         """
         stream = stream_cls.from_bytes(bytes_)
-        return cls._from_stream(stream, struct_ver = struct_ver, strict = strict, show_progress = show_progress)
+        return cls._from_stream(
+            stream, struct_ver = struct_ver, strict = strict, show_progress = show_progress, lazy = lazy,
+            reuse_bytes = reuse_bytes, record_layout = record_layout, fields = fields
+        )
 
     @classmethod
     def _from_file(
         cls, file_name: str, *, file_version: Version = Version((0,)), strict = True,
-        show_progress: bool = True, stream_cls: Type[ByteStream] = ByteStream
+        show_progress: bool = True, stream_cls: Type[ByteStream] = ByteStream, mmap: bool = False,
+        lazy: bool = False, reuse_bytes: bool = False, record_layout: bool = False,
+        fields: Iterable[str] | None = None
     ) -> BaseStruct:
         """
         Create a struct object from file
@@ -207,16 +549,38 @@ class BaseStruct(Parseable):
         :param file_version: The version of the structure to create. Overwritten if `get_version` is defined
         :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
         :param show_progress: When true, display a progress bar
+        :param stream_cls: The type of stream to read the file with
+        :param mmap:
+            When true, memory map the file instead of reading all of it up front. Combine with ``MemoryByteStream`` to
+            avoid copying any part of the file
+        :param lazy: When true, retriever properties are only decoded when they are first accessed
+        :param reuse_bytes:
+            When true, the bytes of the retriever properties which were not modified are copied as they are when the
+            struct object is written
+        :param record_layout:
+            When true, the position and size of every retriever property and (nested) struct object is recorded while
+            reading. The recorded layout is available from ``_layout`` on the returned struct object
+        :param fields:
+            When set, only the retriever properties with these names are read, e.g. ``{"header", "players.name"}``.
+            The rest are skipped over without being decoded
 
         :return: An instance of a subtype of BaseStruct
         """
-        stream = stream_cls.from_file(file_name)
-        return cls._from_stream(stream, struct_ver = file_version, strict = strict, show_progress = show_progress)
+        stream = stream_cls.from_mmap(file_name) if mmap else stream_cls.from_file(file_name)
+        try:
+            return cls._from_stream(
+                stream, struct_ver = file_version, strict = strict, show_progress = show_progress, lazy = lazy,
+                reuse_bytes = reuse_bytes, record_layout = record_layout, fields = fields
+            )
+        finally:
+            stream.close()
 
     @classmethod
     def _from_compressed_file(
         cls, file_name: str, *, file_version: Version = Version((0,)), strict = True,
-        show_progress: bool = True, stream_cls: Type[ByteStream] = ByteStream
+        show_progress: bool = True, stream_cls: Type[ByteStream] = ByteStream, mmap: bool = False,
+        lazy: bool = False, reuse_bytes: bool = False, record_layout: bool = False,
+        fields: Iterable[str] | None = None
     ) -> BaseStruct:
         """
         Create a struct object from file
@@ -225,12 +589,293 @@ class BaseStruct(Parseable):
         :param file_version: The version of the structure to create. Overwritten if `get_version` is defined
         :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
         :param show_progress: When true, display a progress bar
+        :param stream_cls: The type of stream to read the file with
+        :param mmap:
+            When true, memory map the file instead of reading all of it up front. Combine with ``MemoryByteStream`` to
+            avoid copying any part of the file
+        :param lazy: When true, retriever properties are only decoded when they are first accessed
+        :param reuse_bytes:
+            When true, the bytes of the retriever properties which were not modified are copied as they are when the
+            struct object is written
+        :param record_layout:
+            When true, the position and size of every retriever property and (nested) struct object is recorded while
+            reading. The recorded layout is available from ``_layout`` on the returned struct object
+        :param fields:
+            When set, only the retriever properties with these names are read, e.g. ``{"header", "players.name"}``.
+            The rest are skipped over without being decoded
 
         :return: An instance of a subtype of BaseStruct
         """
-        stream = stream_cls.from_file(file_name)
-        stream = stream_cls.from_bytes(cls._decompress(stream.remaining()))
-        return cls._from_stream(stream, struct_ver = file_version, strict = strict, show_progress = show_progress)
+        file_stream = stream_cls.from_mmap(file_name) if mmap else stream_cls.from_file(file_name)
+        try:
+            return cls._from_stream(
+                cls._decompressed_stream(file_stream), struct_ver = file_version, strict = strict,
+                show_progress = show_progress, lazy = lazy, reuse_bytes = reuse_bytes, record_layout = record_layout,
+                fields = fields
+            )
+        finally:
+            file_stream.close()
+
+    @classmethod
+    def _iter_from_stream(
+        cls, stream: ByteStream, *, struct_ver: Version = Version((0,)), fields: Iterable[str] | None = None
+    ) -> Iterator[BaseStruct]:
+        """
+        Create struct objects one at a time from a stream which consists of many struct objects back to back, e.g. the
+        records of a log file. Iteration stops when the end of the stream is reached between two struct objects
+
+        :param stream: The stream to create the struct objects from
+        :param struct_ver: The version of the structures to create. Overwritten if `get_version` is defined
+        :param fields: When set, only the retriever properties with these names are read
+
+        :return: An iterator of instances of a subtype of BaseStruct
+
+        :raises EOFError: If the stream ends in the middle of a struct object
+        """
+        if fields is not None:
+            fields = Projection.of(fields)
+        while True:
+            try:
+                stream.peek(1)
+            except EOFError:
+                return
+            yield cls._from_stream(stream, struct_ver = struct_ver, fields = fields)
+
+    @classmethod
+    def _iter_from_file(
+        cls, file_name: str, *, file_version: Version = Version((0,)),
+        stream_cls: Type[ByteStream] = ChunkedByteStream, mmap: bool = False, fields: Iterable[str] | None = None
+    ) -> Iterator[BaseStruct]:
+        """
+        Create struct objects one at a time from a file which consists of many struct objects back to back. With the
+        default ``ChunkedByteStream``, only a small window of the file is held in memory at a time, so memory use does
+        not grow with the size of the file. The file is closed when the iterator is exhausted or closed
+
+        :param file_name: The path of the file to create the struct objects from
+        :param file_version: The version of the structures to create. Overwritten if `get_version` is defined
+        :param stream_cls: The type of stream to read the file with
+        :param mmap: When true, memory map the file instead of reading all of it up front. Ignored for chunked streams
+        :param fields: When set, only the retriever properties with these names are read
+
+        :return: An iterator of instances of a subtype of BaseStruct
+
+        :raises EOFError: If the file ends in the middle of a struct object
+        """
+        if issubclass(stream_cls, ChunkedByteStream):
+            with open(file_name, "rb") as file:
+                yield from cls._iter_from_stream(
+                    stream_cls.from_file_obj(file), struct_ver = file_version, fields = fields
+                )
+            return
+
+        stream = stream_cls.from_mmap(file_name) if mmap else stream_cls.from_file(file_name)
+        try:
+            yield from cls._iter_from_stream(stream, struct_ver = file_version, fields = fields)
+        finally:
+            stream.close()
+
+    @classmethod
+    def _read_field_from_stream(cls, stream: ByteStream, field: str, *, struct_ver: Version = Version((0,))):
+        """
+        Read a single retriever property from a stream without creating the whole struct object. The retriever
+        properties before it are skipped over, except for the ones which on_read/on_set hooks may use
+
+        :param stream: The stream to read the retriever property from, positioned at the start of the struct
+        :param field: The name of the retriever property. Use ``.`` to read retriever properties of sub structs, e.g.
+            ``header.creator_name``
+        :param struct_ver: The version of the structure to read. Overwritten if `get_version` is defined
+
+        :return: The value of the retriever property
+
+        :raises AttributeError: If the struct has no retriever property with the given name
+        :raises VersionError: If the retriever property is not supported in the version of the struct
+        :raises TypeError: If a part of the field that is not the last one is not a single sub struct
+        """
+        name, _, rest = field.partition(".")
+        with suppress(VersionError):
+            struct_ver = cls._get_version(stream, struct_ver)
+
+        for idx, retriever in enumerate(cls._retrievers):
+            if retriever.p_name == name:
+                break
+        else:
+            raise AttributeError(f"{cls.__name__!r} has no retriever property {name!r}")
+        if not retriever.supported(struct_ver):
+            raise VersionError(f"{name!r} is not supported in your struct version {struct_ver}")
+
+        # the hooks of the retriever property and the ones before it may use the values before them
+        read_until = max((i for i in cls._hooked_indices(struct_ver) if i <= idx), default = 0)
+        instance = cls(struct_ver = struct_ver, initialise_defaults = False)
+        for i, retriever in enumerate(cls._retrievers[:idx + 1]):
+            if not retriever.supported(struct_ver):
+                continue
+            if retriever.remaining_compressed:
+                stream = cls._decompressed_stream(stream)
+            if i == idx:
+                break
+            if i < read_until:
+                retriever.from_stream(instance, stream)
+            else:
+                retriever.skip(instance, stream)
+
+        if not rest:
+            retriever.from_stream(instance, stream)
+            return getattr(instance, retriever.p_name)
+
+        if (
+            not (isinstance(retriever.dtype, type) and issubclass(retriever.dtype, BaseStruct))
+            or retriever.repeat(instance) != 1
+            or hasattr(instance, retriever.r_name)
+        ):
+            raise TypeError(f"{name!r} of {cls.__name__!r} is not a single sub struct, its fields cannot be read")
+        return retriever.dtype._read_field_from_stream(stream, rest, struct_ver = struct_ver)
+
+    @classmethod
+    def _read_field(
+        cls, file_name: str, field: str, *, file_version: Version = Version((0,)),
+        stream_cls: Type[ByteStream] = ByteStream, mmap: bool = True, compressed: bool = False
+    ):
+        """
+        Read a single retriever property from a file without parsing the whole file. Only the bytes needed to find the
+        retriever property are read
+
+        :param file_name: The path of the file to read the retriever property from
+        :param field: The name of the retriever property. Use ``.`` to read retriever properties of sub structs, e.g.
+            ``header.creator_name``
+        :param file_version: The version of the structure to read. Overwritten if `get_version` is defined
+        :param stream_cls: The type of stream to read the file with
+        :param mmap: When true, memory map the file instead of reading all of it up front
+        :param compressed: When true, the whole file is decompressed first, as with ``_from_compressed_file``
+
+        :return: The value of the retriever property
+        """
+        file_stream = stream_cls.from_mmap(file_name) if mmap else stream_cls.from_file(file_name)
+        try:
+            stream = cls._decompressed_stream(file_stream) if compressed else file_stream
+            return cls._read_field_from_stream(stream, field, struct_ver = file_version)
+        finally:
+            file_stream.close()
+
+    @classmethod
+    async def _from_file_async(
+        cls, file_name: str, *, file_version: Version = Version((0,)), strict = True, compressed: bool = False,
+        stream_cls: Type[ByteStream] = ByteStream, mmap: bool = False, lazy: bool = False, reuse_bytes: bool = False,
+        record_layout: bool = False, fields: Iterable[str] | None = None, executor: Executor | None = None
+    ) -> BaseStruct:
+        """
+        Create a struct object from file without blocking the event loop. Both reading and parsing the file happen in
+        the executor
+
+        :param file_name: The path of the file to create the struct object from
+        :param file_version: The version of the structure to create. Overwritten if `get_version` is defined
+        :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
+        :param compressed: When true, the file is read using ``_from_compressed_file`` instead of ``_from_file``
+        :param stream_cls: The type of stream to read the file with
+        :param mmap: When true, memory map the file instead of reading all of it up front
+        :param lazy: When true, retriever properties are only decoded when they are first accessed
+        :param reuse_bytes:
+            When true, the bytes of the retriever properties which were not modified are copied as they are when the
+            struct object is written
+        :param record_layout: When true, the position and size of every retriever property is recorded while reading
+        :param fields: When set, only the retriever properties with these names are read
+        :param executor:
+            The executor to read and parse the file in. Defaults to the default executor of the event loop. With a
+            ``ProcessPoolExecutor``, the struct object is pickled back to the event loop, so the content kept by
+            ``lazy``, ``reuse_bytes`` and ``record_layout`` is lost and lazy values are decoded
+
+        :return: An instance of a subtype of BaseStruct
+        """
+        read = cls._from_compressed_file if compressed else cls._from_file
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(
+            read, file_name, file_version = file_version, strict = strict, show_progress = False,
+            stream_cls = stream_cls, mmap = mmap, lazy = lazy, reuse_bytes = reuse_bytes,
+            record_layout = record_layout, fields = fields,
+        ))
+
+    @classmethod
+    async def _from_stream_reader(
+        cls, reader: asyncio.StreamReader, *, struct_ver: Version = Version((0,)), strict: bool = False,
+        fields: Iterable[str] | None = None, chunk_size: int = 64 * 1024, executor: Executor | None = None
+    ) -> BaseStruct:
+        """
+        Create a struct object from an ``asyncio.StreamReader`` (e.g. a socket opened with ``asyncio.open_connection``)
+        without blocking the event loop. Parsing starts right away and happens in the executor, while the bytes are
+        read from the reader on the event loop as the parser needs them. Only the bytes of the struct object are read,
+        so the next one can be read from the same reader afterwards
+
+        :param reader: The reader to create the struct object from
+        :param struct_ver: The version of the structure to create. Overwritten if `get_version` is defined
+        :param strict:
+            Raise an error if struct parsing finishes successfully but the reader has left over bytes. This waits for
+            the reader to reach its end
+        :param fields: When set, only the retriever properties with these names are read
+        :param chunk_size: The maximum number of bytes to request from the reader at a time when skipping bytes
+        :param executor:
+            The executor to parse in. Defaults to the default executor of the event loop. It must run its work in
+            threads of the current process, e.g. a ``ThreadPoolExecutor``
+
+        :return: An instance of a subtype of BaseStruct
+        """
+        loop = asyncio.get_running_loop()
+        stream = ChunkedByteStream.from_stream_reader(reader, loop, chunk_size)
+        return await loop.run_in_executor(executor, partial(
+            cls._from_stream, stream, struct_ver = struct_ver, strict = strict, fields = fields,
+        ))
+
+    @classmethod
+    def _from_files(
+        cls, paths: Iterable[str], *, workers: int | None = None, ordered: bool = True, compressed: bool = False,
+        file_version: Version = Version((0,)), strict = True, stream_cls: Type[ByteStream] = ByteStream,
+        mmap: bool = False, fields: Iterable[str] | None = None
+    ) -> Iterator[FileResult]:
+        """
+        Create struct objects from many files, parsing them in parallel in a pool of worker processes. A file which
+        fails to parse does not abort the batch, its error is reported in its result instead. Progress bars are disabled
+        in the workers. The struct class must be importable by the worker processes
+
+        :param paths: The paths of the files to create the struct objects from
+        :param workers: The number of worker processes to use. Defaults to the number of CPUs. If set to 1, the files
+            are parsed one by one in the current process instead
+        :param ordered: When true, results are yielded in the same order as the paths. Otherwise, they are yielded as
+            soon as they are completed
+        :param compressed: When true, the files are read using ``_from_compressed_file`` instead of ``_from_file``
+        :param file_version: The version of the structure to create. Overwritten if `get_version` is defined
+        :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
+        :param stream_cls: The type of stream to read the files with
+        :param mmap: When true, memory map the files instead of reading all of them up front
+        :param fields: When set, only the retriever properties with these names are read from each file
+
+        :return: An iterator of the results of parsing each file
+        """
+        if fields is not None:
+            # projections cache the types they read with, so the names are sent to the workers instead
+            fields = tuple(fields)
+        args = (compressed, file_version, strict, stream_cls, mmap, fields)
+        if workers == 1:
+            for path in paths:
+                yield read_file(cls, path, *args)
+            return
+
+        executor = ProcessPoolExecutor(max_workers = workers)
+        try:
+            futures: dict[Future, str] = {executor.submit(read_file, cls, path, *args): path for path in paths}
+            for future in (futures if ordered else as_completed(futures)):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # the worker itself died or the result could not be sent back
+                    yield FileResult(futures[future], error = e)
+        finally:
+            executor.shutdown(cancel_futures = True)
+
+    def _layout(self) -> Layout | None:
+        """
+        :return:
+            The positions and sizes of every retriever property and (nested) struct object in the stream this struct
+            object was read from, if it was read with ``record_layout = True``. Positions inside a compressed section are
+            relative to the decompressed section
+        """
+        return self._layout_map
 
     def _to_bytes(self, *, show_progress = False) -> bytes:
         """
@@ -241,11 +886,13 @@ class BaseStruct(Parseable):
 
         :return: bytes
         """
-        length = len(self._retrievers)
+        retriever_ls = self._get_plan(self.struct_ver)
+        length = len(retriever_ls)
 
         bytes_ = [b""] * length
         compress_idx = length
-        retriever_ls = self._retrievers
+        if (source := self._source) is not None:
+            content, offsets = source
         if show_progress:
             retriever_ls = alive_it(
                 retriever_ls,
@@ -260,7 +907,10 @@ class BaseStruct(Parseable):
                 retriever_ls.text = f"            <- {retriever.p_name.title().replace('_', ' ')}"
             if retriever.remaining_compressed:
                 compress_idx = i
-            bytes_[i] = retriever.to_bytes(self)
+            if source is not None and retriever.reusable(self):
+                bytes_[i] = content[offsets[i]:offsets[i + 1]]
+            else:
+                bytes_[i] = retriever.to_bytes(self)
 
         compressed = b""
         if compress_idx != length:
@@ -268,6 +918,45 @@ class BaseStruct(Parseable):
 
         return b"".join(bytes_[:compress_idx]) + compressed
 
+    def _to_stream(self, writer: BinaryIO, *, show_progress: bool = False) -> None:
+        """
+        Write the struct object to a binary writer piece by piece, without converting all of it to bytes first
+
+        :param writer: The writer to write the bytes of the struct object to, e.g. a file opened in binary mode
+        :param show_progress: When true, display a progress bar
+        """
+        retriever_ls = self._get_plan(self.struct_ver)
+        compress_idx = len(retriever_ls)
+        for i, retriever in enumerate(retriever_ls):
+            if retriever.remaining_compressed:
+                compress_idx = i
+
+        if show_progress:
+            retriever_ls = alive_it(
+                retriever_ls,
+                dual_line = True,
+                title = "         Writing File",
+                stats = False,
+                finalize = lambda bar: bar.title("Finished Writing File"),
+            )
+
+        if (source := self._source) is not None:
+            content, offsets = source
+
+        compressing_writer = None
+        for i, retriever in enumerate(retriever_ls):
+            if show_progress:
+                retriever_ls.text = f"            <- {retriever.p_name.title().replace('_', ' ')}"
+            if i == compress_idx:
+                writer = compressing_writer = self._compressing_writer(writer)
+            if source is not None and retriever.reusable(self):
+                writer.write(content[offsets[i]:offsets[i + 1]])
+            else:
+                retriever.to_stream(self, writer)
+
+        if compressing_writer is not None:
+            compressing_writer.close()
+
     def _to_file(self, file_name: str, *, show_progress: bool = True):
         """
         Write the bytes of the struct object to a file
@@ -276,7 +965,42 @@ class BaseStruct(Parseable):
         :param show_progress: When true, display a progress bar
         """
         with open(file_name, "wb") as file:
-            file.write(self._to_bytes(show_progress = show_progress))
+            self._to_stream(file, show_progress = show_progress)
+
+    @classmethod
+    def _write_many(cls, values: Iterable[BaseStruct], file_name: str) -> int:
+        """
+        Write many struct objects back to back to a file, one at a time. The struct objects can be produced lazily, e.g.
+        by a generator, so they never need to be held in memory all at once
+
+        :param values: The struct objects to write
+        :param file_name: The name of the file to write to
+
+        :return: The number of struct objects written
+        """
+        count = 0
+        with open(file_name, "wb") as file:
+            for value in values:
+                value._to_stream(file)
+                count += 1
+        return count
+
+    async def _to_file_async(
+        self, file_name: str, *, compressed: bool = False, executor: Executor | None = None
+    ) -> None:
+        """
+        Write the bytes of the struct object to a file without blocking the event loop. Both converting the struct
+        object to bytes and writing them happen in the executor. The struct object must not be modified until the
+        write is complete
+
+        :param file_name: The name of the file to write to
+        :param compressed: When true, the file is written using ``_to_compressed_file`` instead of ``_to_file``
+        :param executor:
+            The executor to write the file in. Defaults to the default executor of the event loop. With a
+            ``ProcessPoolExecutor``, the struct object is pickled to the worker process
+        """
+        write = self._to_compressed_file if compressed else self._to_file
+        await asyncio.get_running_loop().run_in_executor(executor, partial(write, file_name, show_progress = False))
 
     def _to_compressed_file(self, file_name: str, *, show_progress: bool = True):
         """
@@ -286,7 +1010,107 @@ class BaseStruct(Parseable):
         :param show_progress: When true, display a progress bar
         """
         with open(file_name, "wb") as file:
-            file.write(self._compress(self._to_bytes(show_progress = show_progress)))
+            writer = self._compressing_writer(file)
+            self._to_stream(writer, show_progress = show_progress)
+            writer.close()
+
+    def _patch_file(self, file_name: str, *, fallback: bool = False) -> bool:
+        """
+        Write the modifications made to a struct object directly into the file it was read from, without rewriting the
+        rest of the file. The struct object must have been read from the file using ``reuse_bytes = True``, and none of
+        the modifications may change the size of any retriever property (e.g. the length of a list or a string)
+
+        :param file_name: The path of the file the struct object was read from
+        :param fallback:
+            When true, the whole file is rewritten if the modifications cannot be patched in place, instead of raising
+            an error
+
+        :return: true if the file was patched in place, false if it was rewritten as a fallback
+
+        :raises PatchError: If the modifications cannot be patched in place and fallback is false
+        """
+        try:
+            patches = self._collect_patches(file_name)
+        except PatchError:
+            if not fallback:
+                raise
+            # write to a new file first, the content of the old one might still be mapped into memory
+            tmp_name = f"{file_name}.tmp"
+            self._to_file(tmp_name, show_progress = False)
+            os.replace(tmp_name, file_name)
+            # the file no longer matches the content this struct object was read from
+            self._source = self._dirty = self._patched = None
+            return False
+
+        with open(file_name, "r+b") as file:
+            for _, _, changes in patches:
+                for offset, bytes_ in changes:
+                    file.seek(offset)
+                    file.write(bytes_)
+
+        # later patches must be compared against the bytes in the file now, not the ones it was read with. The
+        # modified retriever properties stay marked as modified, since lists and sub structs may still be modified in
+        # place through references to them, so their bytes are never copied from the (stale) source
+        if self._patched is None:
+            self._patched = {}
+        for start, new, _ in patches:
+            self._patched[start] = new
+        return True
+
+    def _collect_patches(self, file_name: str) -> list[tuple[int, bytes, list[tuple[int, memoryview]]]]:
+        """
+        :param file_name: The path of the file the struct object was read from
+
+        :return:
+            For every modified step of the plan, its position in the file, its new bytes, and a list of file offsets and
+            the bytes to write there to apply the modifications made to it
+
+        :raises PatchError: If the modifications cannot be patched in place
+        """
+        if self._source is None:
+            raise PatchError(
+                "Only struct objects read with 'reuse_bytes = True' and without compressed sections can be patched"
+            )
+        content, offsets = self._source
+        if offsets[0] != 0 or offsets[-1] != len(content) or os.path.getsize(file_name) != len(content):
+            raise PatchError(f"The struct object was not read from the whole of {file_name!r}")
+
+        patched = self._patched or {}
+        patches = []
+        for i, retriever in enumerate(self._get_plan(self.struct_ver)):
+            if retriever.reusable(self):
+                continue
+            start, end = offsets[i], offsets[i + 1]
+            new = retriever.to_bytes(self)
+            if len(new) != end - start:
+                raise PatchError(
+                    f"The size of {retriever.p_name!r} changed from {end - start} to {len(new)} bytes, it cannot be "
+                    f"patched in place"
+                )
+            old = patched.get(start, content[start:end])
+            if changes := [(start + offset, bytes_) for offset, bytes_ in _changed_blocks(old, new)]:
+                patches.append((start, new, changes))
+        return patches
+
+    def __getstate__(self) -> tuple[Version, dict]:
+        """
+        Lazily read values are decoded into the pickled state, so that pickling a struct object never copies the
+        content of the stream it was read from
+        """
+        state = self.__dict__.copy()
+        state.pop("_source", None)
+        state.pop("_dirty", None)
+        state.pop("_patched", None)
+        state.pop("_layout_map", None)
+        for retriever in self._retrievers:
+            if (lazy := state.pop(retriever.l_name, None)) is not None:
+                state[retriever.s_name] = retriever.decode_lazy(self, lazy)
+        return self._struct_ver, state
+
+    def __setstate__(self, state: tuple[Version, dict]) -> None:
+        self._struct_ver, dict_ = state
+        self._size = 0
+        self.__dict__.update(dict_)
 
     def _diff(self, other: BaseStruct) -> dict[str, tuple | dict]:
         """
@@ -316,7 +1140,7 @@ class BaseStruct(Parseable):
                         sub_diff = val1._diff(val2)
                         if len(sub_diff) > 0:
                             diff_retrievers[retriever.p_name] = sub_diff
-                    elif val1 != val2:
+                    elif not equal(val1, val2):
                         diff_retrievers[retriever.p_name] = diff
 
         return diff_retrievers
@@ -336,6 +1160,10 @@ class BaseStruct(Parseable):
             for retriever in self._retrievers:
                 if not retriever.supported(self.struct_ver):
                     continue
+                if self._unavailable and retriever.p_name in self._unavailable and not hasattr(self, retriever.s_name):
+                    builder.writeln(f"{retriever.p_name} = <not read>,")
+                    len_gt_zero = True
+                    continue
                 obj = get(self, retriever.p_name)
                 if isinstance(obj, BaseStruct):
                     builder.writeln(f"{retriever.p_name} = {obj.__repr__(builder.ident, get)},")
@@ -365,7 +1193,7 @@ class BaseStruct(Parseable):
         for retriever in self._retrievers:
             if not retriever.supported(self.struct_ver):
                 continue
-            if getattr(self, retriever.p_name) != getattr(other, retriever.p_name):
+            if not equal(getattr(self, retriever.p_name), getattr(other, retriever.p_name)):
                 return False
         return True
 
@@ -392,3 +1220,26 @@ def _ls_repr(ls: list, ident: int = 0, get = getattr) -> str:
 
     builder.write("]")
     return builder.getvalue()
+
+
+def _changed_blocks(old: bytes, new: bytes, block_size: int = 4096) -> list[tuple[int, memoryview]]:
+    """
+    :param old: The original bytes
+    :param new: The new bytes, of the same length as the original bytes
+    :param block_size: The granularity to compare the bytes at
+
+    :return: The offsets and contents of the (merged) blocks of the new bytes which differ from the original bytes
+    """
+    old, new = memoryview(old), memoryview(new)
+    blocks = []
+    start = None
+    for offset in range(0, len(new), block_size):
+        if old[offset:offset + block_size] != new[offset:offset + block_size]:
+            if start is None:
+                start = offset
+        elif start is not None:
+            blocks.append((start, new[start:offset]))
+            start = None
+    if start is not None:
+        blocks.append((start, new[start:]))
+    return blocks
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pickle
+import traceback
+from typing import Generic, Type, TypeVar, TYPE_CHECKING
+
+from binary_file_parser.errors import ParsingError
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.version import Version
+
+if TYPE_CHECKING:
+    from binary_file_parser.types.base_struct import BaseStruct
+
+T = TypeVar("T", bound = "BaseStruct")
+
+
+class FileResult(Generic[T]):
+    """
+    The outcome of parsing a single file of a batch. Holds either the parsed struct object or the error that parsing
+    the file failed with, so that one bad file does not abort the entire batch
+    """
+    __slots__ = "path", "value", "error", "tb"
+
+    def __init__(self, path: str, value: T | None = None, error: BaseException | None = None, tb: str = ""):
+        """
+        :param path: The path of the file
+        :param value: The struct object parsed from the file, if parsing succeeded
+        :param error: The error raised while parsing the file, if parsing failed
+        :param tb: The formatted traceback of the error, as it was raised in the worker process
+        """
+        self.path = path
+        self.value = value
+        self.error = error
+        self.tb = tb
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was parsed successfully"""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        :return: The parsed struct object
+
+        :raises: The error the file failed to parse with, if any
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"FileResult({self.path!r}, error = {self.error!r})"
+        return f"FileResult({self.path!r}, value = {self.value.__class__.__name__})"
+
+
+def read_file(
+    cls: Type[T], path: str, compressed: bool, file_version: Version, strict: bool, stream_cls: Type[ByteStream],
+    mmap: bool, fields: tuple[str, ...] | None = None,
+) -> FileResult[T]:
+    """
+    Parse a single file of a batch. This runs inside the worker processes, so progress bars are always disabled and
+    errors are returned instead of raised
+
+    :return: The result of parsing the file
+    """
+    read = cls._from_compressed_file if compressed else cls._from_file
+    try:
+        value = read(
+            path, file_version = file_version, strict = strict, show_progress = False, stream_cls = stream_cls,
+            mmap = mmap, fields = fields,
+        )
+    except Exception as e:
+        tb = traceback.format_exc()
+        try:
+            pickle.dumps(e)
+        except Exception:
+            # the error needs to make its way back to the parent process
+            e = ParsingError(f"{e.__class__.__name__}: {e}")
+        return FileResult(path, error = e, tb = tb)
+    return FileResult(path, value)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import mmap
+import os
+import struct
+from contextlib import suppress
 
 class ByteStream:
     """A stream of bytes which can be used to get or peek n number of bytes at a time"""
-    __slots__ = "content", "progress"
+    __slots__ = "content", "progress", "track_spans", "layout", "retained"
+
+    seekable = True
+    """Streams which are not seekable do not keep their content around after it has been read"""
 
     def __init__(self, content: bytes, progress: int = 0):
         """
@@ -12,6 +19,15 @@ class ByteStream:
         """
         self.content: bytes = content
         self.progress = progress
+        self.track_spans = False
+        """When true, struct objects read from this stream keep the spans of the content they were read from"""
+        self.layout = None
+        """When set, the positions of the struct objects read from this stream are recorded in this layout"""
+        self.retained = False
+        """
+        True once a value read from this stream keeps a reference to its content (lazily read values, or struct objects
+        read with ``reuse_bytes``), so the content must not be released when the stream is closed
+        """
 
     @classmethod
     def from_file(cls, filepath: str) -> ByteStream:
@@ -26,6 +42,36 @@ class ByteStream:
             file_content = f.read()
         return cls(file_content)
 
+    @classmethod
+    def from_mmap(cls, filepath: str) -> ByteStream:
+        """
+        Create a ByteStream from a read only memory map of a file. The pages of the file are only loaded as they are
+        read instead of reading the entire file up front, and are shared with other processes mapping the same file.
+        The file is unmapped by ``close``
+
+        :param filepath: The path of the file to create the stream from
+
+        :return: ByteStream object
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # empty files cannot be mapped
+                return cls(b"")
+            file_content = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            file_content.madvise(mmap.MADV_SEQUENTIAL)
+        return cls(file_content)
+
+    def close(self) -> None:
+        """
+        Release the source of the stream once it is no longer read from. A memory mapped file is unmapped, unless the
+        values read from it still use its content (see ``retained``) or views of it. It is then unmapped once the last
+        of them is garbage collected
+        """
+        if not self.retained and isinstance(self.content, mmap.mmap):
+            with suppress(BufferError):
+                self.content.close()
+
     @classmethod
     def from_bytes(cls, bytes_: bytes) -> ByteStream:
         """
@@ -51,7 +97,7 @@ class ByteStream:
             return b''
         result = self.content[self.progress:self.progress + n]
         if len(result) < n:
-            remaining = len(self.remaining())
+            remaining = self.remaining_len()
             raise EOFError(f"End of file reached. (Requested: {n} bytes, only {remaining} left.)")
         self.progress += n
         return result
@@ -70,10 +116,43 @@ class ByteStream:
             return b''
         result = self.content[self.progress:self.progress + n]
         if len(result) < n:
-            remaining = len(self.remaining())
+            remaining = self.remaining_len()
             raise EOFError(f"End of file reached. (Requested: {n} bytes, only {remaining} left.)")
         return result
 
+    def skip(self, n: int) -> None:
+        """
+        Advance the reading position forward by the specified number of bytes without reading them
+
+        :param n: The number of bytes to skip
+
+        :raises EOFError: if the number of bytes to skip is greater than the remaining number of bytes in the stream
+        """
+        if n <= 0:
+            return
+        if self.progress + n > len(self.content):
+            remaining = len(self.content) - self.progress
+            raise EOFError(f"End of file reached. (Requested: {n} bytes, only {remaining} left.)")
+        self.progress += n
+
+    def unpack(self, struct_: struct.Struct) -> tuple:
+        """
+        Unpack the specified struct from the stream and advance the reading position forward
+
+        :param struct_: The precompiled struct to unpack
+
+        :return: The unpacked values
+
+        :raises EOFError: if the size of the struct is greater than the remaining number of bytes in the stream
+        """
+        return struct_.unpack(self.get(struct_.size))
+
+    def remaining_len(self) -> int:
+        """
+        :return: The number of bytes remaining in the stream
+        """
+        return len(self.content) - self.progress
+
     def remaining(self) -> bytes:
         """
         Get all the bytes that are remaining in the stream
@@ -81,5 +160,5 @@ class ByteStream:
         :return: The remaining bytes in the stream
         """
         result = self.content[self.progress:]
-        self.progress = len(self.content) - 1
+        self.progress = len(self.content)
         return result
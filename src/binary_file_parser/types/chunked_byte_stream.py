@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+from io import BytesIO
+from typing import BinaryIO, Callable, Protocol
+
+from binary_file_parser.types.byte_stream import ByteStream
+
+
+class Decompressor(Protocol):
+    """
+    The interface of incremental decompressors like the ones returned by ``zlib.decompressobj``,
+    ``bz2.BZ2Decompressor`` or ``lzma.LZMADecompressor``
+    """
+    def decompress(self, data: bytes, /) -> bytes:
+        ...
+
+
+class ChunkedByteStream(ByteStream):
+    """
+    A stream of bytes which pulls its content in from a source in chunks, only as it is read. Bytes which have been read
+    are discarded, so only a small window of the stream is held in memory at a time. ``progress`` is still the absolute
+    position in the stream, ``content`` only holds the bytes from ``offset`` onwards
+    """
+    __slots__ = "source", "offset", "chunk_size", "exhausted", "closer", "read_ahead"
+
+    seekable = False
+
+    def __init__(self, source: Callable[[int], bytes], chunk_size: int = 64 * 1024):
+        """
+        :param source:
+            A function which returns up to the requested number of bytes from the source each time it is called, and
+            empty bytes once the source is exhausted. e.g. the read method of a binary file
+        :param chunk_size: The number of bytes to request from the source at a time
+        """
+        super().__init__(bytearray(), 0)
+        self.source = source
+        self.offset = 0
+        self.chunk_size = chunk_size
+        self.exhausted = False
+        self.closer: Callable[[], None] | None = None
+        """Called by ``close`` to release the source, e.g. the close method of a file opened for the stream"""
+        self.read_ahead = True
+        """
+        When false, only the bytes that are needed are requested from the source, so that the bytes after the ones
+        read from this stream are left in the source, e.g. the next message on a connection
+        """
+
+    @classmethod
+    def from_bytes(cls, bytes_: bytes) -> ChunkedByteStream:
+        """
+        Create a ChunkedByteStream from bytes
+
+        :param bytes_:
+
+        :return: ChunkedByteStream object
+        """
+        return cls(BytesIO(bytes_).read)
+
+    @classmethod
+    def from_file_obj(cls, file: BinaryIO, chunk_size: int = 64 * 1024) -> ChunkedByteStream:
+        """
+        Create a ChunkedByteStream which reads its content from a binary file-like object, e.g. an open file, a pipe,
+        ``sys.stdin.buffer`` or a socket opened with ``socket.makefile("rb")``. Only the bytes that have not been read
+        yet are buffered, so the content can be larger than the available memory. The file-like object is not closed
+
+        :param file: The binary file-like object to read the content from
+        :param chunk_size: The number of bytes to request from the file-like object at a time
+
+        :return: ChunkedByteStream object
+        """
+        # read1 returns as soon as any bytes are available instead of waiting for the full chunk, so that parsing a
+        # pipe or a socket never waits for more bytes than it needs
+        return cls(getattr(file, "read1", file.read), chunk_size)
+
+    @classmethod
+    def from_file(cls, filepath: str, chunk_size: int = 64 * 1024) -> ChunkedByteStream:
+        """
+        Create a ChunkedByteStream which reads a file in chunks as it is read, instead of all at once. The file is
+        closed once it has been read to its end, or when the stream is closed
+
+        :param filepath: The path of the file to create the stream from
+        :param chunk_size: The number of bytes to read from the file at a time
+
+        :return: ChunkedByteStream object
+        """
+        file = open(filepath, "rb")
+
+        def read(n: int) -> bytes:
+            if file.closed:
+                return b""
+            if not (chunk := file.read(n)):
+                file.close()
+            return chunk
+
+        stream = cls(read, chunk_size)
+        stream.closer = file.close
+        return stream
+
+    @classmethod
+    def from_mmap(cls, filepath: str) -> ChunkedByteStream:
+        """
+        Chunked streams only hold a small window of the file in memory already, so this is the same as ``from_file``
+
+        :param filepath: The path of the file to create the stream from
+
+        :return: ChunkedByteStream object
+        """
+        return cls.from_file(filepath)
+
+    @classmethod
+    def from_stream_reader(
+        cls, reader: asyncio.StreamReader, loop: asyncio.AbstractEventLoop, chunk_size: int = 64 * 1024
+    ) -> ChunkedByteStream:
+        """
+        Create a ChunkedByteStream which reads its content from an ``asyncio.StreamReader`` as it arrives. The stream
+        must be read from a thread other than the one running the event loop, since it waits for the reads scheduled
+        on the event loop to complete. The stream never reads ahead, so the bytes after the ones read from it stay in
+        the reader, e.g. the next message on a connection
+
+        :param reader: The reader to read the content from
+        :param loop: The event loop the reader belongs to
+        :param chunk_size: The maximum number of bytes to request from the reader at a time when skipping bytes
+
+        :return: ChunkedByteStream object
+        """
+        def read(n: int) -> bytes:
+            return asyncio.run_coroutine_threadsafe(reader.read(n), loop).result()
+
+        stream = cls(read, chunk_size)
+        stream.read_ahead = False
+        return stream
+
+    @classmethod
+    def from_decompressor(
+        cls, bytes_: bytes, decompressor: Decompressor, chunk_size: int = 16 * 1024
+    ) -> ChunkedByteStream:
+        """
+        Create a ChunkedByteStream of the decompressed content of some compressed bytes, which are only decompressed as
+        the stream is read
+
+        :param bytes_: The compressed bytes
+        :param decompressor: The incremental decompressor to decompress the bytes with
+        :param chunk_size: The number of compressed bytes to decompress at a time
+
+        :return: ChunkedByteStream object
+        """
+        compressed = memoryview(bytes_)
+        pos = 0
+
+        def decompress(_n: int) -> bytes:
+            nonlocal pos
+            while pos < len(compressed):
+                chunk = compressed[pos:pos + chunk_size]
+                pos += len(chunk)
+                if decompressed := decompressor.decompress(chunk):
+                    return decompressed
+            if pos == len(compressed):
+                pos += 1
+                # zlib can hold on to the last bits of the output until flushed
+                if (flush := getattr(decompressor, "flush", None)) is not None:
+                    return flush()
+            return b""
+
+        return cls(decompress)
+
+    @classmethod
+    def from_compressed_stream(
+        cls, stream: ChunkedByteStream, decompressor: Decompressor, chunk_size: int = 16 * 1024
+    ) -> ChunkedByteStream:
+        """
+        Create a ChunkedByteStream of the decompressed content of the remaining bytes of another chunked stream. Both
+        the compressed bytes and the decompressed content are only pulled in as the stream is read, so neither is ever
+        held in memory as a whole
+
+        :param stream: The stream positioned at the start of the compressed bytes
+        :param decompressor: The incremental decompressor to decompress the bytes with
+        :param chunk_size: The maximum number of compressed bytes to decompress at a time
+
+        :return: ChunkedByteStream object
+        """
+        flushed = False
+
+        def decompress(_n: int) -> bytes:
+            nonlocal flushed
+            while (available := stream._fill(1)) > 0:
+                if decompressed := decompressor.decompress(stream.get(min(available, chunk_size))):
+                    return decompressed
+            if not flushed:
+                flushed = True
+                if (flush := getattr(decompressor, "flush", None)) is not None:
+                    return flush()
+            return b""
+
+        return cls(decompress)
+
+    def close(self) -> None:
+        """
+        Release the source of the stream, e.g. close the file it reads from
+        """
+        if self.closer is not None:
+            self.closer()
+
+    def _fill(self, n: int) -> int:
+        """
+        Pull in content from the source until at least the specified number of bytes are available to read, or the
+        source is exhausted. Bytes which have already been read are discarded first
+
+        :param n: The number of bytes needed
+
+        :return: The number of bytes available to read
+        """
+        start = self.progress - self.offset
+        available = len(self.content) - start
+        if available >= n or self.exhausted:
+            return available
+
+        if start > 0:
+            del self.content[:start]
+            self.offset = self.progress
+
+        while available < n:
+            chunk = self.source(max(n - available, self.chunk_size) if self.read_ahead else n - available)
+            if not chunk:
+                self.exhausted = True
+                break
+            self.content += chunk
+            available += len(chunk)
+        return available
+
+    def get(self, n: int) -> bytes:
+        if n <= 0:
+            return b''
+        result = self.peek(n)
+        self.progress += n
+        return result
+
+    def peek(self, n: int) -> bytes:
+        if n <= 0:
+            return b''
+        if (available := self._fill(n)) < n:
+            raise EOFError(f"End of file reached. (Requested: {n} bytes, only {available} left.)")
+        start = self.progress - self.offset
+        return bytes(self.content[start:start + n])
+
+    def skip(self, n: int) -> None:
+        # large skips are pulled in chunk by chunk so that they are never held in memory at once
+        while n > 0:
+            if (available := self._fill(min(n, self.chunk_size))) == 0:
+                raise EOFError(f"End of file reached. (Requested: {n} more bytes, only 0 left.)")
+            step = min(n, available)
+            self.progress += step
+            n -= step
+
+    def remaining(self) -> bytes:
+        return self.get(self.remaining_len())
+
+    def remaining_len(self) -> int:
+        while not self.exhausted:
+            self._fill(len(self.content) - (self.progress - self.offset) + self.chunk_size)
+        return len(self.content) - (self.progress - self.offset)
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import bz2
+import lzma
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+
+from binary_file_parser.errors import CompressionError
+from binary_file_parser.types.chunked_byte_stream import Decompressor
+from binary_file_parser.types.compressing_writer import Compressor
+
+
+class Codec(ABC):
+    """
+    A compression format for the compressed sections of structs. Set ``_codec`` on a struct to use one instead of
+    defining ``_compress``/``_decompress`` by hand. With ``threads`` > 1, payloads larger than ``block_size`` are split
+    into blocks which are compressed independently in a thread pool, for the formats which allow it. The compression
+    functions of zlib, bz2 and lzma release the GIL, so the blocks are compressed in parallel
+    """
+    __slots__ = "level", "threads", "block_size"
+
+    splittable = False
+    """True if blocks compressed independently can be joined into a single valid compressed payload"""
+
+    def __init__(self, level: int, *, threads: int = 1, block_size: int = 1024 * 1024):
+        """
+        :param level: The compression level, higher levels compress better but slower
+        :param threads: The number of threads to compress blocks in
+        :param block_size: The number of uncompressed bytes in each block
+        """
+        self.level = level
+        self.threads = threads
+        self.block_size = block_size
+
+    @abstractmethod
+    def _compressobj(self) -> Compressor:
+        """:return: A new incremental compressor for a single (complete) compressed payload"""
+
+    @abstractmethod
+    def _decompressobj(self) -> Decompressor:
+        """:return: A new incremental decompressor for a single compressed payload"""
+
+    def _compress_block(self, bytes_: bytes, last: bool) -> bytes:
+        """
+        :param bytes_: The uncompressed bytes of a block
+        :param last: True if this is the last block of the payload
+
+        :return: The compressed bytes of the block
+        """
+        compressor = self._compressobj()
+        return compressor.compress(bytes_) + compressor.flush()
+
+    def _header(self) -> bytes:
+        """:return: The bytes to write before the compressed blocks"""
+        return b""
+
+    def _trailer(self, checksum: int | None) -> bytes:
+        """
+        :param checksum: The checksum of all the uncompressed bytes
+
+        :return: The bytes to write after the compressed blocks
+        """
+        return b""
+
+    def _checksum(self, bytes_: bytes, checksum: int | None) -> int | None:
+        """
+        :param bytes_: The next uncompressed bytes
+        :param checksum: The checksum of the uncompressed bytes before them, or None for the first bytes
+
+        :return: The checksum including the given bytes, or None if the format does not need one
+        """
+        return None
+
+    def compressor(self) -> Compressor:
+        """
+        :return: A new incremental compressor, which compresses blocks in parallel if ``threads`` > 1
+        """
+        if self.threads > 1 and self.splittable:
+            return BlockCompressor(self)
+        return self._compressobj()
+
+    def decompressor(self) -> Decompressor:
+        """
+        :return: A new incremental decompressor
+        """
+        if self.splittable:
+            # payloads compressed in blocks consist of many complete payloads back to back
+            return MultiDecompressor(self._decompressobj)
+        return self._decompressobj()
+
+    def compress(self, bytes_: bytes) -> bytes:
+        """
+        :param bytes_: The bytes to compress
+
+        :return: The compressed bytes
+        """
+        compressor = self.compressor()
+        return compressor.compress(bytes_) + compressor.flush()
+
+    def decompress(self, bytes_: bytes) -> bytes:
+        """
+        :param bytes_: The bytes to decompress
+
+        :return: The decompressed bytes
+
+        :raises CompressionError: If the bytes end before the end of the compressed payload
+        """
+        decompressor = self.decompressor()
+        decompressed = decompressor.decompress(bytes_)
+        if not decompressor.eof:
+            raise CompressionError("The compressed bytes ended before the end of the compressed payload")
+        return decompressed
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(level = {self.level}, threads = {self.threads})"
+
+
+class DeflateCodec(Codec):
+    """
+    The deflate format used by zlib. ``wbits`` selects the container and the window size: 9 to 15 for zlib, -9 to -15
+    for raw deflate and 25 to 31 for gzip. Blocks of zlib and raw deflate payloads are joined into a single deflate
+    stream, blocks of gzip payloads into multiple gzip members
+    """
+    __slots__ = "wbits"
+
+    splittable = True
+
+    def __init__(self, level: int = 6, wbits: int = zlib.MAX_WBITS, *, threads: int = 1, block_size: int = 1024 * 1024):
+        """
+        :param level: The compression level from 0 to 9
+        :param wbits: 9 to 15 for zlib, -9 to -15 for raw deflate and 25 to 31 for gzip
+        :param threads: The number of threads to compress blocks in
+        :param block_size: The number of uncompressed bytes in each block
+        """
+        super().__init__(level, threads = threads, block_size = block_size)
+        self.wbits = wbits
+
+    def _compressobj(self) -> Compressor:
+        return zlib.compressobj(self.level, zlib.DEFLATED, self.wbits)
+
+    def _decompressobj(self) -> Decompressor:
+        return zlib.decompressobj(self.wbits)
+
+    @property
+    def _is_zlib(self) -> bool:
+        return 0 < self.wbits <= zlib.MAX_WBITS
+
+    def _compress_block(self, bytes_: bytes, last: bool) -> bytes:
+        if self.wbits > zlib.MAX_WBITS:
+            return super()._compress_block(bytes_, last)
+        # a full flush ends the block on a byte boundary without ending the stream, so the blocks can be concatenated.
+        # The window must not be larger than the one the decompressor is created with
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -abs(self.wbits))
+        return compressor.compress(bytes_) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+
+    def _header(self) -> bytes:
+        if self._is_zlib:
+            # the header encodes the window size and the compression level, so it is taken from zlib itself
+            return zlib.compressobj(self.level, zlib.DEFLATED, self.wbits).flush()[:2]
+        return b""
+
+    def _trailer(self, checksum: int | None) -> bytes:
+        if self._is_zlib:
+            return struct.pack(">I", checksum)
+        return b""
+
+    def _checksum(self, bytes_: bytes, checksum: int | None) -> int | None:
+        if self._is_zlib:
+            return zlib.adler32(bytes_, 1 if checksum is None else checksum)
+        return None
+
+    def __repr__(self) -> str:
+        return f"DeflateCodec(level = {self.level}, wbits = {self.wbits}, threads = {self.threads})"
+
+
+class Bz2Codec(Codec):
+    """The bzip2 format. Blocks are joined into multiple bzip2 streams"""
+    __slots__ = ()
+
+    splittable = True
+
+    def __init__(self, level: int = 9, *, threads: int = 1, block_size: int = 1024 * 1024):
+        """
+        :param level: The compression level from 1 to 9
+        :param threads: The number of threads to compress blocks in
+        :param block_size: The number of uncompressed bytes in each block
+        """
+        super().__init__(level, threads = threads, block_size = block_size)
+
+    def _compressobj(self) -> Compressor:
+        return bz2.BZ2Compressor(self.level)
+
+    def _decompressobj(self) -> Decompressor:
+        return bz2.BZ2Decompressor()
+
+
+class LzmaCodec(Codec):
+    """
+    The lzma formats. Blocks of ``FORMAT_XZ`` payloads are joined into multiple xz streams. ``FORMAT_ALONE`` payloads
+    cannot be split and are always compressed in a single thread
+    """
+    __slots__ = "format"
+
+    def __init__(
+        self, level: int = 6, format: int = lzma.FORMAT_XZ, *, threads: int = 1, block_size: int = 1024 * 1024
+    ):
+        """
+        :param level: The compression preset from 0 to 9
+        :param format: ``lzma.FORMAT_XZ`` or ``lzma.FORMAT_ALONE``
+        :param threads: The number of threads to compress blocks in
+        :param block_size: The number of uncompressed bytes in each block
+        """
+        super().__init__(level, threads = threads, block_size = block_size)
+        self.format = format
+
+    @property
+    def splittable(self) -> bool:
+        return self.format == lzma.FORMAT_XZ
+
+    def _compressobj(self) -> Compressor:
+        return lzma.LZMACompressor(self.format, preset = self.level)
+
+    def _decompressobj(self) -> Decompressor:
+        return lzma.LZMADecompressor(self.format)
+
+
+class BlockCompressor:
+    """
+    An incremental compressor which splits the bytes given to it into blocks and compresses them independently in a
+    thread pool. Compressed blocks are returned in order as they are completed. The thread pool is started with the
+    first block, and shut down by ``flush`` or ``close``
+    """
+    __slots__ = "codec", "executor", "pending", "buffer", "checksum", "started"
+
+    def __init__(self, codec: Codec):
+        """
+        :param codec: The codec to compress the blocks with
+        """
+        self.codec = codec
+        self.executor: ThreadPoolExecutor | None = None
+        self.pending: deque[Future] = deque()
+        self.buffer = bytearray()
+        self.checksum: int | None = None
+        self.started = False
+
+    def _submit(self, bytes_: bytes, last: bool) -> None:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers = self.codec.threads)
+        self.checksum = self.codec._checksum(bytes_, self.checksum)
+        self.pending.append(self.executor.submit(self.codec._compress_block, bytes_, last))
+
+    def _collect(self, wait: bool) -> bytes:
+        """
+        :param wait: When true, wait for all the pending blocks. Otherwise, only wait while too many blocks are pending
+
+        :return: The compressed bytes of the blocks that are complete, in order
+        """
+        out = []
+        if not self.started:
+            self.started = True
+            out.append(self.codec._header())
+        while self.pending and (wait or self.pending[0].done() or len(self.pending) > 2 * self.codec.threads):
+            out.append(self.pending.popleft().result())
+        return b"".join(out)
+
+    def compress(self, data: bytes, /) -> bytes:
+        self.buffer += data
+        block_size = self.codec.block_size
+        if len(self.buffer) < block_size:
+            return b""
+
+        end = len(self.buffer) - len(self.buffer) % block_size
+        view = memoryview(self.buffer)
+        for start in range(0, end, block_size):
+            self._submit(bytes(view[start:start + block_size]), False)
+        view.release()
+        del self.buffer[:end]
+        return self._collect(wait = False)
+
+    def flush(self) -> bytes:
+        try:
+            self._submit(bytes(self.buffer), True)
+            self.buffer.clear()
+            return self._collect(wait = True) + self.codec._trailer(self.checksum)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool. Blocks which are still pending are discarded"""
+        if self.executor is not None:
+            self.executor.shutdown(wait = False, cancel_futures = True)
+            self.executor = None
+        self.pending.clear()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class MultiDecompressor:
+    """An incremental decompressor for many complete compressed payloads back to back"""
+    __slots__ = "factory", "decompressor"
+
+    def __init__(self, factory: Callable[[], Decompressor]):
+        """
+        :param factory: A function which returns a new decompressor for a single payload
+        """
+        self.factory = factory
+        self.decompressor = factory()
+
+    @property
+    def eof(self) -> bool:
+        """True if the end of the last payload given so far has been reached"""
+        return self.decompressor.eof
+
+    def decompress(self, data: bytes, /) -> bytes:
+        out = [self.decompressor.decompress(data)]
+        while self.decompressor.eof and (data := self.decompressor.unused_data):
+            self.decompressor = self.factory()
+            out.append(self.decompressor.decompress(data))
+        return b"".join(out)
+
+
+_codecs: dict[str, Callable[..., Codec]] = {
+    "zlib": partial(DeflateCodec, wbits = zlib.MAX_WBITS),
+    "deflate": partial(DeflateCodec, wbits = -zlib.MAX_WBITS),
+    "gzip": partial(DeflateCodec, wbits = 16 + zlib.MAX_WBITS),
+    "bz2": Bz2Codec,
+    "xz": partial(LzmaCodec, format = lzma.FORMAT_XZ),
+    "lzma": partial(LzmaCodec, format = lzma.FORMAT_ALONE),
+}
+
+
+def register_codec(name: str, factory: Callable[..., Codec]) -> None:
+    """
+    Register a codec so that it can be created by name using ``get_codec``
+
+    :param name: The name of the codec
+    :param factory: A function which creates the codec from the options given to ``get_codec``
+    """
+    _codecs[name] = factory
+
+
+def get_codec(name: str, **options) -> Codec:
+    """
+    Create a registered codec. The built-in codecs are ``zlib``, ``deflate`` (raw deflate), ``gzip``, ``bz2``, ``xz``
+    and ``lzma`` (the legacy ``.lzma`` format). Usage:
+
+    >>> class Spam(BaseStruct):
+    ...     _codec = get_codec("deflate", level = 9, threads = 4)
+
+    :param name: The name of the codec
+    :param options: The options of the codec, e.g. ``level``, ``threads`` and ``block_size``
+
+    :return: The codec
+
+    :raises CompressionError: If no codec is registered with the given name
+    """
+    if (factory := _codecs.get(name)) is None:
+        raise CompressionError(f"Unknown codec {name!r}. Registered codecs are: {', '.join(_codecs)}")
+    return factory(**options)
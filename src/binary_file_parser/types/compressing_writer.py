@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import BinaryIO, Callable, Protocol
+
+
+class Compressor(Protocol):
+    """
+    The interface of incremental compressors like the ones returned by ``zlib.compressobj``. Compressors which hold on
+    to resources may also define a ``close`` method, which is called once the compressor is no longer used
+    """
+    def compress(self, data: bytes, /) -> bytes:
+        ...
+
+    def flush(self) -> bytes:
+        ...
+
+
+class CompressingWriter:
+    """A binary writer which compresses the bytes written to it incrementally before passing them on to a sink"""
+    __slots__ = "sink", "compressor"
+
+    def __init__(self, sink: BinaryIO, compressor: Compressor):
+        """
+        :param sink: The writer to write the compressed bytes to
+        :param compressor: The incremental compressor to compress the bytes with
+        """
+        self.sink = sink
+        self.compressor = compressor
+
+    def write(self, bytes_: bytes) -> int:
+        self.sink.write(self.compressor.compress(bytes_))
+        return len(bytes_)
+
+    def close(self) -> None:
+        """Write any bytes held back by the compressor to the sink. The sink itself is not closed"""
+        try:
+            self.sink.write(self.compressor.flush())
+        finally:
+            if (close := getattr(self.compressor, "close", None)) is not None:
+                close()
+
+
+class BufferedCompressingWriter:
+    """
+    A binary writer which collects all the bytes written to it and compresses them in one go when closed. Used for
+    compression functions which cannot compress incrementally
+    """
+    __slots__ = "sink", "compress", "chunks"
+
+    def __init__(self, sink: BinaryIO, compress: Callable[[bytes], bytes]):
+        """
+        :param sink: The writer to write the compressed bytes to
+        :param compress: The function to compress all the collected bytes with
+        """
+        self.sink = sink
+        self.compress = compress
+        self.chunks: list[bytes] = []
+
+    def write(self, bytes_: bytes) -> int:
+        self.chunks.append(bytes(bytes_))
+        return len(bytes_)
+
+    def close(self) -> None:
+        """Compress the collected bytes and write them to the sink. The sink itself is not closed"""
+        bytes_ = b"".join(self.chunks)
+        self.chunks.clear()
+        self.sink.write(self.compress(bytes_))
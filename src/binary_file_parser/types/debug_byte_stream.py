@@ -7,11 +7,20 @@ from binary_file_parser.types.byte_stream import ByteStream
 
 class DebugByteStream(ByteStream):
     """A stream of bytes which can be used to get or peek n number of bytes at a time"""
-    __slots__ = ()
-    reader_ret: str | None = None
+    __slots__ = "reader_ret"
+
     show_rets: set[str] = set()
     show_all: bool = False
 
+    def __init__(self, content: bytes, progress: int = 0):
+        """
+        :param content: The content of the file in bytes
+        :param progress: The number of bytes that have been read from the content
+        """
+        super().__init__(content, progress)
+        self.reader_ret: str | None = None
+        """The name of the retriever property currently being read from this stream"""
+
     def get(self, n: int) -> bytes:
         bytes_ = super().get(n)
         if self.reader_ret in self.show_rets or self.show_all:
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from contextlib import suppress
+from typing import Type, TypeVar, TYPE_CHECKING
+
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.fingerprint import schema_fingerprint
+from binary_file_parser.types.version import Version
+
+if TYPE_CHECKING:
+    from binary_file_parser.types.base_struct import BaseStruct
+
+T = TypeVar("T", bound = "BaseStruct")
+
+# bump when the layout of the snapshots changes
+SNAPSHOT_FORMAT = 1
+
+
+class FileCache:
+    """
+    A persistent cache of parsed struct objects stored in a directory on disk. Entries are keyed by the hash of the
+    content of the file, the struct class and the fingerprint of its schema, so a cached object is only reused if
+    neither the file nor the definition of the struct has changed. The parsed object is stored as a pickled snapshot,
+    which is a lot faster to load than parsing the file again. Entries are evicted in least recently used order once
+    the cache grows larger than ``max_size``, or once they have not been used for ``max_age`` seconds
+    """
+    __slots__ = "directory", "max_size", "max_age"
+
+    def __init__(self, directory: str, *, max_size: int | None = None, max_age: float | None = None):
+        """
+        :param directory: The directory to store the snapshots in. Created if it does not exist
+        :param max_size: The maximum total size of all the snapshots in bytes
+        :param max_age: The maximum number of seconds a snapshot is kept for after it was last used
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok = True)
+
+    def key(
+        self, cls: Type[BaseStruct], bytes_: bytes, *, compressed: bool = False, file_version: Version = Version((0,)),
+        strict: bool = True,
+    ) -> str:
+        """
+        :param cls: The struct class the bytes are parsed as
+        :param bytes_: The content of the file
+        :param compressed: If the file is read as a compressed file
+        :param file_version: The version of the structure the file is read as
+        :param strict: If the file is read in strict mode
+
+        :return: The key of the cache entry for the file
+        """
+        hash_ = hashlib.blake2b(bytes_, digest_size = 32)
+        hash_.update(
+            f"|{SNAPSHOT_FORMAT}|{cls.__module__}.{cls.__qualname__}|{schema_fingerprint(cls)}"
+            f"|{compressed:d}|{file_version}|{strict:d}".encode("utf-8")
+        )
+        return hash_.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def load(
+        self, cls: Type[T], file_name: str, *, compressed: bool = False, file_version: Version = Version((0,)),
+        strict: bool = True, show_progress: bool = False,
+    ) -> T:
+        """
+        Create a struct object from file, using the cached snapshot if one exists for the content of the file. On a
+        miss, the file is parsed and a snapshot of the result is stored
+
+        :param cls: The struct class to parse the file as
+        :param file_name: The path of the file to create the struct object from
+        :param compressed: When true, the file is parsed as with ``_from_compressed_file`` instead of ``_from_file``
+        :param file_version: The version of the structure to create. Overwritten if `get_version` is defined
+        :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
+        :param show_progress: When true, display a progress bar while parsing the file on a miss
+
+        :return: An instance of the struct class
+        """
+        with open(file_name, "rb") as file:
+            bytes_ = file.read()
+
+        key = self.key(cls, bytes_, compressed = compressed, file_version = file_version, strict = strict)
+        if (value := self.get(key)) is not None:
+            return value
+
+        stream = ByteStream.from_bytes(bytes_)
+        if compressed:
+            stream = cls._decompressed_stream(stream)
+        value = cls._from_stream(stream, struct_ver = file_version, strict = strict, show_progress = show_progress)
+        self.put(key, value)
+        return value
+
+    def get(self, key: str) -> BaseStruct | None:
+        """
+        :param key: The key of the cache entry
+
+        :return: The struct object stored for the key, or None if there is no (readable) entry for it
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # a corrupted or outdated snapshot is treated as a miss and replaced
+            self._remove(path)
+            return None
+        # the modification time of a snapshot tracks when it was last used
+        with suppress(OSError):
+            os.utime(path)
+        return value
+
+    def put(self, key: str, value: BaseStruct) -> None:
+        """
+        Store a snapshot of a struct object and evict old entries if the cache has grown too large
+
+        :param key: The key of the cache entry
+        :param value: The struct object to store
+        """
+        fd, tmp_path = tempfile.mkstemp(dir = self.directory, suffix = ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(value, file, protocol = pickle.HIGHEST_PROTOCOL)
+            # entries are replaced atomically so that concurrent readers never see a partially written snapshot
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the entries which have not been used for longer than ``max_age``, then the least recently used entries
+        until the total size of the cache is no larger than ``max_size``
+        """
+        if self.max_size is None and self.max_age is None:
+            return
+
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".pkl"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            for mtime, _size, path in entries:
+                if mtime < cutoff:
+                    self._remove(path)
+            entries = [entry for entry in entries if entry[0] >= cutoff]
+
+        if self.max_size is not None:
+            entries.sort()
+            total = sum(size for _mtime, size, _path in entries)
+            for _mtime, size, path in entries:
+                if total <= self.max_size:
+                    break
+                self._remove(path)
+                total -= size
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache"""
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl"):
+                    self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        with suppress(OSError):
+            os.remove(path)
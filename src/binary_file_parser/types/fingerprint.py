@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+from types import CodeType
+from typing import Iterable, Type, TYPE_CHECKING
+
+from binary_file_parser.types.codec import Codec
+from binary_file_parser.types.parseable import Parseable
+
+if TYPE_CHECKING:
+    from binary_file_parser.types.base_struct import BaseStruct
+
+_fingerprints: dict[Type[BaseStruct], str] = {}
+
+_LAYOUT_ATTRS = ("_size", "struct_symbol", "dtype", "stype", "length", "num_arrays", "num_strings")
+"""The attributes of data types which determine how their values are laid out in bytes"""
+_STRUCT_METHODS = ("_get_version", "_decompress", "_decompressor")
+"""The methods of struct classes which determine how their bytes are read"""
+
+
+def schema_fingerprint(cls: Type[BaseStruct]) -> str:
+    """
+    Compute a fingerprint of the binary layout described by a struct class. The fingerprint changes whenever a
+    retriever is added, removed, renamed or reordered, its data type, versions, repeat or read hooks change, or the
+    struct class overrides ``_get_version``, ``_decompress``, ``_decompressor`` or ``_codec`` differently. It is stable
+    across processes, so it can be used to tell whether data parsed with an older definition of the struct is still
+    valid
+
+    :param cls: The struct class to fingerprint
+
+    :return: A hex digest
+    """
+    if (fingerprint := _fingerprints.get(cls)) is None:
+        fingerprint = _fingerprints[cls] = hashlib.blake2b(
+            _describe(cls).encode("utf-8"), digest_size = 16
+        ).hexdigest()
+    return fingerprint
+
+
+def _describe(obj: object) -> str:
+    """
+    :param obj: A struct class, data type, or one of their attributes
+
+    :return: A description of the object which only depends on its definition
+    """
+    if isinstance(obj, type):
+        if hasattr(obj, "_retrievers"):
+            retrievers = ", ".join(
+                f"{retriever.p_name}: {_describe(retriever.dtype)} [{retriever.min_ver}, {retriever.max_ver}] "
+                f"x{retriever._repeat} c{retriever.remaining_compressed:d} "
+                f"{_describe(retriever.on_read)} {_describe(retriever.on_set)} {_describe(retriever.mappers)}"
+                for retriever in obj._retrievers
+            )
+            methods = " ".join(_describe(getattr(obj, name)) for name in _STRUCT_METHODS)
+            return f"{obj.__module__}.{obj.__qualname__}({retrievers}) {methods} {_describe(obj._codec)}"
+        return f"{obj.__module__}.{obj.__qualname__}"
+    if isinstance(obj, Parseable):
+        # only the definition of the data type is described, not any state that changes while values are read
+        return _describe_attrs(obj, _LAYOUT_ATTRS)
+    if isinstance(obj, Codec):
+        return _describe_attrs(obj, _slot_names(obj.__class__))
+    if isinstance(obj, (list, tuple)):
+        return f"[{', '.join(map(_describe, obj))}]"
+    if isinstance(obj, struct.Struct):
+        return obj.format
+    if callable(obj):
+        func = getattr(obj, "__func__", obj)
+        name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', func.__class__.__qualname__)}"
+        if (code := getattr(func, "__code__", None)) is not None:
+            return f"{name}<{_describe_code(code)}>"
+        return name
+    return repr(obj)
+
+
+def _describe_attrs(obj: object, names: Iterable[str]) -> str:
+    """
+    :param obj: A data type or codec
+    :param names: The names of the attributes to describe, the ones the object does not have are left out
+
+    :return: A description of the class of the object and the given attributes
+    """
+    attrs = ", ".join(f"{name} = {_describe(getattr(obj, name))}" for name in names if hasattr(obj, name))
+    return f"{_describe(obj.__class__)}({attrs})"
+
+
+def _slot_names(cls: type) -> list[str]:
+    """
+    :param cls: A class
+
+    :return: The names of the slots of the class and its base classes
+    """
+    names = []
+    for cls_ in reversed(cls.__mro__):
+        slots = getattr(cls_, "__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return names
+
+
+def _describe_code(code: CodeType) -> str:
+    """
+    :param code: The code object of a function
+
+    :return: A digest of the bytecode of the function, which changes when its body is changed
+    """
+    consts = [_describe_const(const) for const in code.co_consts]
+    return hashlib.blake2b(
+        f"{code.co_code.hex()} {code.co_names} {consts}".encode("utf-8"), digest_size = 8
+    ).hexdigest()
+
+
+def _describe_const(const: object) -> str:
+    """
+    :param const: A constant of a code object
+
+    :return: A description of the constant which is the same in every process
+    """
+    if isinstance(const, CodeType):
+        return _describe_code(const)
+    if isinstance(const, frozenset):
+        # the iteration order of sets of strings depends on the hash seed of the process
+        return f"frozenset({sorted(map(_describe_const, const))})"
+    if isinstance(const, tuple):
+        return f"({', '.join(map(_describe_const, const))})"
+    return repr(const)
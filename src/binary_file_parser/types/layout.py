@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterator, NamedTuple
+
+
+class LayoutEntry(NamedTuple):
+    path: str
+    """The path of the value from the root struct, e.g. ``header.name`` or ``pixels[2].red``"""
+    offset: int
+    """The position of the first byte of the value in its section"""
+    size: int
+    """The number of bytes of the value"""
+    section: int
+    """0 for the stream the root struct was read from, otherwise the number of the decompressed section"""
+
+
+class Layout:
+    """
+    The positions and sizes of every retriever property and every (nested) struct object read from a stream. Entries are
+    stored in flat arrays in the order that they were read, and their paths are only built when they are queried
+    """
+    __slots__ = (
+        "parents", "names", "offsets", "sizes", "sections", "strings", "_string_ids", "_stack", "section",
+        "_num_sections", "_index",
+    )
+
+    def __init__(self):
+        self.parents = array("q")
+        """The index of the parent entry of each entry, -1 for the root"""
+        self.names = array("q")
+        """For each entry, the index of its name in ``strings``, or -(i+1) for the i-th struct in its parent"""
+        self.offsets = array("q")
+        self.sizes = array("q")
+        self.sections = array("q")
+        self.strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self._stack: list[list[int]] = []
+        self.section = 0
+        self._num_sections = 1
+        self._index: dict[str, int] | None = None
+
+    def _add(self, parent: int, name: int, offset: int, section: int) -> int:
+        self.parents.append(parent)
+        self.names.append(name)
+        self.offsets.append(offset)
+        self.sizes.append(0)
+        self.sections.append(section)
+        self._index = None
+        return len(self.parents) - 1
+
+    def _string_id(self, name: str) -> int:
+        if (id_ := self._string_ids.get(name)) is None:
+            id_ = self._string_ids[name] = len(self.strings)
+            self.strings.append(name)
+        return id_
+
+    def begin_struct(self, offset: int) -> int:
+        """
+        Record the start of a struct object. Struct objects read while a retriever property is being read are recorded
+        as its elements, unless the retriever property holds a single struct object, which shares its entry
+
+        :param offset: The position of the struct object in the current section
+
+        :return: The index of the entry of the struct object
+        """
+        if not self._stack:
+            idx = self._add(-1, self._string_id(""), offset, self.section)
+        elif (frame := self._stack[-1])[1] == -1:
+            idx = frame[0]
+            frame[1] = 0
+        else:
+            idx = self._add(frame[0], -(frame[1] + 1), offset, self.section)
+            frame[1] += 1
+        self._stack.append([idx, 0])
+        return idx
+
+    def begin(self, name: str, offset: int, single: bool = False) -> int:
+        """
+        Record the start of a retriever property of the struct object currently being read
+
+        :param name: The name of the retriever property
+        :param offset: The position of the retriever property in the current section
+        :param single:
+            If the value is a single struct object instead of a list of them. The entries of its retriever properties
+            are then recorded directly under the entry of the retriever property, e.g. as ``header.name`` instead of
+            ``header[0].name``
+
+        :return: The index of the entry of the retriever property
+        """
+        idx = self._add(self._stack[-1][0], self._string_id(name), offset, self.section)
+        self._stack.append([idx, -1 if single else 0])
+        return idx
+
+    def end(self, offset: int) -> None:
+        """
+        Record the end of the struct object or retriever property which was started last
+
+        :param offset: The position of the end of the value in the current section
+        """
+        idx = self._stack.pop()[0]
+        self.sizes[idx] = offset - self.offsets[idx]
+
+    def add(self, name: str, offset: int, size: int) -> None:
+        """
+        Record a retriever property of the struct object currently being read, which does not contain struct objects
+
+        :param name: The name of the retriever property
+        :param offset: The position of the retriever property in the current section
+        :param size: The number of bytes of the retriever property
+        """
+        idx = self._add(self._stack[-1][0], self._string_id(name), offset, self.section)
+        self.sizes[idx] = size
+
+    def new_section(self) -> int:
+        """
+        Start recording the entries of a new decompressed section
+
+        :return: The section that was being recorded before
+        """
+        prev, self.section = self.section, self._num_sections
+        self._num_sections += 1
+        return prev
+
+    def path(self, idx: int) -> str:
+        """
+        :param idx: The index of an entry
+
+        :return: The path of the entry from the root struct
+        """
+        parts = []
+        while (parent := self.parents[idx]) != -1:
+            name = self.names[idx]
+            if name >= 0:
+                parts.append(f".{self.strings[name]}")
+            else:
+                parts.append(f"[{-name - 1}]")
+            idx = parent
+        return "".join(reversed(parts)).removeprefix(".")
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def __getitem__(self, idx: int) -> LayoutEntry:
+        return LayoutEntry(self.path(idx), self.offsets[idx], self.sizes[idx], self.sections[idx])
+
+    def __iter__(self) -> Iterator[LayoutEntry]:
+        return (self[idx] for idx in range(len(self)))
+
+    def find(self, path: str) -> LayoutEntry | None:
+        """
+        :param path: The path of a value from the root struct, e.g. ``header.name`` or ``pixels[2].red``
+
+        :return: The entry of the value, or None if there is no value with that path
+        """
+        if self._index is None:
+            self._index = {self.path(idx): idx for idx in range(len(self))}
+        if (idx := self._index.get(path)) is None:
+            return None
+        return self[idx]
+
+    def at(self, offset: int, section: int = 0) -> LayoutEntry | None:
+        """
+        :param offset: A position in a section
+        :param section: The section to look in
+
+        :return: The innermost entry which the byte at the given position belongs to, or None if there is none
+        """
+        best = None
+        for idx in range(len(self)):
+            if (
+                self.sections[idx] == section
+                and self.offsets[idx] <= offset < self.offsets[idx] + self.sizes[idx]
+                and (best is None or self.sizes[idx] <= self.sizes[best])
+            ):
+                best = idx
+        return None if best is None else self[best]
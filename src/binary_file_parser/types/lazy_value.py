@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Type
+
+from binary_file_parser.types.byte_stream import ByteStream
+
+
+class LazyValue:
+    """
+    The location of the bytes of a lazily read retriever property in the content of the stream it was read from. Used
+    to decode the property when it is accessed for the first time, or to copy its bytes as they are when it is written
+    without ever being accessed
+    """
+    __slots__ = "stream_cls", "content", "start", "end", "repeat"
+
+    def __init__(self, stream: ByteStream, start: int, repeat: int | None = None):
+        """
+        :param stream: The stream that the retriever property was skipped over in. Its current position is the end
+        :param start: The position in the stream at which the bytes of the retriever property start
+        :param repeat: The number of values to read as a list, or None if a single value is to be read
+        """
+        self.stream_cls: Type[ByteStream] = stream.__class__
+        self.content = stream.content
+        stream.retained = True
+        self.start = start
+        self.end = stream.progress
+        self.repeat = repeat
+
+    def stream(self) -> ByteStream:
+        """
+        :return: A new stream over the same content, positioned at the start of the retriever property
+        """
+        return self.stream_cls(self.content, self.start)
+
+    def view(self) -> memoryview:
+        """
+        :return: A view of the bytes of the retriever property, without copying them
+        """
+        return memoryview(self.content)[self.start:self.end]
+
+    def bytes(self) -> bytes:
+        """
+        :return: A copy of the bytes of the retriever property
+        """
+        return bytes(self.content[self.start:self.end])
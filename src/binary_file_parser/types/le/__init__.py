@@ -2,11 +2,18 @@ from .array import (
     Array8, Array16, Array32, Array64, FixedLenArray, StackedArray8s, StackedArray16s, StackedArray32s, StackedArray64s,
     StackedAttrArray8, StackedAttrArray16, StackedAttrArray32, StackedAttrArray64,
 )
+from .attr_columns import (
+    AttrColumns, AttrRow, StackedAttrColumns8, StackedAttrColumns16, StackedAttrColumns32, StackedAttrColumns64,
+)
 from .bool import bool8, bool16, bool32, bool64
 from .bytes import Bytes, void
 
 from .float import float16, float32, float64
 from .int import int8, int16, int32, int64, uint8, uint16, uint32, uint64
+from .np_array import (
+    NpArray8, NpArray16, NpArray32, NpArray64, NpFixedLenArray, NpStackedArray8s, NpStackedArray16s, NpStackedArray32s,
+    NpStackedArray64s,
+)
 
 from .option import Option8, Option16, Option32, Option64
 
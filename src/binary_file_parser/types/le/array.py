@@ -3,7 +3,7 @@ from __future__ import annotations
 import itertools
 import struct
 from contextlib import suppress
-from typing import Type, TYPE_CHECKING
+from typing import BinaryIO, Type, TYPE_CHECKING
 
 from binary_file_parser.errors import VersionError
 from binary_file_parser.types.le.option import Option
@@ -24,33 +24,58 @@ class BaseArray(Parseable):
         self.struct_symbol = struct_symbol
         self.length = -1
 
+    def _read_elements(self, stream: ByteStream, length: int, struct_ver: Version) -> list:
+        """Read the specified number of elements of this array's type from the stream"""
+        return self.dtype._from_stream_many(stream, length, struct_ver = struct_ver)
+
+    def _write_elements(self, value: list) -> bytes:
+        """Convert the elements of the given array to bytes, without any length information"""
+        return self.dtype._to_bytes_many(value)
+
+    def _stream_elements(self, value: list, writer: BinaryIO) -> None:
+        """Write the elements of the given array to a binary writer, without any length information"""
+        self.dtype._to_stream_many(value, writer)
+
+    def _skip_elements(self, stream: ByteStream, length: int, struct_ver: Version) -> None:
+        """Advance the stream past the specified number of elements of this array's type"""
+        if (size := self.dtype._static_size(struct_ver)) is not None:
+            stream.skip(size * length)
+            return
+        for _ in range(length):
+            self.dtype._skip(stream, struct_ver = struct_ver)
+
     def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> list:
-        return [
-            self.dtype._from_stream(stream, struct_ver = struct_ver)
-            for _ in range(self.length)
-        ]
+        return self._read_elements(stream, self.length, struct_ver)
 
     def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))) -> list:
         return self._from_stream(ByteStream.from_bytes(bytes_), struct_ver = struct_ver)
 
     def _to_bytes(self, value: list) -> bytes:
-        return b"".join(
-            self.dtype._to_bytes(val)
-            for val in value
-        )
+        return self._write_elements(value)
+
+    def _to_stream(self, value: list, writer: BinaryIO) -> None:
+        self._stream_elements(value, writer)
 
 class Array(BaseArray):
     __slots__ = ()
 
     def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> list:
-        self.length = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
-        return super()._from_stream(stream, struct_ver = struct_ver)
+        # the length is kept local, dtypes are shared by every stream being read at the same time
+        length = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        return self._read_elements(stream, length, struct_ver)
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        length = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        self._skip_elements(stream, length, struct_ver)
 
     def _to_bytes(self, value: list) -> bytes:
-        self.length = len(value)
-        length_bytes = struct.pack(self.struct_symbol, self.length)
+        length_bytes = struct.pack(self.struct_symbol, len(value))
         return length_bytes+super()._to_bytes(value)
 
+    def _to_stream(self, value: list, writer: BinaryIO) -> None:
+        writer.write(struct.pack(self.struct_symbol, len(value)))
+        super()._to_stream(value, writer)
+
 class Array8(Array):
     """
     Represents an array whose length is indicated by a uint8 followed by that many elements of the indicated type.
@@ -113,11 +138,24 @@ class FixedLenArray(BaseArray):
         super().__init__(size, dtype, struct_symbol)
         self.length = length
 
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        if (size := self.dtype._static_size(struct_ver)) is None:
+            return None
+        return size * self.length
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        self._skip_elements(stream, self.length, struct_ver)
+
     def _to_bytes(self, value: list) -> bytes:
         if len(value) != self.length:
             raise TypeError(f"Expected FixedLenArray[{self.length}], found array with length: {len(value)}")
         return super()._to_bytes(value)
 
+    def _to_stream(self, value: list, writer: BinaryIO) -> None:
+        if len(value) != self.length:
+            raise TypeError(f"Expected FixedLenArray[{self.length}], found array with length: {len(value)}")
+        super()._to_stream(value, writer)
+
     def __class_getitem__(cls, item: tuple[ParseableType, int]) -> FixedLenArray:
         return cls(item[1], item[0], '<I', item[1])
 
@@ -130,12 +168,10 @@ class StackedArrays(BaseArray):
         self.num_arrays = num_arrays
 
     def _read_with_length(self, stream: ByteStream, *, struct_ver: Version = Version((0,)), length: int) -> list:
-        self.length = length
-        return super()._from_stream(stream, struct_ver = struct_ver)
+        return self._read_elements(stream, length, struct_ver)
 
     def _write_with_length(self, val: list, length: int) -> bytes:
-        self.length = length
-        return super()._to_bytes(val)
+        return self._write_elements(val)
 
     def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> list[list]:
         num_arrays = self.num_arrays
@@ -152,6 +188,13 @@ class StackedArrays(BaseArray):
             for length in lengths
         ]
 
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        num_arrays = self.num_arrays
+        if num_arrays == -1:
+            num_arrays = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        lengths = struct.unpack(f"<{num_arrays}{self.struct_symbol[1:]}", stream.get(self._size * num_arrays))
+        self._skip_elements(stream, sum(lengths), struct_ver)
+
     def _to_bytes(self, value: list[list]) -> bytes:
         if self.num_arrays != -1 and len(value) != self.num_arrays:
             raise TypeError(f"Expected {self.num_arrays} StackedArrays, found {len(value)}")
@@ -177,6 +220,17 @@ class StackedArrays(BaseArray):
             ls_bytes
         ))
 
+    def _to_stream(self, value: list[list], writer: BinaryIO) -> None:
+        if self.num_arrays != -1 and len(value) != self.num_arrays:
+            raise TypeError(f"Expected {self.num_arrays} StackedArrays, found {len(value)}")
+
+        if self.num_arrays == -1:
+            writer.write(struct.pack(self.struct_symbol, len(value)))
+        for ls in value:
+            writer.write(struct.pack(self.struct_symbol, len(ls)))
+        for ls in value:
+            self._stream_elements(ls, writer)
+
 
 class StackedArray8s(StackedArrays):
     """
@@ -295,6 +349,39 @@ class StackedAttrArray(BaseArray):
 
         return instances
 
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        if self.length == -1 or isinstance(self.stype, Option):
+            return None
+        if (size := self.stype._static_size(struct_ver)) is None:
+            return None
+        return size * self.length
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        size = None if isinstance(self.stype, Option) else self.stype._static_size(struct_ver)
+        if size is None and not isinstance(self.stype, Option):
+            # the attributes of all the elements are interleaved and their sizes are not known up front
+            self._from_stream(stream, struct_ver = struct_ver)
+            return
+
+        length = self.length
+        if length == -1:
+            length = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        if size is not None:
+            stream.skip(size * length)
+            return
+
+        exists = struct.unpack(
+            f"<{self.stype.struct_symbol[1:] * length}",
+            stream.get(self.stype._size * length)
+        )
+        dtype = self.stype.dtype
+        if (size := dtype._static_size(struct_ver)) is not None:
+            stream.skip(size * sum(map(bool, exists)))
+            return
+        for does_exist in exists:
+            if does_exist:
+                dtype._skip(stream, struct_ver = struct_ver)
+
     def _to_bytes(self, value: list) -> bytes:
         if self.length != -1 and len(value) != self.length:
             raise TypeError(f"Expected an array of length {self.length}, found array with length: {len(value)}")
@@ -316,6 +403,21 @@ class StackedAttrArray(BaseArray):
 
         return length_bytes+b"".join(ls_bytes)
 
+    def _to_stream(self, value: list, writer: BinaryIO) -> None:
+        if self.length != -1 and len(value) != self.length:
+            raise TypeError(f"Expected an array of length {self.length}, found array with length: {len(value)}")
+
+        if self.length == -1:
+            writer.write(struct.pack(self.struct_symbol, len(value)))
+
+        if isinstance(self.stype, Option):
+            writer.write(self._write_opt(value, len(value)))
+            return
+
+        for retriever in self.stype._retrievers:
+            for instance in value:
+                retriever.to_stream(instance, writer)
+
 class StackedAttrArray8(StackedAttrArray):
     """
     Represents an array of struct objects where the number of objects is indicated by a ``uint8``, followed by a list of
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import struct
+from contextlib import suppress
+from typing import BinaryIO, Iterator, Type, TYPE_CHECKING
+
+from binary_file_parser.errors import VersionError
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.le.array import StackedAttrArray
+from binary_file_parser.types.version import Version
+from binary_file_parser.utils import equal
+
+if TYPE_CHECKING:
+    from binary_file_parser.retrievers import Retriever
+    from binary_file_parser.types.base_struct import BaseStruct
+
+
+class AttrRow:
+    """
+    A view of a single row of an ``AttrColumns`` container. Reading or assigning an attribute of the row reads from or
+    assigns to the corresponding column directly
+    """
+    __slots__ = "_columns", "_idx"
+
+    def __init__(self, columns: AttrColumns, idx: int):
+        """
+        :param columns: The container this row belongs to
+        :param idx: The index of the row in the container
+        """
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_idx", idx)
+
+    def __getattr__(self, name: str):
+        try:
+            return self._columns.columns[name][self._idx]
+        except KeyError:
+            raise AttributeError(f"{self._columns.stype.__name__!r} row has no attribute {name!r}") from None
+
+    def __setattr__(self, name: str, value) -> None:
+        if name not in self._columns.columns:
+            raise AttributeError(f"{self._columns.stype.__name__!r} row has no attribute {name!r}")
+        self._columns.columns[name][self._idx] = value
+
+    def _to_struct(self) -> BaseStruct:
+        """
+        :return: A new struct object holding a copy of the values of this row
+        """
+        return self._columns.stype(self._columns.struct_ver, **{
+            name: column[self._idx] for name, column in self._columns.columns.items()
+        })
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name} = {column[self._idx]!r}" for name, column in self._columns.columns.items())
+        return f"{self._columns.stype.__name__}Row({values})"
+
+
+class AttrColumns:
+    """
+    The elements of a ``StackedAttrColumns`` array stored column by column, one list per retriever of the element
+    struct. Rows are views created on demand, so no struct objects are created unless asked for
+    """
+    __slots__ = "stype", "struct_ver", "columns"
+
+    def __init__(self, stype: Type[BaseStruct], columns: dict[str, list], struct_ver: Version = Version((0,))):
+        """
+        :param stype: The struct type of the rows
+        :param columns: The values of every supported retriever of the struct type, mapped by retriever name
+        :param struct_ver: The struct version of the rows
+        """
+        self.stype = stype
+        self.columns = columns
+        self.struct_ver = struct_ver
+
+    @classmethod
+    def from_structs(
+        cls, stype: Type[BaseStruct], structs: list[BaseStruct], struct_ver: Version = Version((0,))
+    ) -> AttrColumns:
+        """
+        Create a column container from a list of struct objects
+
+        :param stype: The struct type of the rows
+        :param structs: The struct objects to copy the values of
+        :param struct_ver: The struct version of the rows
+
+        :return: AttrColumns object
+        """
+        return cls(stype, {
+            retriever.p_name: [getattr(struct_, retriever.p_name) for struct_ in structs]
+            for retriever in stype._retrievers
+            if retriever.supported(struct_ver)
+        }, struct_ver)
+
+    def column(self, name: str) -> list:
+        """
+        :param name: The name of the retriever to get the column of
+
+        :return: The list holding the values of the retriever for every row
+        """
+        return self.columns[name]
+
+    def _to_structs(self) -> list[BaseStruct]:
+        """
+        :return: A list of new struct objects, one for each row
+        """
+        return [row._to_struct() for row in self]
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, idx: int) -> AttrRow:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("AttrColumns index out of range")
+        return AttrRow(self, idx)
+
+    def __iter__(self) -> Iterator[AttrRow]:
+        return (AttrRow(self, idx) for idx in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AttrColumns):
+            return NotImplemented
+        return (
+            self.stype is other.stype
+            and self.struct_ver == other.struct_ver
+            and self.columns.keys() == other.columns.keys()
+            and all(equal(column, other.columns[name]) for name, column in self.columns.items())
+        )
+
+    def __repr__(self) -> str:
+        return f"AttrColumns[{self.stype.__name__}]({self.columns!r})"
+
+
+class StackedAttrColumns(StackedAttrArray):
+    """
+    Same layout as ``StackedAttrArray``, but the elements are read column by column into an ``AttrColumns``
+    container instead of creating one struct object per element. Every column is read and written in one go. The
+    retrievers of the element struct must not have any hooks or repeats
+    """
+    def __init__(self, size: int, dtype: Type[BaseStruct], struct_symbol: str, length: int = -1):
+        if not hasattr(dtype, "_retrievers"):
+            raise TypeError(f"{self.__class__.__name__} can only be used with BaseStruct types")
+        for retriever in dtype._retrievers:
+            if not is_columnar(retriever):
+                raise TypeError(
+                    f"{retriever.p_name!r} of {dtype.__name__!r} cannot be read as a column, only retrievers without "
+                    f"any hooks or repeats can"
+                )
+        super().__init__(size, dtype, struct_symbol, length)
+
+    def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> AttrColumns:
+        length = self.length
+        if length == -1:
+            length = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+
+        # like StackedAttrArray._read_with_ver, _get_version is called once per element and the version of the parent
+        # is kept. Un-versioned structs raise on the first call, which also stops the calls for the other elements
+        with suppress(VersionError):
+            for _ in range(length):
+                self.stype._get_version(stream, struct_ver)
+
+        return AttrColumns(self.stype, {
+            retriever.p_name: retriever.dtype._from_stream_many(stream, length, struct_ver = struct_ver)
+            for retriever in self.stype._retrievers
+            if retriever.supported(struct_ver)
+        }, struct_ver)
+
+    def _as_columns(self, value: AttrColumns | list[BaseStruct]) -> AttrColumns:
+        if isinstance(value, list):
+            struct_ver = value[0].struct_ver if len(value) > 0 else Version((0,))
+            value = AttrColumns.from_structs(self.stype, value, struct_ver)
+        if self.length != -1 and len(value) != self.length:
+            raise TypeError(f"Expected an array of length {self.length}, found array with length: {len(value)}")
+        if any(len(column) != len(value) for column in value.columns.values()):
+            raise ValueError(f"All the columns of {self.stype.__name__!r} must have the same length")
+        return value
+
+    def _to_bytes(self, value: AttrColumns | list[BaseStruct]) -> bytes:
+        value = self._as_columns(value)
+
+        length_bytes = b""
+        if self.length == -1:
+            length_bytes = struct.pack(self.struct_symbol, len(value))
+
+        return length_bytes + b"".join(
+            retriever.dtype._to_bytes_many(value.columns[retriever.p_name])
+            for retriever in self.stype._retrievers
+            if retriever.supported(value.struct_ver)
+        )
+
+    def _to_stream(self, value: AttrColumns | list[BaseStruct], writer: BinaryIO) -> None:
+        value = self._as_columns(value)
+
+        if self.length == -1:
+            writer.write(struct.pack(self.struct_symbol, len(value)))
+
+        for retriever in self.stype._retrievers:
+            if retriever.supported(value.struct_ver):
+                retriever.dtype._to_stream_many(value.columns[retriever.p_name], writer)
+
+
+def is_columnar(retriever: Retriever) -> bool:
+    """
+    :param retriever: The retriever to check
+
+    :return: true if the values of the retriever for many struct objects can be read/written as a single column
+    """
+    return (
+        retriever._repeat == 1
+        and not retriever.remaining_compressed
+        and not (
+            retriever.on_read or retriever.on_write or retriever.on_get or retriever.on_set
+            or retriever.mappers or retriever.validators
+        )
+    )
+
+
+class StackedAttrColumns8(StackedAttrColumns):
+    """
+    Same as ``StackedAttrArray8``, but the elements are read column by column into an ``AttrColumns`` container
+
+    >>> StackedAttrColumns8[BaseStruct]
+    >>> StackedAttrColumns8[BaseStruct, 4] # indicate the number of objects as fixed. This excludes it from being read from/written to bytes
+    """
+    __slots__ = ()
+
+    def __class_getitem__(cls, item: Type[BaseStruct] | tuple[Type[BaseStruct], int]) -> StackedAttrColumns:
+        if isinstance(item, tuple):
+            return cls(1, item[0], '<B', item[1])
+        return cls(1, item, '<B')
+
+
+class StackedAttrColumns16(StackedAttrColumns):
+    """
+    Same as ``StackedAttrArray16``, but the elements are read column by column into an ``AttrColumns`` container
+
+    >>> StackedAttrColumns16[BaseStruct]
+    >>> StackedAttrColumns16[BaseStruct, 4] # indicate the number of objects as fixed. This excludes it from being read from/written to bytes
+    """
+    __slots__ = ()
+
+    def __class_getitem__(cls, item: Type[BaseStruct] | tuple[Type[BaseStruct], int]) -> StackedAttrColumns:
+        if isinstance(item, tuple):
+            return cls(2, item[0], '<H', item[1])
+        return cls(2, item, '<H')
+
+
+class StackedAttrColumns32(StackedAttrColumns):
+    """
+    Same as ``StackedAttrArray32``, but the elements are read column by column into an ``AttrColumns`` container
+
+    >>> StackedAttrColumns32[BaseStruct]
+    >>> StackedAttrColumns32[BaseStruct, 4] # indicate the number of objects as fixed. This excludes it from being read from/written to bytes
+    """
+    __slots__ = ()
+
+    def __class_getitem__(cls, item: Type[BaseStruct] | tuple[Type[BaseStruct], int]) -> StackedAttrColumns:
+        if isinstance(item, tuple):
+            return cls(4, item[0], '<I', item[1])
+        return cls(4, item, '<I')
+
+
+class StackedAttrColumns64(StackedAttrColumns):
+    """
+    Same as ``StackedAttrArray64``, but the elements are read column by column into an ``AttrColumns`` container
+
+    >>> StackedAttrColumns64[BaseStruct]
+    >>> StackedAttrColumns64[BaseStruct, 4] # indicate the number of objects as fixed. This excludes it from being read from/written to bytes
+    """
+    __slots__ = ()
+
+    def __class_getitem__(cls, item: Type[BaseStruct] | tuple[Type[BaseStruct], int]) -> StackedAttrColumns:
+        if isinstance(item, tuple):
+            return cls(8, item[0], '<Q', item[1])
+        return cls(8, item, '<Q')
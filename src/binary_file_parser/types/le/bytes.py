@@ -14,10 +14,16 @@ class Bytes(Parseable):
     __slots__ = ()
 
     def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> bytes:
-        return stream.get(self._size)
+        return bytes(stream.get(self._size))
+
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        return self._size
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        stream.skip(self._size)
 
     def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))) -> bytes:
-        return bytes_
+        return bytes(bytes_)
 
     def _to_bytes(self, value: bytes) -> bytes:
         if len(value) != self._size:
@@ -1,25 +1,42 @@
 import struct
+from typing import BinaryIO
 
-from binary_file_parser.types.parseable import Parseable
 from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.le.primitive import Primitive
 from binary_file_parser.types.version import Version
 
 
-class Int(Parseable):
-    __slots__ = "struct_symbol"
+class Int(Primitive):
+    __slots__ = "struct_symbol", "struct"
 
     def __init__(self, size: int, struct_symbol: str):
         super().__init__(size)
         self.struct_symbol = struct_symbol
+        self.struct = struct.Struct(struct_symbol)
 
     def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> int:
-        return self._from_bytes(stream.get(self._size), struct_ver = struct_ver)
+        return stream.unpack(self.struct)[0]
+
+    def _from_stream_many(self, stream: ByteStream, n: int, *, struct_ver: Version = Version((0,))) -> list[int]:
+        return list(struct.unpack(f"<{n}{self.struct_symbol[1:]}", stream.get(n * self._size)))
+
+    def _to_bytes_many(self, values: list[int]) -> bytes:
+        return struct.pack(f"<{len(values)}{self.struct_symbol[1:]}", *values)
+
+    def _to_stream_many(self, values: list[int], writer: BinaryIO) -> None:
+        writer.write(self._to_bytes_many(values))
+
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        return self._size
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        stream.skip(self._size)
 
     def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))) -> int:
-        return struct.unpack(self.struct_symbol, bytes_)[0]
+        return self.struct.unpack(bytes_)[0]
 
     def _to_bytes(self, value: int) -> bytes:
-        return struct.pack(self.struct_symbol, value)
+        return self.struct.pack(value)
 
 int8 = Int(1, "<b")
 int16 = Int(2, "<h")
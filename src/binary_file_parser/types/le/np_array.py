@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import BinaryIO, TYPE_CHECKING
+
+from binary_file_parser.types.le.array import (
+    Array8, Array16, Array32, Array64, BaseArray, FixedLenArray, StackedArray8s, StackedArray16s, StackedArray32s,
+    StackedArray64s,
+)
+from binary_file_parser.types.le.bool import Bool
+from binary_file_parser.types.le.float import Float
+from binary_file_parser.types.le.int import Int
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.version import Version
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from binary_file_parser.types.le.array import ParseableType
+
+
+class NpBaseArray(BaseArray):
+    """
+    Base class for arrays of ``Int``, ``Float`` or ``Bool`` types which are read as numpy arrays instead of lists. All
+    the elements of an array are decoded using a single ``np.frombuffer`` and encoded using a single ``.tobytes()``.
+    Requires numpy to be installed
+    """
+    __slots__ = ()
+
+    def __init__(self, size: int, dtype: ParseableType, struct_symbol: str, *args):
+        if np is None:
+            raise ImportError(f"numpy is required to use {self.__class__.__name__}. Install it with 'pip install numpy'")
+        if not isinstance(dtype, (Int, Float, Bool)) or not dtype._fast:
+            raise TypeError(
+                f"{self.__class__.__name__} can only be used with Int, Float or Bool types which do not override how "
+                f"values are converted"
+            )
+        super().__init__(size, dtype, struct_symbol, *args)
+
+    def _read_elements(self, stream: ByteStream, length: int, struct_ver: Version) -> ndarray:
+        np_dtype = np.dtype(self.dtype.struct_symbol)
+        # copy so that the array is writable and does not keep the content of the stream alive
+        arr = np.frombuffer(stream.get(length * np_dtype.itemsize), dtype = np_dtype).copy()
+        if isinstance(self.dtype, Bool):
+            return arr != 0
+        return arr
+
+    def _write_elements(self, value: ndarray | list) -> bytes:
+        np_dtype = np.dtype(self.dtype.struct_symbol)
+        if isinstance(self.dtype, Bool):
+            return np.asarray(value, dtype = bool).astype(np_dtype).tobytes()
+        return np.asarray(value, dtype = np_dtype).tobytes()
+
+    def _stream_elements(self, value: ndarray | list, writer: BinaryIO) -> None:
+        writer.write(self._write_elements(value))
+
+
+class NpArray8(NpBaseArray, Array8):
+    """
+    Same as ``Array8``, but the elements are read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpArray8[float32]
+    """
+    __slots__ = ()
+
+
+class NpArray16(NpBaseArray, Array16):
+    """
+    Same as ``Array16``, but the elements are read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpArray16[float32]
+    """
+    __slots__ = ()
+
+
+class NpArray32(NpBaseArray, Array32):
+    """
+    Same as ``Array32``, but the elements are read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpArray32[float32]
+    """
+    __slots__ = ()
+
+
+class NpArray64(NpBaseArray, Array64):
+    """
+    Same as ``Array64``, but the elements are read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpArray64[float32]
+    """
+    __slots__ = ()
+
+
+class NpFixedLenArray(NpBaseArray, FixedLenArray):
+    """
+    Same as ``FixedLenArray``, but the elements are read into a numpy array. Only supports ``Int``, ``Float`` or
+    ``Bool`` element types. Usage:
+
+    >>> NpFixedLenArray[float32, 5]
+    """
+    __slots__ = ()
+
+
+class NpStackedArray8s(NpBaseArray, StackedArray8s):
+    """
+    Same as ``StackedArray8s``, but each row is read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpStackedArray8s[float32]
+    >>> NpStackedArray8s[float32, 4]
+    """
+    __slots__ = ()
+
+
+class NpStackedArray16s(NpBaseArray, StackedArray16s):
+    """
+    Same as ``StackedArray16s``, but each row is read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpStackedArray16s[float32]
+    >>> NpStackedArray16s[float32, 4]
+    """
+    __slots__ = ()
+
+
+class NpStackedArray32s(NpBaseArray, StackedArray32s):
+    """
+    Same as ``StackedArray32s``, but each row is read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpStackedArray32s[float32]
+    >>> NpStackedArray32s[float32, 4]
+    """
+    __slots__ = ()
+
+
+class NpStackedArray64s(NpBaseArray, StackedArray64s):
+    """
+    Same as ``StackedArray64s``, but each row is read into a numpy array. Only supports ``Int``, ``Float`` or ``Bool``
+    element types. Usage:
+
+    >>> NpStackedArray64s[float32]
+    >>> NpStackedArray64s[float32, 4]
+    """
+    __slots__ = ()
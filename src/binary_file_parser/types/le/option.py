@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import struct
-from typing import Generic, Type, TYPE_CHECKING, TypeVar
+from typing import BinaryIO, Generic, Type, TYPE_CHECKING, TypeVar
 
 from binary_file_parser.types.parseable import Parseable
 from binary_file_parser.types.version import Version
@@ -25,6 +25,11 @@ class Option(Parseable, Generic[T]):
             return None
         return self.dtype._from_stream(stream, struct_ver = struct_ver)
 
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        exists = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        if exists:
+            self.dtype._skip(stream, struct_ver = struct_ver)
+
     def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))):
         return self._from_stream(ByteStream.from_bytes(bytes_), struct_ver = struct_ver)
 
@@ -33,6 +38,11 @@ class Option(Parseable, Generic[T]):
             return struct.pack(self.struct_symbol, False)
         return struct.pack(self.struct_symbol, True) + self.dtype._to_bytes(value)
 
+    def _to_stream(self, value: T | None, writer: BinaryIO) -> None:
+        writer.write(struct.pack(self.struct_symbol, value is not None))
+        if value is not None:
+            self.dtype._to_stream(value, writer)
+
 class Option8(Option):
     """
     Represents an optional type, the inner type is read only if the following ``uint8`` is non-zero
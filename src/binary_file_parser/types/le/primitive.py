@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.parseable import Parseable
+from binary_file_parser.types.version import Version
+
+
+class Primitive(Parseable):
+    """
+    Base class of the fixed size types which are converted using a precompiled struct: ``Int``, ``Float`` and ``Bool``.
+    Reading values straight from a stream, reading/writing many values at once and merging adjacent retrievers into a
+    ``PrimitiveRun`` all bypass ``_from_bytes`` and ``_to_bytes``. Subclasses which override ``_from_stream``,
+    ``_from_bytes`` or ``_to_bytes`` turn these shortcuts off, so that their overrides are always used
+    """
+    __slots__ = ()
+
+    _fast = True
+    """False if values of this type may not be converted with its struct directly, bypassing its overrides"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if Primitive in cls.__bases__:
+            return
+        if not any(name in cls.__dict__ for name in ("_from_stream", "_from_bytes", "_to_bytes")):
+            return
+
+        cls._fast = False
+        # methods defined by the subclass itself are kept, the inherited shortcuts are replaced
+        if "_from_stream" not in cls.__dict__:
+            cls._from_stream = Primitive._from_stream_via_bytes
+        if "_from_stream_many" not in cls.__dict__:
+            cls._from_stream_many = Parseable._from_stream_many
+        if "_to_bytes_many" not in cls.__dict__:
+            cls._to_bytes_many = Parseable._to_bytes_many
+
+    def _from_stream_via_bytes(self, stream: ByteStream, *, struct_ver: Version = Version((0,))):
+        return self._from_bytes(stream.get(self._size), struct_ver = struct_ver)
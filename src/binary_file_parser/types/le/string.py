@@ -19,10 +19,11 @@ class BaseStr(Parseable, ABC):
     __slots__ = ()
 
     def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))) -> str:
+        # str() also accepts memoryviews handed out by zero copy streams
         try:
-            return bytes_.decode("utf-8")
+            return str(bytes_, "utf-8")
         except UnicodeDecodeError:
-            return bytes_.decode("latin-1")
+            return str(bytes_, "latin-1")
 
     def _to_bytes(self, value: str) -> bytes:
         try:
@@ -39,6 +40,10 @@ class CStr(BaseStr):
             bytes_ += byte
         return self._from_bytes(bytes_)
 
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        while stream.get(1) != b"\x00":
+            pass
+
     def _to_bytes(self, value: str) -> bytes:
         if not value.endswith("\x00"):
             value += "\x00"
@@ -56,6 +61,10 @@ class Str(BaseStr):
         length: int = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
         return self._from_bytes(stream.get(length))
 
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        length: int = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        stream.skip(length)
+
     def _to_bytes(self, value: str) -> bytes:
         bytes_ = super()._to_bytes(value)
         length = struct.pack(self.struct_symbol, len(bytes_))
@@ -89,6 +98,12 @@ class FixedLenStr(BaseStr):
     def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> str:
         return self._from_bytes(stream.get(self.length))
 
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        return self.length
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        stream.skip(self.length)
+
     def __class_getitem__(cls, item: int) -> FixedLenStr:
         return cls(4, item)
 
@@ -125,6 +140,13 @@ class StrArray(BaseStr):
 
         return ls
 
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        num_strings = self.num_strings
+        if num_strings == -1:
+            num_strings = struct.unpack(self.struct_symbol, stream.get(self._size))[0]
+        lengths = struct.unpack(f"<{num_strings}{self.struct_symbol[1:]}", stream.get(self._size * num_strings))
+        stream.skip(sum(lengths))
+
     def _to_bytes(self, value: list[str]) -> bytes:
         if self.num_strings != -1 and len(value) != self.num_strings:
             raise TypeError(f"Expected {self.num_strings} StackedStrings, found {len(value)}")
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from contextlib import suppress
+
+from binary_file_parser.types.byte_stream import ByteStream
+
+
+class MemoryByteStream(ByteStream):
+    """
+    A stream of bytes backed by a ``memoryview`` of its content. Reading from it never copies the content, the
+    returned bytes are views into the content and primitives are unpacked in place. Only the final parsed values are
+    allocated
+    """
+    __slots__ = ()
+
+    def __init__(self, content: bytes | bytearray | memoryview, progress: int = 0):
+        """
+        :param content: The content of the file as a bytes-like object
+        :param progress: The number of bytes that have been read from the content
+        """
+        super().__init__(memoryview(content), progress)
+
+    def close(self) -> None:
+        """
+        Release the source of the stream once it is no longer read from. A memory mapped file is unmapped, unless the
+        values read from it still use its content (see ``retained``) or views of it, e.g. the bytes read from this
+        stream. It is then unmapped once the last of them is garbage collected
+        """
+        if self.retained or not isinstance(map_ := self.content.obj, mmap.mmap):
+            return
+        self.content.release()
+        with suppress(BufferError):
+            map_.close()
+
+    def unpack(self, struct_: struct.Struct) -> tuple:
+        """
+        Unpack the specified struct from the stream in place and advance the reading position forward
+
+        :param struct_: The precompiled struct to unpack
+
+        :return: The unpacked values
+
+        :raises EOFError: if the size of the struct is greater than the remaining number of bytes in the stream
+        """
+        if self.progress + struct_.size > len(self.content):
+            remaining = len(self.content) - self.progress
+            raise EOFError(f"End of file reached. (Requested: {struct_.size} bytes, only {remaining} left.)")
+        result = struct_.unpack_from(self.content, self.progress)
+        self.progress += struct_.size
+        return result
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Type, TypeVar, TYPE_CHECKING
+
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.memory_byte_stream import MemoryByteStream
+from binary_file_parser.types.version import Version
+
+if TYPE_CHECKING:
+    from binary_file_parser.types.base_struct import BaseStruct
+
+T = TypeVar("T", bound = "BaseStruct")
+
+_executors: dict[int, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+_in_worker = False
+
+
+def in_worker() -> bool:
+    """
+    :return: True if this is a worker process reading a chunk of struct objects, which must not read in parallel itself
+    """
+    return _in_worker
+
+
+def _shared_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    :param workers: The number of worker processes
+
+    :return: The pool of worker processes shared by all parallel reads with this number of workers
+    """
+    with _executors_lock:
+        if (executor := _executors.get(workers)) is None:
+            executor = _executors[workers] = ProcessPoolExecutor(max_workers = workers)
+        return executor
+
+
+def _discard_executor(workers: int, executor: ProcessPoolExecutor) -> None:
+    """Stop sharing a pool of worker processes that is broken, e.g. because a worker process was killed"""
+    with _executors_lock:
+        if _executors.get(workers) is executor:
+            del _executors[workers]
+    executor.shutdown(wait = False, cancel_futures = True)
+
+
+def read_parallel(
+    cls: Type[T], stream: ByteStream, n: int, size: int, *, struct_ver: Version = Version((0,)),
+    workers: int | None = None, executor: Executor | None = None, chunks_per_worker: int = 4,
+) -> list[T]:
+    """
+    Read many fixed size struct objects from a stream in parallel in a pool of worker processes. The bytes of all the
+    struct objects are copied into shared memory once, every worker reads a chunk of struct objects directly from it
+    and the chunks are joined back in order
+
+    :param cls: The struct class to read. It must be importable by the worker processes
+    :param stream: The stream to read the struct objects from, positioned at the first struct object
+    :param n: The number of struct objects to read
+    :param size: The number of bytes that each struct object takes up
+    :param struct_ver: The version of the struct objects
+    :param workers: The number of worker processes to use. Defaults to the number of CPUs
+    :param executor:
+        The process pool to read in. Defaults to a pool with ``workers`` processes, which is started by the first
+        parallel read and reused by the ones after it
+    :param chunks_per_worker: The number of chunks to split the struct objects into for each worker
+
+    :return: The struct objects, in the order they appear in the stream
+
+    :raises EOFError: If the stream does not have enough bytes left for all the struct objects
+    """
+    total = n * size
+    if total == 0:
+        # shared memory blocks cannot be empty, and there is nothing to split between workers
+        return [cls._from_stream(stream, struct_ver = struct_ver) for _ in range(n)]
+    if (remaining := stream.remaining_len()) < total:
+        raise EOFError(f"End of file reached. (Requested: {total} bytes, only {remaining} left.)")
+
+    workers = workers or os.cpu_count() or 1
+    shared = executor is None
+    if shared:
+        executor = _shared_executor(workers)
+    num_chunks = max(1, workers * chunks_per_worker)
+    chunk_len = -(-n // num_chunks)
+
+    shm = SharedMemory(create = True, size = total)
+    try:
+        shm.buf[:total] = memoryview(stream.content)[stream.progress:stream.progress + total]
+        futures = [
+            executor.submit(_read_chunk, cls, shm.name, first * size, min(chunk_len, n - first), struct_ver)
+            for first in range(0, n, chunk_len)
+        ]
+        values: list[T] = []
+        for future in futures:
+            values.extend(future.result())
+    except BrokenProcessPool:
+        if shared:
+            _discard_executor(workers, executor)
+        raise
+    finally:
+        shm.close()
+        shm.unlink()
+
+    stream.progress += total
+    return values
+
+
+def _read_chunk(cls: Type[T], name: str, offset: int, count: int, struct_ver: Version) -> list[T]:
+    """
+    Read a chunk of struct objects from shared memory. This runs inside the worker processes
+
+    :return: The struct objects in the chunk
+    """
+    global _in_worker
+    # arrays inside the struct objects are read in this process, starting more worker processes would only compete
+    # with the other workers
+    _in_worker = True
+
+    # the worker processes share the resource tracker of the parent process, which unlinks the block if it leaks
+    shm = SharedMemory(name)
+    try:
+        # read in place, the values read from a memory stream never keep a view of it
+        stream = MemoryByteStream(shm.buf[offset:offset + count * cls._static_size(struct_ver)])
+        try:
+            return [cls._from_stream(stream, struct_ver = struct_ver) for _ in range(count)]
+        finally:
+            stream.content.release()
+    finally:
+        shm.close()
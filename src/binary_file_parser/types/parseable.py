@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import BinaryIO, TypeVar
 
 from binary_file_parser.types.byte_stream import ByteStream
 from binary_file_parser.types.version import Version
@@ -22,3 +22,44 @@ class Parseable(ABC):
     @abstractmethod
     def _to_bytes(self, value: T) -> bytes:
         ...
+
+    def _to_stream(self, value: T, writer: BinaryIO) -> None:
+        """
+        Write a value of this type to a binary writer. By default, the bytes of the entire value are written at once.
+        Container types should override this to write their elements one by one
+        """
+        writer.write(self._to_bytes(value))
+
+    def _from_stream_many(self, stream: ByteStream, n: int, *, struct_ver: Version = Version((0,))) -> list[T]:
+        """
+        Read the specified number of consecutive values of this type from the stream. Fixed size types override this to
+        decode all the values in a single operation
+        """
+        return [self._from_stream(stream, struct_ver = struct_ver) for _ in range(n)]
+
+    def _to_bytes_many(self, values: list[T]) -> bytes:
+        """Convert consecutive values of this type to bytes"""
+        return b"".join(map(self._to_bytes, values))
+
+    def _to_stream_many(self, values: list[T], writer: BinaryIO) -> None:
+        """Write consecutive values of this type to a binary writer"""
+        for value in values:
+            self._to_stream(value, writer)
+
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        """
+        The number of bytes that every value of this type takes up. By default, the size depends on the value. Fixed
+        size types override this
+
+        :param struct_ver: The version of the struct the value is read in
+
+        :return: The size in bytes, or None if it is not the same for every value
+        """
+        return None
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        """
+        Advance the stream past a value of this type without keeping it. By default, the value is read and discarded.
+        Types which can find the end of their value without decoding it should override this
+        """
+        self._from_stream(stream, struct_ver = struct_ver)
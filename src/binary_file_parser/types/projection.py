@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import copy
+from typing import Iterable, Type, TYPE_CHECKING
+
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.le.array import BaseArray, StackedAttrArray
+from binary_file_parser.types.parseable import Parseable
+from binary_file_parser.types.version import Version
+
+if TYPE_CHECKING:
+    from binary_file_parser.retrievers import Retriever
+    from binary_file_parser.types.base_struct import BaseStruct
+
+
+class Projection:
+    """
+    The subset of retriever properties to read from a struct, e.g. ``{"header", "players.name"}``. Each name maps to the
+    projection of its sub struct(s), or to None if it is read in full. Retriever properties outside the projection are
+    skipped over instead of being decoded
+    """
+    __slots__ = "fields", "_dtypes", "_checked"
+
+    def __init__(self, fields: Iterable[str]):
+        """
+        :param fields:
+            The names of the retriever properties to read. Use ``.`` to only read some retriever properties of sub
+            structs, or of the structs in a list or array, e.g. ``players.name``
+        """
+        nested: dict[str, list[str] | None] = {}
+        for field in fields:
+            name, _, rest = field.partition(".")
+            if not rest or nested.get(name, []) is None:
+                nested[name] = None
+            else:
+                nested.setdefault(name, []).append(rest)
+
+        self.fields: dict[str, Projection | None] = {
+            name: None if rest is None else Projection(rest) for name, rest in nested.items()
+        }
+        self._dtypes: dict[Retriever, Parseable | Type[Parseable]] = {}
+        self._checked: set[Type[BaseStruct]] = set()
+
+    @classmethod
+    def of(cls, fields: Iterable[str] | Projection) -> Projection:
+        """
+        :param fields: The names of the retriever properties to read, or an existing projection
+
+        :return: The projection of the given fields
+        """
+        if isinstance(fields, Projection):
+            return fields
+        return cls(fields)
+
+    def check(self, struct_cls: Type[BaseStruct]) -> None:
+        """
+        :param struct_cls: The struct class this projection is used to read
+
+        :raises AttributeError: If the projection names a retriever property the struct class does not have
+        """
+        if struct_cls in self._checked:
+            return
+        names = {retriever.p_name for retriever in struct_cls._retrievers}
+        for name in self.fields:
+            if name not in names:
+                raise AttributeError(f"{struct_cls.__name__!r} has no retriever property {name!r}")
+        self._checked.add(struct_cls)
+
+    def dtype(self, retriever: Retriever) -> Parseable | Type[Parseable]:
+        """
+        :param retriever: A retriever property in this projection
+
+        :return:
+            The type to read the retriever property with. Sub structs and arrays of sub structs are read using their
+            nested projection. Attribute arrays are always read in full
+
+        :raises TypeError: If the retriever property has a nested projection but does not contain sub structs
+        """
+        if (sub := self.fields[retriever.p_name]) is None:
+            return retriever.dtype
+        if (dtype := self._dtypes.get(retriever)) is not None:
+            return dtype
+
+        dtype = retriever.dtype
+        if _is_struct(dtype):
+            dtype = ProjectedStruct(dtype, sub)
+        elif isinstance(dtype, StackedAttrArray):
+            pass
+        elif isinstance(dtype, BaseArray) and _is_struct(dtype.dtype):
+            dtype = copy.copy(dtype)
+            dtype.dtype = ProjectedStruct(dtype.dtype, sub)
+        else:
+            raise TypeError(
+                f"{retriever.p_name!r} does not contain sub structs, a projection of its fields cannot be read"
+            )
+        self._dtypes[retriever] = dtype
+        return dtype
+
+
+class ProjectedStruct(Parseable):
+    """Reads struct objects of a struct class using a projection"""
+    __slots__ = "stype", "projection"
+
+    def __init__(self, stype: Type[BaseStruct], projection: Projection):
+        """
+        :param stype: The struct class to read
+        :param projection: The retriever properties of the struct class to read
+        """
+        super().__init__(0)
+        self.stype = stype
+        self.projection = projection
+
+    def _from_stream(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> BaseStruct:
+        return self.stype._from_stream(stream, struct_ver = struct_ver, fields = self.projection)
+
+    def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))) -> BaseStruct:
+        return self._from_stream(ByteStream.from_bytes(bytes_), struct_ver = struct_ver)
+
+    def _to_bytes(self, value: BaseStruct) -> bytes:
+        return value._to_bytes()
+
+    def _static_size(self, struct_ver: Version = Version((0,))) -> int | None:
+        return self.stype._static_size(struct_ver)
+
+    def _skip(self, stream: ByteStream, *, struct_ver: Version = Version((0,))) -> None:
+        self.stype._skip(stream, struct_ver = struct_ver)
+
+
+def _is_struct(dtype: Parseable | Type[Parseable]) -> bool:
+    from binary_file_parser.types.base_struct import BaseStruct
+
+    return isinstance(dtype, type) and issubclass(dtype, BaseStruct)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, Type, TypeVar, TYPE_CHECKING
+
+from binary_file_parser.types.byte_stream import ByteStream
+from binary_file_parser.types.version import Version
+from binary_file_parser.utils import deep_sizeof
+
+if TYPE_CHECKING:
+    from binary_file_parser.types.base_struct import BaseStruct
+
+T = TypeVar("T", bound = "BaseStruct")
+
+
+class CowHandle(Generic[T]):
+    """
+    A copy-on-write handle to a struct object shared through a ``StructCache``. ``value`` is the shared object and must
+    not be modified. The first call to ``mutable`` makes a private copy of it, which is returned from then on
+    """
+    __slots__ = "_value", "_copied"
+
+    def __init__(self, value: T):
+        """
+        :param value: The shared struct object
+        """
+        self._value = value
+        self._copied = False
+
+    @property
+    def value(self) -> T:
+        """The struct object, which is shared until ``mutable`` is called"""
+        return self._value
+
+    @property
+    def copied(self) -> bool:
+        """True if a private copy of the struct object has been made"""
+        return self._copied
+
+    def mutable(self) -> T:
+        """
+        :return: A private copy of the struct object which can be modified freely. The copy is only made once
+        """
+        if not self._copied:
+            self._value = pickle.loads(pickle.dumps(self._value, protocol = pickle.HIGHEST_PROTOCOL))
+            self._copied = True
+        return self._value
+
+
+class StructCache:
+    """
+    An in-memory cache of parsed struct objects, shared by everything in the process which reads the same files. Files
+    are keyed by their path, modification time and size, or by the hash of their content. The least recently used
+    entries are evicted once the total memory used by the cached objects exceeds ``max_memory``. The cached objects are
+    shared, so they are only handed out wrapped in a ``CowHandle``. Use ``CowHandle.mutable`` to get a private copy
+    before modifying one
+    """
+    __slots__ = "max_memory", "memory", "hits", "misses", "_entries", "_lock"
+
+    _shared: StructCache | None = None
+    _shared_lock = Lock()
+
+    def __init__(self, max_memory: int = 256 * 1024 * 1024):
+        """
+        :param max_memory: The memory budget of the cache in bytes
+        """
+        self.max_memory = max_memory
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[BaseStruct, int]] = OrderedDict()
+        self._lock = Lock()
+
+    @classmethod
+    def shared(cls) -> StructCache:
+        """
+        :return: The process wide cache, created with the default memory budget on first use
+        """
+        if StructCache._shared is None:
+            with StructCache._shared_lock:
+                if StructCache._shared is None:
+                    StructCache._shared = cls()
+        return StructCache._shared
+
+    def from_file(
+        self, cls: Type[T], file_name: str, *, by_hash: bool = False, compressed: bool = False,
+        file_version: Version = Version((0,)), strict: bool = True,
+    ) -> CowHandle[T]:
+        """
+        Create a struct object from file, or return the cached one if the file was read before
+
+        :param cls: The struct class to parse the file as
+        :param file_name: The path of the file to create the struct object from
+        :param by_hash:
+            When true, the file is keyed by the hash of its content instead of its path, modification time and size.
+            This requires reading the whole file even on a hit, but finds copies of the same file at other paths
+        :param compressed: When true, the file is parsed as with ``_from_compressed_file`` instead of ``_from_file``
+        :param file_version: The version of the structure to create. Overwritten if `get_version` is defined
+        :param strict: Raise an error if struct parsing finishes successfully but the stream has left over bytes
+
+        :return: A copy-on-write handle to the shared instance of the struct class
+        """
+        options = (cls, compressed, file_version, strict)
+        if by_hash:
+            with open(file_name, "rb") as file:
+                bytes_ = file.read()
+            return self._get_or_parse(cls, (*options, _hash(bytes_)), lambda: bytes_, compressed, file_version, strict)
+
+        stat = os.stat(file_name)
+        key = (*options, os.path.abspath(file_name), stat.st_mtime_ns, stat.st_size)
+
+        def read() -> bytes:
+            with open(file_name, "rb") as file:
+                return file.read()
+
+        return self._get_or_parse(cls, key, read, compressed, file_version, strict)
+
+    def from_bytes(
+        self, cls: Type[T], bytes_: bytes, *, struct_ver: Version = Version((0,)), strict = False,
+    ) -> CowHandle[T]:
+        """
+        Create a struct object from bytes, or return the cached one if the same bytes were read before
+
+        :param cls: The struct class to parse the bytes as
+        :param bytes_: The bytes to create the struct object from
+        :param struct_ver: The version of the structure to create. Overwritten if `get_version` is defined
+        :param strict: Raise an error if struct parsing finishes successfully but there are unused bytes left over
+
+        :return: A copy-on-write handle to the shared instance of the struct class
+        """
+        key = (cls, False, struct_ver, strict, _hash(bytes_))
+        return self._get_or_parse(cls, key, lambda: bytes_, False, struct_ver, strict)
+
+    def _get_or_parse(
+        self, cls: Type[T], key: Hashable, read, compressed: bool, struct_ver: Version, strict: bool,
+    ) -> CowHandle[T]:
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return CowHandle(entry[0])
+            self.misses += 1
+
+        # parsing happens outside the lock, two threads missing the same key at once both parse it
+        stream = ByteStream.from_bytes(read())
+        if compressed:
+            stream = cls._decompressed_stream(stream)
+        value = cls._from_stream(stream, struct_ver = struct_ver, strict = strict)
+        self._put(key, value)
+        return CowHandle(value)
+
+    def _put(self, key: Hashable, value: BaseStruct) -> None:
+        size = deep_sizeof(value)
+        if size > self.max_memory:
+            return
+        with self._lock:
+            if (old := self._entries.pop(key, None)) is not None:
+                self.memory -= old[1]
+            self._entries[key] = (value, size)
+            self.memory += size
+            while self.memory > self.max_memory:
+                _key, (_value, evicted_size) = self._entries.popitem(last = False)
+                self.memory -= evicted_size
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache"""
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _hash(bytes_: bytes) -> bytes:
+    return hashlib.blake2b(bytes_, digest_size = 32).digest()
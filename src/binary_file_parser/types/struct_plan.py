@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, TYPE_CHECKING
+
+from binary_file_parser.types.le.bool import Bool
+from binary_file_parser.types.le.primitive import Primitive
+from binary_file_parser.types.version import Version
+
+if TYPE_CHECKING:
+    from binary_file_parser.retrievers import Retriever
+    from binary_file_parser.types.base_struct import BaseStruct
+    from binary_file_parser.types.byte_stream import ByteStream
+
+    PlanStep = Retriever | PrimitiveRun
+
+
+class PrimitiveRun:
+    """
+    A run of adjacent retrievers of fixed size primitive types without any hooks. The whole run is read/written with a
+    single precompiled struct instead of going through each retriever separately
+    """
+    __slots__ = "retrievers", "p_names", "s_names", "struct", "bool_idxs"
+
+    remaining_compressed = False
+
+    def __init__(self, retrievers: list[Retriever]):
+        """
+        :param retrievers: The retrievers to read/write together, in the order that they appear in the struct
+        """
+        self.retrievers = retrievers
+        self.p_names = [retriever.p_name for retriever in retrievers]
+        self.s_names = [retriever.s_name for retriever in retrievers]
+        self.struct = struct.Struct("<" + "".join(retriever.dtype.struct_symbol[1:] for retriever in retrievers))
+        self.bool_idxs = [i for i, retriever in enumerate(retrievers) if isinstance(retriever.dtype, Bool)]
+
+    @property
+    def p_name(self) -> str:
+        return self.retrievers[0].p_name
+
+    def has_dynamic_repeat(self, instance: BaseStruct) -> bool:
+        """
+        :param instance: The struct object to check
+
+        :return: true if the repeat of any retriever in this run has been set on the instance using ``set_repeat``
+        """
+        return any(hasattr(instance, retriever.r_name) for retriever in self.retrievers)
+
+    def reusable(self, instance: BaseStruct) -> bool:
+        """
+        :param instance: The struct object to check
+
+        :return: true if none of the retriever properties in this run were modified since the struct object was read
+        """
+        return instance._dirty.isdisjoint(self.p_names)
+
+    def from_stream(self, instance: BaseStruct, stream: ByteStream) -> None:
+        """
+        Initialise all the retriever properties in this run from a stream
+
+        :param instance: The struct object to initialise the retriever properties for
+        :param stream: The stream to initialise the retriever properties from
+        """
+        if self.has_dynamic_repeat(instance):
+            for retriever in self.retrievers:
+                retriever.from_stream(instance, stream)
+            return
+
+        values = stream.unpack(self.struct)
+        if self.bool_idxs:
+            values = list(values)
+            for i in self.bool_idxs:
+                values[i] = not not values[i]
+
+        for s_name, value in zip(self.s_names, values):
+            setattr(instance, s_name, value)
+
+    def scan(self, instance: BaseStruct, stream: ByteStream) -> None:
+        """
+        Runs are cheap to decode, so lazy reads initialise them right away
+
+        :param instance: The struct object to initialise the retriever properties for
+        :param stream: The stream to initialise the retriever properties from
+        """
+        self.from_stream(instance, stream)
+
+    def to_bytes(self, instance: BaseStruct) -> bytes:
+        """
+        Convert all the retriever properties in this run to bytes
+
+        :param instance: The struct object to convert the retriever properties from
+
+        :return: The bytes of the retriever properties
+        """
+        if not self.has_dynamic_repeat(instance):
+            try:
+                values = [getattr(instance, s_name) for s_name in self.s_names]
+                for i in self.bool_idxs:
+                    values[i] = 1 if values[i] else 0
+                return self.struct.pack(*values)
+            except (AttributeError, struct.error):
+                # uninitialised values fall back to their defaults and bad values raise their usual error
+                pass
+
+        return b"".join(retriever.to_bytes(instance) for retriever in self.retrievers)
+
+    def to_stream(self, instance: BaseStruct, writer: BinaryIO) -> None:
+        """
+        Write all the retriever properties in this run to a binary writer
+
+        :param instance: The struct object to write the retriever properties of
+        :param writer: The writer to write the bytes of the retriever properties to
+        """
+        writer.write(self.to_bytes(instance))
+
+
+def is_primitive(retriever: Retriever) -> bool:
+    """
+    :param retriever: The retriever to check
+
+    :return:
+        true if the retriever reads a single fixed size primitive, which does not override how it is converted, and has
+        no hooks which need to be run
+    """
+    return (
+        isinstance(retriever.dtype, Primitive)
+        and retriever.dtype._fast
+        and retriever._repeat == 1
+        and not retriever.remaining_compressed
+        and not (
+            retriever.on_read or retriever.on_write or retriever.on_get or retriever.on_set
+            or retriever.mappers or retriever.validators
+        )
+    )
+
+
+def compile_plan(retrievers: list[Retriever], struct_ver: Version) -> list[PlanStep]:
+    """
+    Create a read/write plan for a struct version. Adjacent primitive retrievers are merged into a ``PrimitiveRun``
+    and all other retrievers are kept as they are. Retrievers unsupported in the given version are left out
+
+    :param retrievers: The retrievers of the struct in order
+    :param struct_ver: The struct version to make the plan for
+
+    :return: A list of steps which can be read/written in order using ``from_stream`` and ``to_bytes``
+    """
+    plan: list[PlanStep] = []
+    run: list[Retriever] = []
+
+    for retriever in retrievers:
+        if not retriever.supported(struct_ver):
+            continue
+        if is_primitive(retriever):
+            run.append(retriever)
+            continue
+        if run:
+            plan.append(PrimitiveRun(run))
+            run = []
+        plan.append(retriever)
+
+    if run:
+        plan.append(PrimitiveRun(run))
+    return plan
@@ -1,5 +1,7 @@
 import contextlib
+import sys
 from io import StringIO
+from types import BuiltinFunctionType, FunctionType, ModuleType
 
 
 class TabbedStringIO(StringIO):
@@ -18,3 +20,60 @@ class TabbedStringIO(StringIO):
 
     def writeln(self, string: str = ""):
         self.write("\n" + self._tab() + string)
+
+
+def equal(val1, val2) -> bool:
+    """
+    Compare two values with ``==``. Unlike ``==`` itself, this also works for (lists of) numpy arrays, which compare
+    element-wise
+
+    :param val1: The first value to compare
+    :param val2: The second value to compare
+
+    :return: true if the values are equal
+    """
+    try:
+        return bool(val1 == val2)
+    except ValueError:
+        # numpy: "The truth value of an array with more than one element is ambiguous", compare element by element
+        return len(val1) == len(val2) and all(map(equal, val1, val2))
+
+
+def deep_sizeof(obj) -> int:
+    """
+    Estimate the memory used by an object and everything it references. Objects referenced more than once are only
+    counted once, and classes, functions and modules are not counted at all
+
+    :param obj: The object to measure
+
+    :return: The size in bytes
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType, BuiltinFunctionType)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, memoryview):
+            # views do not own their memory
+            continue
+
+        if (dict_ := getattr(obj, "__dict__", None)) is not None and isinstance(dict_, dict):
+            stack.append(dict_)
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ("__dict__", "__weakref__") and (value := getattr(obj, name, seen)) is not seen:
+                    stack.append(value)
+    return size
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import Array32, str32, uint8, uint32
+
+
+class Message(BaseStruct):
+    id: int = Retriever(uint32, default = 0)
+    text: str = Retriever(str32, default = "")
+    values: list[int] = Retriever(Array32[uint8], default_factory = lambda _: [])
+
+
+def test_file_round_trip(tmp_path):
+    async def main():
+        message = Message(id = 3, text = "hello", values = [1, 2, 3])
+        path = str(tmp_path / "message.bin")
+        await message._to_file_async(path)
+        assert await Message._from_file_async(path) == message
+        assert (await Message._from_file_async(path, fields = {"text"})).text == "hello"
+
+    asyncio.run(main())
+
+
+def test_back_to_back_messages_from_stream_reader():
+    async def main():
+        first = Message(id = 1, text = "first", values = [1, 2])
+        second = Message(id = 2, text = "second", values = list(range(100)))
+        data = first._to_bytes() + second._to_bytes() + b"EXTRA"
+
+        reader = asyncio.StreamReader()
+
+        async def feed():
+            for i in range(0, len(data), 7):
+                reader.feed_data(data[i:i + 7])
+                await asyncio.sleep(0)
+            reader.feed_eof()
+
+        feeding = asyncio.create_task(feed())
+        assert await Message._from_stream_reader(reader) == first
+        assert await Message._from_stream_reader(reader) == second
+        await feeding
+        assert await reader.read() == b"EXTRA"
+
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import io
+
+from binary_file_parser import BaseStruct, ByteStream, Retriever, Version
+from binary_file_parser.types import AttrColumns, float32, StackedAttrArray32, StackedAttrColumns32, uint8, uint32
+
+
+class Point(BaseStruct):
+    x: int = Retriever(uint32, default = 0)
+    y: float = Retriever(float32, default = 0.0)
+    c: int = Retriever(uint8, default = 0)
+
+
+class Rows(BaseStruct):
+    points: list[Point] = Retriever(StackedAttrArray32[Point], default_factory = lambda _: [])
+
+
+class Columns(BaseStruct):
+    points: AttrColumns = Retriever(StackedAttrColumns32[Point], default_factory = lambda _: [])
+
+
+def test_round_trip():
+    rows = Rows(points = [Point(x = i, y = i / 2, c = i % 256) for i in range(300)])
+    bytes_ = rows._to_bytes()
+
+    columns = Columns._from_bytes(bytes_, strict = True)
+    assert isinstance(columns.points, AttrColumns)
+    assert columns._to_bytes() == bytes_
+    assert columns.points.column("x") == list(range(300))
+    assert columns.points[-1].c == 299 % 256
+    assert columns.points._to_structs() == rows.points
+
+    columns.points[3].x = 99
+    assert columns.points.column("x")[3] == 99
+    assert Rows._from_bytes(columns._to_bytes()).points[3] == Point(x = 99, y = 1.5, c = 3)
+
+    writer = io.BytesIO()
+    columns._to_stream(writer)
+    assert writer.getvalue() == columns._to_bytes()
+    # lists of struct objects are accepted as well
+    assert Columns(points = rows.points)._to_bytes() == bytes_
+
+
+class Versioned(BaseStruct):
+    calls = 0
+
+    a: int = Retriever(uint8, default = 0)
+
+    @classmethod
+    def _get_version(cls, stream: ByteStream, struct_ver: Version = Version((0,))) -> Version:
+        cls.calls += 1
+        return Version((1,))
+
+
+class VersionedRows(BaseStruct):
+    items: list[Versioned] = Retriever(StackedAttrArray32[Versioned], default_factory = lambda _: [])
+
+
+class VersionedColumns(BaseStruct):
+    items: AttrColumns = Retriever(StackedAttrColumns32[Versioned], default_factory = lambda _: [])
+
+
+def test_get_version_is_called_per_element():
+    bytes_ = VersionedRows(items = [Versioned(a = i) for i in range(5)])._to_bytes()
+
+    Versioned.calls = 0
+    rows = VersionedRows._from_bytes(bytes_, strict = True)
+    row_calls, Versioned.calls = Versioned.calls, 0
+    columns = VersionedColumns._from_bytes(bytes_, strict = True)
+
+    assert Versioned.calls == row_calls
+    assert columns.items.column("a") == [item.a for item in rows.items]
+    assert columns.items.struct_ver == rows.items[0].struct_ver
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from binary_file_parser import BaseStruct, FileResult, ProjectionError, Retriever
+from binary_file_parser.types import str8, uint32
+
+
+class Save(BaseStruct):
+    turn: int = Retriever(uint32, default = 0)
+    name: str = Retriever(str8, default = "save")
+
+
+@pytest.fixture
+def paths(tmp_path) -> list[str]:
+    paths = []
+    for i in range(6):
+        paths.append(path := str(tmp_path / f"{i}.bin"))
+        Save(turn = i, name = f"save {i}")._to_file(path, show_progress = False)
+    return paths
+
+
+def test_results_are_in_order(paths: list[str]):
+    results = list(Save._from_files(paths, workers = 2))
+    assert [result.path for result in results] == paths
+    assert all(isinstance(result, FileResult) and result.ok for result in results)
+    assert [result.unwrap().turn for result in results] == list(range(6))
+
+
+def test_unordered_results(paths: list[str]):
+    results = list(Save._from_files(paths, workers = 2, ordered = False))
+    assert sorted(result.unwrap().turn for result in results) == list(range(6))
+
+
+def test_a_bad_file_does_not_abort_the_batch(tmp_path, paths: list[str]):
+    with open(bad := str(tmp_path / "bad.bin"), "wb") as file:
+        file.write(b"\x01")
+    results = list(Save._from_files([paths[0], bad, paths[1]], workers = 2))
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, EOFError) and "EOFError" in results[1].tb
+    with pytest.raises(EOFError):
+        results[1].unwrap()
+
+
+def test_projection(paths: list[str]):
+    save = next(iter(Save._from_files(paths[3:4], workers = 1, fields = ["turn"]))).unwrap()
+    assert save.turn == 3
+    with pytest.raises(ProjectionError):
+        save.name
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from binary_file_parser.bench.suite import compare
+
+
+def report(parse_mb_s: float, parse_peak_mb: float, scale: int = 1) -> dict:
+    return {"scale": scale, "results": {"flat": {"parse_mb_s": parse_mb_s, "parse_peak_mb": parse_peak_mb}}}
+
+
+def test_compare_tolerates_noise():
+    baseline = report(100.0, 10.0)
+    # run to run noise of a few tens of percent is common on shared machines
+    assert compare(report(80.0, 12.0), baseline) == []
+    assert compare(report(70.0, 10.0), baseline) == ["flat.parse_mb_s: 70.00 < 100.00"]
+    assert compare(report(100.0, 13.0), baseline) == ["flat.parse_peak_mb: 13.00 > 10.00"]
+    assert compare(report(80.0, 10.0), baseline, tolerance = 0.1) == ["flat.parse_mb_s: 80.00 < 100.00"]
+
+
+def test_compare_requires_the_same_scale():
+    assert len(compare(report(100.0, 10.0, scale = 2), report(100.0, 10.0))) == 1
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from binary_file_parser import BaseStruct, ByteStream, Parseable, Retriever
+from binary_file_parser.types import (
+    Array16, bool8, bool32, float16, float32, float64, int8, int64, StackedArray8s, uint16, uint32,
+)
+
+VALUES = [
+    (int8, [-128, -1, 0, 127]),
+    (uint16, [0, 1, 65535]),
+    (uint32, list(range(1000))),
+    (int64, [-(1 << 63), (1 << 63) - 1]),
+    (float16, [0.5, -2.0, 1024.0]),
+    (float32, [0.25, -1.5]),
+    (float64, [1e300, -1e-300]),
+    (bool8, [True, False, True]),
+    (bool32, [False, True]),
+]
+
+
+@pytest.mark.parametrize("dtype, values", VALUES)
+def test_many_matches_one_at_a_time(dtype, values: list):
+    bytes_ = dtype._to_bytes_many(values)
+    assert bytes_ == Parseable._to_bytes_many(dtype, values)
+    assert bytes_ == b"".join(map(dtype._to_bytes, values))
+
+    writer = io.BytesIO()
+    dtype._to_stream_many(values, writer)
+    assert writer.getvalue() == bytes_
+
+    read = dtype._from_stream_many(ByteStream.from_bytes(bytes_ + b"x"), len(values))
+    assert read == values
+    assert all(type(a) is type(b) for a, b in zip(read, values))
+
+
+def test_many_does_not_read_past_the_end():
+    stream = ByteStream.from_bytes(uint32._to_bytes_many([1, 2]))
+    with pytest.raises(EOFError):
+        uint32._from_stream_many(stream, 3)
+    assert stream.progress == 0
+
+
+class Bulk(BaseStruct):
+    counts: list[int] = Retriever(uint32, default = 3, repeat = 4)
+    values: list[float] = Retriever(Array16[float32], default_factory = lambda _: [0.5] * 100)
+    rows: list[list[bool]] = Retriever(StackedArray8s[bool8], default_factory = lambda _: [[True], [], [False, True]])
+
+
+def test_round_trip():
+    bulk = Bulk()
+    bytes_ = bulk._to_bytes()
+    assert Bulk._from_bytes(bytes_, strict = True) == bulk
+    assert Bulk._from_bytes(bytes_, strict = True)._to_bytes() == bytes_
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import gc
+import warnings
+
+import pytest
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.errors import ParsingError
+from binary_file_parser.types import ChunkedByteStream, uint8, uint32
+
+
+class Spam(BaseStruct):
+    a: int = Retriever(uint32, default = 1)
+    b: int = Retriever(uint8, default = 2)
+
+
+def test_file_closed_when_parsing_stops_early(tmp_path):
+    path = str(tmp_path / "spam.bin")
+    with open(path, "wb") as file:
+        file.write(Spam()._to_bytes() + b"left over")
+
+    with warnings.catch_warnings(record = True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        assert Spam._from_file(path, strict = False, stream_cls = ChunkedByteStream, show_progress = False).b == 2
+        with pytest.raises(ParsingError):
+            Spam._from_file(path, strict = True, stream_cls = ChunkedByteStream, show_progress = False)
+        assert Spam._read_field(path, "a", stream_cls = ChunkedByteStream) == 1
+        gc.collect()
+    assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import os
+import zlib
+
+import pytest
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.errors import CompressionError
+from binary_file_parser.types import DeflateCodec, get_codec, StrArray32, uint32
+from binary_file_parser.types.codec import BlockCompressor
+
+DATA = os.urandom(1000) * 50 + bytes(range(256)) * 400
+
+
+def stdlib_decompress(codec, bytes_: bytes) -> bytes:
+    if isinstance(codec, DeflateCodec) and codec.wbits > zlib.MAX_WBITS:
+        return gzip.decompress(bytes_)
+    if isinstance(codec, DeflateCodec):
+        return zlib.decompress(bytes_, codec.wbits)
+    if codec.__class__.__name__ == "Bz2Codec":
+        return bz2.decompress(bytes_)
+    return lzma.decompress(bytes_, codec.format)
+
+
+@pytest.mark.parametrize("wbits", [*range(9, 16), *range(-15, -8), *range(25, 32)])
+@pytest.mark.parametrize("threads", [1, 3])
+def test_deflate_round_trip(wbits: int, threads: int):
+    codec = DeflateCodec(6, wbits, threads = threads, block_size = 20_000)
+    compressed = codec.compress(DATA)
+    assert stdlib_decompress(codec, compressed) == DATA
+    assert codec.decompress(compressed) == DATA
+
+
+@pytest.mark.parametrize("name", ["zlib", "deflate", "gzip", "bz2", "xz", "lzma"])
+@pytest.mark.parametrize("threads", [1, 3])
+def test_codec_round_trip(name: str, threads: int):
+    codec = get_codec(name, threads = threads, block_size = 20_000)
+    compressed = codec.compress(DATA)
+    assert stdlib_decompress(codec, compressed) == DATA
+    assert codec.decompress(compressed) == DATA
+
+    compressor = codec.compressor()
+    chunks = [compressor.compress(DATA[i:i + 7_000]) for i in range(0, len(DATA), 7_000)]
+    assert codec.decompress(b"".join(chunks) + compressor.flush()) == DATA
+    assert codec.decompress(codec.compress(b"")) == b""
+
+
+def test_unknown_codec():
+    with pytest.raises(CompressionError):
+        get_codec("nope")
+
+
+def test_block_compressor_close():
+    compressor = get_codec("zlib", threads = 2, block_size = 1000).compressor()
+    assert isinstance(compressor, BlockCompressor) and compressor.executor is None
+    compressor.compress(DATA)
+    assert compressor.executor is not None
+    compressor.close()
+    assert compressor.executor is None
+
+
+class Compressed(BaseStruct):
+    _codec = get_codec("gzip", threads = 2, block_size = 100)
+
+    count: int = Retriever(uint32, default = 0, remaining_compressed = True)
+    names: list[str] = Retriever(StrArray32, default_factory = lambda _: [])
+
+
+def test_struct_round_trip(tmp_path):
+    value = Compressed(count = 50, names = [f"name {i}" for i in range(50)])
+    bytes_ = value._to_bytes()
+    assert Compressed._from_bytes(bytes_, strict = True) == value
+
+    path = str(tmp_path / "compressed.bin")
+    value._to_file(path, show_progress = False)
+    assert Compressed._from_file(path, show_progress = False) == value
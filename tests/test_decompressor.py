@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import io
+import os
+import zlib
+
+import pytest
+
+from binary_file_parser import BaseStruct, ByteStream, ChunkedByteStream, Retriever
+from binary_file_parser.types import Bytes, str8, uint32
+
+
+class CountingDecompressor:
+    def __init__(self):
+        self.decompressor = zlib.decompressobj()
+        self.produced = 0
+
+    def decompress(self, data: bytes) -> bytes:
+        out = self.decompressor.decompress(data)
+        self.produced += len(out)
+        return out
+
+    def flush(self) -> bytes:
+        out = self.decompressor.flush()
+        self.produced += len(out)
+        return out
+
+
+class Archive(BaseStruct):
+    decompressors: list[CountingDecompressor] = []
+
+    @classmethod
+    def _compress(cls, bytes_: bytes) -> bytes:
+        return zlib.compress(bytes_)
+
+    @classmethod
+    def _decompressor(cls):
+        cls.decompressors.append(decompressor := CountingDecompressor())
+        return decompressor
+
+    magic: int = Retriever(uint32, default = 0xC0FFEE)
+    first: str = Retriever(str8, default = "first", remaining_compressed = True)
+    payload: bytes = Retriever(Bytes[1 << 16], default_factory = lambda _: os.urandom(1 << 16))
+    last: str = Retriever(str8, default = "last")
+
+
+@pytest.fixture
+def archive() -> Archive:
+    Archive.decompressors.clear()
+    return Archive()
+
+
+def test_round_trip(archive: Archive):
+    bytes_ = archive._to_bytes()
+    read = Archive._from_bytes(bytes_, strict = True)
+    assert read == archive
+    assert read._to_bytes() == bytes_
+    assert Archive.decompressors[-1].produced == len(archive.first) + 1 + len(archive.payload) + len(archive.last) + 1
+
+
+def test_chunked_streams_decompress_as_they_are_read(archive: Archive):
+    bytes_ = archive._to_bytes()
+    for chunk_size in (1, 7, 64 * 1024):
+        stream = ChunkedByteStream(io.BytesIO(bytes_).read, chunk_size = chunk_size)
+        assert Archive._from_stream(stream, strict = True) == archive
+
+
+def test_only_the_bytes_read_are_decompressed(archive: Archive):
+    bytes_ = archive._to_bytes()
+    assert Archive._read_field_from_stream(ByteStream.from_bytes(bytes_), "first") == "first"
+    assert Archive.decompressors[-1].produced < len(archive.payload) // 2
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+import pickle
+
+from binary_file_parser import BaseStruct, FileCache, Retriever
+from binary_file_parser.types import Array16, Bytes, str8, uint32
+
+
+class Save(BaseStruct):
+    turn: int = Retriever(uint32, default = 0)
+    name: str = Retriever(str8, default = "save")
+    units: list[int] = Retriever(Array16[uint32], default_factory = lambda _: list(range(100)))
+
+
+def snapshots(cache: FileCache) -> list[str]:
+    return [name for name in os.listdir(cache.directory) if name.endswith(".pkl")]
+
+
+def test_load_stores_and_reuses_snapshots(tmp_path):
+    path = str(tmp_path / "save.bin")
+    Save(turn = 3)._to_file(path, show_progress = False)
+    cache = FileCache(str(tmp_path / "cache"))
+
+    assert cache.load(Save, path) == Save(turn = 3)
+    assert len(snapshots(cache)) == 1
+    with open(path, "rb") as file:
+        key = cache.key(Save, file.read())
+    assert cache.get(key) == Save(turn = 3)
+    assert cache.load(Save, path) == Save(turn = 3)
+    assert len(snapshots(cache)) == 1
+
+    # a different content, or reading it differently, is a different entry
+    Save(turn = 4)._to_file(path, show_progress = False)
+    assert cache.load(Save, path).turn == 4
+    assert cache.load(Save, path, strict = False).turn == 4
+    assert len(snapshots(cache)) == 3
+
+    cache.clear()
+    assert snapshots(cache) == []
+
+
+def test_corrupted_snapshots_are_misses(tmp_path):
+    path = str(tmp_path / "save.bin")
+    Save()._to_file(path, show_progress = False)
+    cache = FileCache(str(tmp_path / "cache"))
+    cache.load(Save, path)
+
+    snapshot = os.path.join(cache.directory, snapshots(cache)[0])
+    with open(snapshot, "wb") as file:
+        file.write(b"not a pickle")
+    assert cache.load(Save, path) == Save()
+    with open(snapshot, "rb") as file:
+        assert pickle.load(file) == Save()
+
+
+def test_eviction(tmp_path):
+    cache = FileCache(str(tmp_path / "cache"), max_size = 1)
+    cache.put("a", Save())
+    assert snapshots(cache) == []
+
+    cache = FileCache(str(tmp_path / "cache"), max_age = -1)
+    cache.put("b", Save())
+    assert snapshots(cache) == []
+
+
+class Archive(BaseStruct):
+    save: Save = Retriever(Save, default_factory = Save)
+    blob: bytes = Retriever(Bytes[100_000], default = bytes(100_000))
+
+
+def test_lazy_structs_pickle_without_the_content_they_were_read_from():
+    archive = Archive._from_bytes(Archive()._to_bytes(), strict = True, lazy = True)
+    archive.save.turn = 5
+
+    pickled = pickle.dumps(archive.save)
+    assert len(pickled) < 10_000
+    assert pickle.loads(pickled) == Save(turn = 5)
+    assert pickle.loads(pickle.dumps(archive)) == Archive(save = Save(turn = 5))
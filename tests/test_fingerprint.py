@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import Array8, ByteStream, get_codec, schema_fingerprint, uint8, Version
+from binary_file_parser.types.fingerprint import _describe
+
+
+class Spam(BaseStruct):
+    n: int = Retriever(uint8, default = 0)
+    values: list[int] = Retriever(Array8[uint8], default_factory = lambda _: [])
+
+
+class Versioned(Spam):
+    @classmethod
+    def _get_version(cls, stream: ByteStream, struct_ver: Version = Version((0,))) -> Version:
+        return Version((1,))
+
+
+class Compressed(Spam):
+    _codec = get_codec("zlib")
+
+
+def test_fingerprint_ignores_parsing_state():
+    before = _describe(Spam)
+    Spam._from_bytes(bytes([1, 3, 1, 2, 3]), strict = True)
+    assert _describe(Spam) == before
+
+
+def test_fingerprint_includes_overrides():
+    fingerprints = {schema_fingerprint(Spam), schema_fingerprint(Versioned), schema_fingerprint(Compressed)}
+    assert len(fingerprints) == 3
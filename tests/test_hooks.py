@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import Array8, ByteStream, uint8
+
+
+def set_vals_repeat(_, instance: Hooked):
+    Hooked.vals.set_repeat(instance, instance.n)
+
+
+class Hooked(BaseStruct):
+    n: int = Retriever(uint8, default = 0)
+    # the hook of marker uses the value of n, which comes before it
+    marker: int = Retriever(uint8, default = 0, on_read = [set_vals_repeat])
+    vals: list[int] = Retriever(uint8, default = 0, repeat = 0)
+    tail: int = Retriever(uint8, default = 0)
+
+
+class File(BaseStruct):
+    items: list[Hooked] = Retriever(Array8[Hooked], default_factory = lambda _: [])
+    end: int = Retriever(uint8, default = 0)
+
+
+def hooked_bytes(n: int, tail: int) -> bytes:
+    return bytes([n, 7, *range(n), tail])
+
+
+FILE_BYTES = bytes([3]) + hooked_bytes(2, 9) + hooked_bytes(3, 8) + hooked_bytes(0, 5) + bytes([42])
+
+
+def test_skip_reads_values_used_by_hooks():
+    stream = ByteStream.from_bytes(FILE_BYTES)
+    File._skip(stream)
+    assert stream.progress == len(FILE_BYTES)
+
+
+def test_lazy_reads_values_used_by_hooks():
+    file = File._from_bytes(FILE_BYTES, strict = True, lazy = True)
+    assert [item.tail for item in file.items] == [9, 8, 5]
+    assert file.end == 42
+    assert file._to_bytes() == FILE_BYTES
+
+
+def test_read_field_reads_values_used_by_hooks():
+    assert Hooked._read_field_from_stream(ByteStream.from_bytes(hooked_bytes(2, 9)), "tail") == 9
+    assert File._read_field_from_stream(ByteStream.from_bytes(FILE_BYTES), "end") == 42
+
+
+def test_projection_reads_values_used_by_hooks():
+    item = Hooked._from_bytes(hooked_bytes(2, 9), fields = {"tail"}, strict = True)
+    assert item.tail == 9
+
+    file = File._from_bytes(FILE_BYTES, fields = {"items.tail", "end"}, strict = True)
+    assert [item.tail for item in file.items] == [9, 8, 5]
+    assert file.end == 42
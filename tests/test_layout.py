@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import uint8, uint16, uint32
+
+
+class Point(BaseStruct):
+    x: int = Retriever(uint16, default = 1)
+    y: int = Retriever(uint16, default = 2)
+
+
+class Shape(BaseStruct):
+    kind: int = Retriever(uint8, default = 0)
+    origin: Point = Retriever(Point, default_factory = Point)
+    points: list[Point] = Retriever(Point, default_factory = Point, repeat = 2)
+    tail: int = Retriever(uint32, default = 3)
+
+
+def test_single_struct_is_recorded_once():
+    bytes_ = Shape()._to_bytes()
+    layout = Shape._from_bytes(bytes_, record_layout = True)._layout()
+    paths = [entry.path for entry in layout]
+
+    assert len(paths) == len(set(paths))
+    assert paths == [
+        "", "kind", "origin", "origin.x", "origin.y",
+        "points", "points[0]", "points[0].x", "points[0].y", "points[1]", "points[1].x", "points[1].y", "tail",
+    ]
+    assert layout.find("origin")[1:3] == (1, 4)
+    assert layout.find("origin.y")[1:3] == (3, 2)
+    assert layout.find("points[1].x")[1:3] == (9, 2)
+    assert layout.at(4).path == "origin.y"
+    assert layout.find("").size == len(bytes_)
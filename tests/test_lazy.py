@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from binary_file_parser import BaseStruct, ChunkedByteStream, MemoryByteStream, Retriever
+from binary_file_parser.types import Array32, str8, uint8, uint16, uint32
+
+
+def set_vals_repeat(_, instance: Item):
+    Item.vals.set_repeat(instance, instance.n)
+
+
+class Item(BaseStruct):
+    n: int = Retriever(uint8, default = 2, on_set = [set_vals_repeat])
+    vals: list[int] = Retriever(uint16, default = 0, repeat = 2)
+    name: str = Retriever(str8, default = "item")
+
+
+class File(BaseStruct):
+    count: int = Retriever(uint32, default = 5)
+    item: Item = Retriever(Item, default_factory = Item)
+    items: list[Item] = Retriever(
+        Array32[Item], default_factory = lambda _: [Item(n = i, vals = list(range(i))) for i in range(4)]
+    )
+    tail: str = Retriever(str8, default = "end")
+
+
+BYTES = File()._to_bytes()
+
+
+@pytest.mark.parametrize("stream_cls", [None, MemoryByteStream])
+def test_values_are_decoded_on_access(stream_cls):
+    kwargs = {} if stream_cls is None else {"stream_cls": stream_cls}
+    file = File._from_bytes(BYTES, strict = True, lazy = True, **kwargs)
+    assert "_lazy_items" in vars(file) and "_items" not in vars(file)
+    # sub structs are read lazily as well, retrievers with read hooks are read immediately
+    assert "_n" in vars(file.item) and "_lazy_name" in vars(file.item)
+
+    assert file._to_bytes() == BYTES
+    assert [item.vals for item in file.items] == [[], [0], [0, 1], [0, 1, 2]]
+    assert "_items" in vars(file)
+    assert file == File()
+
+
+def test_modified_values_are_written():
+    file = File._from_bytes(BYTES, strict = True, lazy = True)
+    file.tail = "changed"
+    file.item.name = "other"
+    expected = File(tail = "changed")
+    expected.item.name = "other"
+    assert file._to_bytes() == expected._to_bytes()
+
+
+def test_unseekable_streams_are_read_in_full():
+    stream = ChunkedByteStream.from_bytes(BYTES)
+    file = File._from_stream(stream, strict = True, lazy = True)
+    assert "_items" in vars(file)
+    assert file._to_bytes() == BYTES
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from binary_file_parser import BaseStruct, MemoryByteStream, Retriever
+from binary_file_parser.types import Array16, Bytes, float32, int16, str16, uint8, uint32
+
+
+class Inner(BaseStruct):
+    a: int = Retriever(uint8, default = 1)
+    b: float = Retriever(float32, default = 0.5)
+
+
+class Record(BaseStruct):
+    n: int = Retriever(uint32, default = 7)
+    name: str = Retriever(str16, default = "hello")
+    raw: bytes = Retriever(Bytes[3], default = b"xyz")
+    vals: list[int] = Retriever(Array16[int16], default_factory = lambda _: [-1, 0, 1])
+    inner: list[Inner] = Retriever(Inner, default_factory = Inner, repeat = 2)
+
+
+@pytest.mark.parametrize("kind", [bytes, bytearray, memoryview])
+def test_round_trip(kind):
+    record = Record(name = "mem", vals = list(range(-50, 50)))
+    bytes_ = record._to_bytes()
+
+    read = Record._from_bytes(kind(bytes_), strict = True, stream_cls = MemoryByteStream)
+    assert read == record
+    assert read._to_bytes() == bytes_
+    # values never keep views of the content
+    assert type(read.raw) is bytes and type(read.name) is str
+
+
+def test_get_does_not_copy():
+    content = bytearray(b"abcdef")
+    stream = MemoryByteStream.from_bytes(content)
+    view = stream.get(3)
+    content[0] = ord("z")
+    assert bytes(view) == b"zbc"
+    assert stream.unpack(struct.Struct("<H")) == (int.from_bytes(b"de", "little"),)
+    with pytest.raises(EOFError):
+        stream.get(2)
+    assert stream.remaining_len() == 1
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from binary_file_parser import BaseStruct, ByteStream, MemoryByteStream, Retriever
+from binary_file_parser.types import uint8, uint32
+
+
+class Pair(BaseStruct):
+    a: int = Retriever(uint32, default = 1)
+    b: list[int] = Retriever(uint8, default = 2, repeat = 4)
+
+
+def write(tmp_path) -> str:
+    path = str(tmp_path / "pair.bin")
+    Pair()._to_file(path, show_progress = False)
+    return path
+
+
+def test_close_unmaps(tmp_path):
+    stream = ByteStream.from_mmap(write(tmp_path))
+    pair = Pair._from_stream(stream, strict = True)
+    stream.close()
+    assert stream.content.closed
+    assert (pair.a, pair.b) == (1, [2] * 4)
+
+
+def test_close_keeps_the_map_used_by_lazy_values(tmp_path):
+    stream = ByteStream.from_mmap(write(tmp_path))
+    pair = Pair._from_stream(stream, strict = True, lazy = True)
+    stream.close()
+    assert not stream.content.closed
+    assert (pair.a, pair.b) == (1, [2] * 4)
+
+    pair = Pair._from_file(write(tmp_path), mmap = True, lazy = True, show_progress = False)
+    assert pair.b == [2] * 4
+
+
+def test_close_keeps_the_map_used_by_reused_bytes(tmp_path):
+    path = write(tmp_path)
+    pair = Pair._from_file(path, mmap = True, reuse_bytes = True, show_progress = False)
+    pair.a = 5
+    assert pair._to_bytes() == Pair(a = 5)._to_bytes()
+    assert pair._patch_file(path)
+    assert Pair._from_file(path, show_progress = False).a == 5
+
+
+def test_close_keeps_the_map_used_by_views(tmp_path):
+    stream = MemoryByteStream.from_mmap(write(tmp_path))
+    view = stream.get(4)
+    stream.close()
+    assert bytes(view) == (1).to_bytes(4, "little")
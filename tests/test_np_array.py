@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from binary_file_parser import BaseStruct, MemoryByteStream, Retriever
+from binary_file_parser.types import (
+    Array32, bool8, float16, float32, int16, NpArray32, NpFixedLenArray, NpStackedArray16s, StackedArray16s, uint8,
+    uint16,
+)
+
+
+class Arrays(BaseStruct):
+    floats = Retriever(NpArray32[float32], default_factory = lambda _: np.arange(10, dtype = np.float32))
+    fixed = Retriever(NpFixedLenArray[int16, 3], default_factory = lambda _: [1, -2, 3])
+    flags = Retriever(NpArray32[bool8], default_factory = lambda _: [True, False])
+    rows = Retriever(NpStackedArray16s[float16], default_factory = lambda _: [[1.5], [], [2, 3]])
+    empty = Retriever(NpArray32[uint8], default_factory = lambda _: [])
+
+
+class Lists(BaseStruct):
+    ints: list[int] = Retriever(Array32[uint16], default_factory = lambda _: list(range(100)))
+    rows: list[list[int]] = Retriever(StackedArray16s[uint16], default_factory = lambda _: [[1, 2], [], [3]])
+
+
+class NpLists(BaseStruct):
+    ints = Retriever(NpArray32[uint16], default_factory = lambda _: list(range(100)))
+    rows = Retriever(NpStackedArray16s[uint16], default_factory = lambda _: [[1, 2], [], [3]])
+
+
+def test_round_trip():
+    arrays = Arrays()
+    bytes_ = arrays._to_bytes()
+
+    read = Arrays._from_bytes(bytes_, strict = True)
+    assert read == arrays
+    assert read._to_bytes() == bytes_
+    assert read.floats.dtype == np.float32 and read.flags.dtype == bool and read.fixed.dtype == np.int16
+    assert read.floats.flags.writeable
+
+    read.floats[0] = 5
+    assert read != arrays
+
+    lazy = Arrays._from_bytes(bytes_, strict = True, lazy = True, stream_cls = MemoryByteStream)
+    writer = io.BytesIO()
+    lazy._to_stream(writer)
+    assert writer.getvalue() == bytes_ and lazy == arrays
+
+
+def test_same_layout_as_lists():
+    bytes_ = Lists()._to_bytes()
+    assert NpLists()._to_bytes() == bytes_
+    read = NpLists._from_bytes(bytes_, strict = True)
+    assert read.ints.tolist() == list(range(100))
+    assert [row.tolist() for row in read.rows] == [[1, 2], [], [3]]
+
+
+def test_only_primitives():
+    with pytest.raises(TypeError):
+        NpArray32[Array32[float32]]
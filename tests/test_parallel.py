@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import Array32, FixedLenArray, parallel, uint8, uint16
+
+
+class Pixel(BaseStruct):
+    _parallel_threshold = 0
+    _parallel_workers = 2
+
+    red: int = Retriever(uint8, default = 0)
+    green: int = Retriever(uint16, default = 0)
+
+
+class Image(BaseStruct):
+    pixels: list[Pixel] = Retriever(Array32[Pixel], default_factory = lambda _: [])
+    end: int = Retriever(uint8, default = 7)
+
+
+def test_parallel_read_empty_array():
+    image = Image._from_bytes(Image()._to_bytes(), strict = True)
+    assert image.pixels == [] and image.end == 7
+
+
+def test_parallel_read():
+    image = Image(pixels = [Pixel(red = i % 256, green = i) for i in range(100)])
+    assert Image._from_bytes(image._to_bytes(), strict = True) == image
+
+
+class Tile(BaseStruct):
+    _parallel_threshold = 0
+    _parallel_workers = 2
+
+    pixels: list[Pixel] = Retriever(FixedLenArray[Pixel, 3], default_factory = lambda _: [Pixel() for _ in range(3)])
+
+
+class Map(BaseStruct):
+    tiles: list[Tile] = Retriever(Array32[Tile], default_factory = lambda _: [])
+
+
+def test_parallel_reads_share_a_pool_and_do_not_nest():
+    value = Map(tiles = [Tile(pixels = [Pixel(red = i % 256, green = j) for j in range(3)]) for i in range(50)])
+    bytes_ = value._to_bytes()
+    assert Map._from_bytes(bytes_, strict = True) == value
+    executors = dict(parallel._executors)
+    assert Map._from_bytes(bytes_, strict = True) == value
+    assert parallel._executors == executors
+    assert not parallel.in_worker()
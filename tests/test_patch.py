@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import uint8, uint32
+
+
+class Inner(BaseStruct):
+    a: int = Retriever(uint32, default = 1)
+    b: int = Retriever(uint8, default = 2)
+
+
+class Outer(BaseStruct):
+    x: int = Retriever(uint8, default = 0)
+    inner: Inner = Retriever(Inner, default_factory = Inner)
+    c: int = Retriever(uint32, default = 3)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_repeated_patches(tmp_path, mmap: bool):
+    path = str(tmp_path / "outer.bin")
+    Outer()._to_file(path, show_progress = False)
+    outer = Outer._from_file(path, reuse_bytes = True, mmap = mmap, show_progress = False)
+
+    outer.c = 5
+    assert outer._patch_file(path)
+    # setting a value back to what the file was originally read with must still be written
+    outer.c = 3
+    assert outer._patch_file(path)
+    outer.inner.a = 7
+    assert outer._patch_file(path)
+    outer.inner.a = 1
+    outer.x = 4
+    assert outer._patch_file(path)
+
+    read = Outer._from_file(path, show_progress = False)
+    assert (read.x, read.inner.a, read.c) == (4, 1, 3)
+    with open(path, "rb") as file:
+        assert file.read() == outer._to_bytes()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import struct
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import Array8, ByteStream, float32, int16, uint8, uint32, Version
+from binary_file_parser.types.le.int import Int
+
+
+class Primitives(BaseStruct):
+    a: int = Retriever(uint8, default = 1)
+    b: int = Retriever(int16, default = -2)
+    c: float = Retriever(float32, default = 0.5)
+    d: list[int] = Retriever(uint32, default = 4, repeat = 3)
+    e: list[int] = Retriever(Array8[int16], default_factory = lambda _: [-1, 0, 1])
+
+
+def test_round_trip():
+    value = Primitives()
+    bytes_ = value._to_bytes()
+    assert bytes_ == struct.pack("<Bhf3IB3h", 1, -2, 0.5, 4, 4, 4, 3, -1, 0, 1)
+    assert Primitives._from_bytes(bytes_, strict = True) == value
+
+
+class Doubled(Int):
+    """Stores values doubled"""
+
+    def _from_bytes(self, bytes_: bytes, *, struct_ver: Version = Version((0,))) -> int:
+        return super()._from_bytes(bytes_, struct_ver = struct_ver) // 2
+
+    def _to_bytes(self, value: int) -> bytes:
+        return super()._to_bytes(value * 2)
+
+
+doubled8 = Doubled(1, "<B")
+
+
+class WithOverrides(BaseStruct):
+    a: int = Retriever(uint8, default = 1)
+    b: int = Retriever(doubled8, default = 3)
+    c: int = Retriever(uint8, default = 5)
+    d: list[int] = Retriever(Array8[doubled8], default_factory = lambda _: [1, 2])
+
+
+def test_overridden_conversions_are_used():
+    value = WithOverrides()
+    bytes_ = value._to_bytes()
+    assert bytes_ == bytes([1, 6, 5, 2, 2, 4])
+    assert WithOverrides._from_bytes(bytes_, strict = True) == value
+    assert doubled8._from_stream(ByteStream.from_bytes(b"\x08")) == 4
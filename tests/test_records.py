@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from binary_file_parser import BaseStruct, ByteStream, ChunkedByteStream, MemoryByteStream, ProjectionError, Retriever
+from binary_file_parser.types import str8, uint8, uint32
+
+
+class Point(BaseStruct):
+    x: int = Retriever(uint8, default = 0)
+    y: int = Retriever(uint8, default = 0)
+
+
+class Record(BaseStruct):
+    seq: int = Retriever(uint32, default = 0)
+    msg: str = Retriever(str8, default = "")
+    at: Point = Retriever(Point, default_factory = Point)
+
+
+def records(n: int):
+    for i in range(n):
+        yield Record(seq = i, msg = "m" * (i % 5), at = Point(x = i % 256))
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    path = str(tmp_path / "log.bin")
+    assert Record._write_many(records(20), path) == 20
+    return path
+
+
+@pytest.mark.parametrize("stream_cls, mmap", [
+    (ChunkedByteStream, False), (ByteStream, False), (ByteStream, True), (MemoryByteStream, True),
+])
+def test_iter_from_file(path: str, stream_cls, mmap: bool):
+    read = list(Record._iter_from_file(path, stream_cls = stream_cls, mmap = mmap))
+    assert read == list(records(20))
+
+
+def test_iter_from_stream():
+    writer = io.BytesIO()
+    for record in records(5):
+        record._to_stream(writer)
+    stream = ChunkedByteStream(io.BytesIO(writer.getvalue()).read, chunk_size = 3)
+    assert [record.seq for record in Record._iter_from_stream(stream)] == list(range(5))
+
+
+def test_projection(path: str):
+    read = list(Record._iter_from_file(path, fields = {"seq", "at.x"}))
+    assert [record.seq for record in read] == list(range(20))
+    assert read[3].at.x == 3
+    with pytest.raises(ProjectionError):
+        read[3].msg
+
+
+def test_truncated_and_empty_files(path: str):
+    with open(path, "ab") as file:
+        file.write(b"\x01\x00")
+    with pytest.raises(EOFError):
+        list(Record._iter_from_file(path))
+
+    open(path, "wb").close()
+    assert list(Record._iter_from_file(path)) == []
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+
+from binary_file_parser import BaseStruct, MemoryByteStream, Retriever
+from binary_file_parser.types import Array8, bool8, str8, uint8, uint16
+
+
+class Inner(BaseStruct):
+    flag: bool = Retriever(bool8, default = True)
+    label: str = Retriever(str8, default = "")
+    x: int = Retriever(uint16, default = 1)
+
+
+class Outer(BaseStruct):
+    flag: bool = Retriever(bool8, default = True)
+    name: str = Retriever(str8, default = "name")
+    values: list[int] = Retriever(Array8[uint8], default_factory = lambda _: [1, 2, 3])
+    inner: Inner = Retriever(Inner, default_factory = Inner)
+    tail: bool = Retriever(bool8, default = False)
+
+
+# bools are read from any non-zero byte, but written as 1. Bytes that are reused are copied as they were read
+BYTES = bytes([2, 4]) + b"name" + bytes([3, 1, 2, 3, 7, 0, 1, 0, 0])
+
+
+def read(**kwargs) -> Outer:
+    return Outer._from_bytes(BYTES, strict = True, reuse_bytes = True, **kwargs)
+
+
+@pytest.mark.parametrize("stream_cls", [None, MemoryByteStream])
+def test_unmodified_bytes_are_reused(stream_cls):
+    kwargs = {} if stream_cls is None else {"stream_cls": stream_cls}
+    outer = read(**kwargs)
+    assert outer._to_bytes() == BYTES
+    assert Outer._from_bytes(BYTES, strict = True)._to_bytes() != BYTES
+    # immutable values can be read without being marked as modified
+    assert outer.flag and outer.name == "name"
+    assert outer._to_bytes() == BYTES
+
+
+def test_assigned_values_are_written():
+    outer = read()
+    outer.name = "other"
+    outer.tail = True
+    expected = bytes([2, 5]) + b"other" + bytes([3, 1, 2, 3, 7, 0, 1, 0, 1])
+    assert outer._to_bytes() == expected
+
+
+def test_lists_and_sub_structs_are_assumed_modified_once_accessed():
+    outer = read()
+    outer.values.append(4)
+    assert outer._to_bytes() == bytes([2, 4]) + b"name" + bytes([4, 1, 2, 3, 4, 7, 0, 1, 0, 0])
+
+    outer = read()
+    outer.inner.x = 2
+    # the sub struct keeps the bytes of its own unmodified retriever properties
+    assert outer._to_bytes() == bytes([2, 4]) + b"name" + bytes([3, 1, 2, 3, 7, 0, 2, 0, 0])
+
+
+def test_sources_are_only_kept_when_asked_for():
+    assert Outer._from_bytes(BYTES)._source is None
+    assert read()._dirty == set()
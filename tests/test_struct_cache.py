@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from binary_file_parser import BaseStruct, CowHandle, Retriever, StructCache
+from binary_file_parser.types import uint8, uint32
+
+
+class Inner(BaseStruct):
+    a: int = Retriever(uint32, default = 1)
+
+
+class Outer(BaseStruct):
+    x: int = Retriever(uint8, default = 0)
+    inner: Inner = Retriever(Inner, default_factory = Inner)
+
+
+def test_lookups_return_handles(tmp_path):
+    path = str(tmp_path / "outer.bin")
+    Outer(x = 4)._to_file(path, show_progress = False)
+    cache = StructCache()
+
+    first = cache.from_file(Outer, path)
+    second = cache.from_file(Outer, path)
+    assert isinstance(first, CowHandle) and isinstance(second, CowHandle)
+    assert first.value is second.value and first.value.x == 4
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    mutable = first.mutable()
+    assert first.copied and mutable is not second.value and first.mutable() is mutable
+    mutable.inner.a = 9
+    assert second.value.inner.a == 1
+    assert cache.from_file(Outer, path).value.inner.a == 1
+
+    by_bytes = cache.from_bytes(Outer, Outer(x = 4)._to_bytes())
+    assert isinstance(by_bytes, CowHandle) and by_bytes.value.x == 4
+
+
+def test_eviction():
+    cache = StructCache(max_memory = 1)
+    cache.from_bytes(Outer, Outer()._to_bytes())
+    assert len(cache) == 0 and cache.memory == 0
+
+
+def test_shared_is_a_singleton():
+    StructCache._shared = None
+    with ThreadPoolExecutor(8) as executor:
+        caches = list(executor.map(lambda _: StructCache.shared(), range(64)))
+    assert all(cache is caches[0] for cache in caches)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from binary_file_parser import BaseStruct, ByteStream, Retriever
+from binary_file_parser.types import Array8, StackedArray8s, str8, uint8
+
+# the dtypes are shared by every struct object, so reads and writes of different lengths must not interfere
+values = Array8[uint8]
+rows = StackedArray8s[uint8]
+
+
+class Message(BaseStruct):
+    name: str = Retriever(str8, default = "")
+    values: list[int] = Retriever(values, default_factory = lambda _: [])
+    rows: list[list[int]] = Retriever(rows, default_factory = lambda _: [])
+
+
+MESSAGES = [
+    Message(name = "m" * n, values = list(range(n)), rows = [list(range(i)) for i in range(n % 7)]) for n in range(40)
+]
+BYTES = [message._to_bytes() for message in MESSAGES]
+
+
+@pytest.fixture(autouse = True)
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def work(offset: int) -> int:
+    errors = 0
+    for i in range(400):
+        idx = (i + offset) % len(MESSAGES)
+        message = MESSAGES[idx]
+        errors += values._from_stream(ByteStream.from_bytes(values._to_bytes(message.values))) != message.values
+        errors += Message._from_bytes(BYTES[idx], strict = True) != message
+        errors += message._to_bytes() != BYTES[idx]
+    return errors
+
+
+def test_concurrent_reads_and_writes():
+    with ThreadPoolExecutor(8) as executor:
+        assert sum(executor.map(work, range(0, 80, 10))) == 0
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import io
+import zlib
+
+import pytest
+
+from binary_file_parser import BaseStruct, Retriever
+from binary_file_parser.types import (
+    Array16, bool8, c_str, float32, FixedLenArray, Option8, StackedArray16s, StackedAttrArray8, str16, StrArray8, uint8,
+    uint16, uint32,
+)
+
+
+class Entry(BaseStruct):
+    a: int = Retriever(uint8, default = 1)
+    name: str = Retriever(str16, default = "entry")
+
+
+class Document(BaseStruct):
+    @classmethod
+    def _compress(cls, bytes_: bytes) -> bytes:
+        return zlib.compress(bytes_)
+
+    @classmethod
+    def _decompress(cls, bytes_: bytes) -> bytes:
+        return zlib.decompress(bytes_)
+
+    ints: list[int] = Retriever(Array16[uint32], default_factory = lambda _: list(range(100)))
+    floats: list[float] = Retriever(FixedLenArray[float32, 3], default_factory = lambda _: [0.5, 1.5, 2.5])
+    flags: list[bool] = Retriever(bool8, default = True, repeat = 3)
+    stacked: list[list[int]] = Retriever(StackedArray16s[uint16], default_factory = lambda _: [[1, 2], [], [3]])
+    strs: list[str] = Retriever(StrArray8, default_factory = lambda _: ["a", "bc", ""])
+    cstr: str = Retriever(c_str, default = "cee")
+    opt: int = Retriever(Option8[uint16], default = 4)
+    entries: list[Entry] = Retriever(StackedAttrArray8[Entry], default_factory = lambda _: [Entry(), Entry(a = 2)])
+    body: list[Entry] = Retriever(
+        Array16[Entry], default_factory = lambda _: [Entry(a = i % 256) for i in range(50)], remaining_compressed = True
+    )
+
+
+class StreamedDocument(Document):
+    @classmethod
+    def _compressor(cls):
+        return zlib.compressobj()
+
+
+StreamedDocument._retrievers = Document._retrievers
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_to_stream_matches_to_bytes(lazy: bool):
+    document = Document(cstr = "streamed")
+    bytes_ = document._to_bytes()
+    if lazy:
+        document = Document._from_bytes(bytes_, strict = True, lazy = True)
+
+    writer = io.BytesIO()
+    document._to_stream(writer)
+    assert writer.getvalue() == bytes_
+
+
+@pytest.mark.parametrize("cls", [Document, StreamedDocument])
+def test_file_round_trip(tmp_path, cls):
+    path = str(tmp_path / "document.bin")
+    document = cls(ints = [7] * 10)
+
+    document._to_file(path, show_progress = False)
+    with open(path, "rb") as file:
+        assert file.read() == document._to_bytes()
+    assert cls._from_file(path, show_progress = False) == document
+
+    document._to_compressed_file(path, show_progress = False)
+    assert cls._from_compressed_file(path, show_progress = False) == document